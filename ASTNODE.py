@@ -3,6 +3,23 @@
 #  Course:  CSC386 Fall 2021
 # Purpose:  AST Node Class
 # History:
+#           2026-10-18, static frames (Emitter.static_frames): a top-level statement moves $sp once for the deepest
+#                       its values go on the stack, and pushes and pops store and load at fixed offsets from $sp
+#           2026-10-18, .data holds the variables the tree mentions (variables()) instead of the symbol table;
+#                       the value of an expression statement is popped instead of left on the stack
+#           2026-10-18, a for loop saves the counter and bound of an enclosing for loop; a loop variable the body
+#                       does not assign is read from the counter and only stored when the loop ends
+#           2026-10-18, variables chosen by VariablePromoter (Emitter.promoted) live in $s registers, not .data
+#           2026-10-18, comparisons that decide an if, ifelse or while compile to a single conditional branch
+#           2026-10-18, % is emitted (rem); with Emitter.strength_reduce, * / % by a constant use StrengthReduction
+#           2026-10-18, ** uses square-and-multiply, or a straight-line chain for a constant exponent; x ** 0 = 1
+#           2026-10-18, emit_ast walks the tree with an explicit work stack; expand() gives the code of one node
+#           2026-10-18, compact nodes: __slots__ instead of anytree's NodeMixin, children kept as a tuple, and no
+#                       dict per node without data (the shared data={} default is gone); render_tree() draws the
+#                       tree itself
+#           2026-10-18, code is emitted through Emitter instead of print(); allocate_registers moved to Emitter
+#           2026-10-18, register allocation mode: expressions are evaluated by RegisterAllocator when
+#                       allocate_registers is set, and statements take their operands through emit_value()
 #           2024-02-12, DMW, modified for CSC486 Compiler Design & Implementation
 #           2023-04-30, DMW, conditionally import curses if not on Windows
 #           2023-04-24, DMW, added __str__ method() for pretty printing nodes; imports curses.ascii and Common
@@ -13,28 +30,63 @@
 #
 #           Copyright (2023) Deanna M. Wilborne
 
-from anytree import NodeMixin, RenderTree
 from Common import Common
+from Emitter import Emitter
+from RegisterAllocator import RegisterAllocator
+from StrengthReduction import StrengthReduction
 from sys import platform
+from types import MappingProxyType
 
 if platform != "win32":
     import curses.ascii as ca
 
 
 # noinspection SpellCheckingInspection
-class ASTNODE(NodeMixin):
-    def __init__(self, name: str, value=None, parent=None, children=None, line=None, data={}) -> None:
+class ASTNODE:
+    # a node is a fixed set of slots instead of an instance dict; children is a tuple, and nodes without data
+    # share one read-only empty mapping instead of a dict each
+    __slots__ = ("name", "value", "parent", "_children", "line", "data")
+
+    no_data = MappingProxyType({})
+    # where the stack code keeps the operand, result and scratch registers of a StrengthReduction plan
+    reduction_registers = {"x": "$t1", "r": "$t2", "t1": "$t0", "t2": "$t3"}
+    # shared data of the most common kinds of expression node
+    int_data = MappingProxyType({"type": "int"})
+    string_data = MappingProxyType({"type": "string"})
+
+    def __init__(self, name: str, value=None, parent=None, children=None, line=None, data=None) -> None:
         self.name = name
-        self.parent = parent
+        self.parent = None
         self.value = value
         # 2023-04-16, DWM, line and index is based on:
         # https://my.eng.utah.edu/~cs3100/lectures/l14/ply-3.4/doc/ply.html#ply_nn33
         self.line = line
-        self.data = data
-
+        self.data = data if data is not None else ASTNODE.no_data
+        self._children = ()
 
         if children is not None:
             self.children = children
+        if parent is not None:
+            parent.children = parent._children + (self,)
+
+    @property
+    def children(self) -> tuple:
+        return self._children
+
+    @children.setter
+    def children(self, children) -> None:
+        for child in self._children:
+            child.parent = None
+        self._children = tuple(children)
+        for child in self._children:
+            child.parent = self
+
+    # read-only data mappings cannot be pickled, so a node is pickled with a plain copy of its data
+    def __getstate__(self) -> tuple:
+        return self.name, self.value, self.parent, self._children, self.line, dict(self.data)
+
+    def __setstate__(self, state: tuple) -> None:
+        self.name, self.value, self.parent, self._children, self.line, self.data = state
 
     # 2023-04-24, DMW, substitute control characters in value attibutes of type string
     def safe_value(self) -> str:
@@ -74,279 +126,489 @@ class ASTNODE(NodeMixin):
     # 2024-02-12, DMW, added class static method
     @staticmethod
     def render_tree(tree) -> None:
-        for pre, fill, node in RenderTree(tree):
+        for pre, node in ASTNODE.tree_lines(tree):
             print("%s%s" % (pre, node.name))
 
+    # (prefix, node) for every node in depth first order, with the branch drawing anytree's RenderTree used
+    @staticmethod
+    def tree_lines(tree):
+        work = [(tree, "", "")]
+        while work:
+            node, pre, fill = work.pop()
+            yield pre, node
+            last = len(node.children) - 1
+            for index in range(last, -1, -1):
+                if index == last:
+                    work.append((node.children[index], fill + "\u2514\u2500\u2500 ", fill + "    "))
+                else:
+                    work.append((node.children[index], fill + "\u251c\u2500\u2500 ", fill + "\u2502   "))
+
+    # the work items that push register onto the stack: with Emitter.static_frames a store into the next word of
+    # the statement's frame (see open_frame), otherwise $sp moves down a word first
+    @staticmethod
+    def push(emitter: Emitter, register: str, comment: str = "") -> list:
+        if emitter.static_frames:
+            return [(ASTNODE.frame_push, emitter, register, comment)]
+        return ["addi $sp, $sp, -4",
+                f"sw {register}, 4($sp)" + (f" # {comment}" if comment else "")]
+
+    # the work items that pop the value on top of the stack into register; with static frames the load leaves $sp
+    # where it is, so frame_comment, when given, replaces a comment that speaks of popping
+    @staticmethod
+    def pop(emitter: Emitter, register: str, comment: str = "", frame_comment: str = None) -> list:
+        if emitter.static_frames:
+            return [(ASTNODE.frame_pop, emitter, register, comment if frame_comment is None else frame_comment)]
+        return [f"lw {register}, 4($sp)" + (f" # {comment}" if comment else ""),
+                "addi $sp, $sp, 4"]
+
+    # the work items that evaluate an expression and leave its value in register: in register mode a call of
+    # RegisterAllocator, otherwise the node followed by a pop into register
+    @staticmethod
+    def value_items(_node, register: str, emitter: Emitter) -> list:
+        if emitter.allocate_registers:
+            return [(RegisterAllocator.emit_expression, _node, register)]
+        return [_node,
+                *ASTNODE.pop(emitter, register, f"pop an integer off the stack and load it into {register[1:]}",
+                             f"load the integer in the top slot of the frame into {register[1:]}")]
+
+    # the work items that branch to label when the comparison condition is (when=True) or is not true, without
+    # computing its 0 or 1 value first; None when condition is not a comparison
+    @staticmethod
+    def branch_items(condition, when: bool, label: str, emitter: Emitter):
+        if condition.name != "comparison":
+            return None
+        operator = condition.value if when else RegisterAllocator.opposites[condition.value]
+        if emitter.allocate_registers:
+            return [(RegisterAllocator.emit_branch, condition, operator, label)]
+        branch = RegisterAllocator.branches[operator]
+        left, right = condition.children
+        if right.name == "number" and isinstance(right.value, int):
+            return [left,
+                    *ASTNODE.pop(emitter, "$t1"),
+                    f"{branch} $t1, {right.value if right.value else '$zero'}, {label}"]
+        return [left,
+                right,
+                *ASTNODE.pop(emitter, "$t0"),
+                *ASTNODE.pop(emitter, "$t1"),
+                f"{branch} $t1, $t0, {label}"]
+
+    # generate the code for the tree rooted at _node.  The tree is walked with an explicit work stack instead
+    # of recursion, so neither long statement lists nor deep nesting run into Python's recursion limit: each
+    # node expands into a list of work items in the order they are emitted, where a string is a line of
+    # assembly, a node is expanded in turn, and a (function, arguments...) tuple is a call into RegisterAllocator
     @staticmethod
     def emit_ast(_node):
-        if _node.name == "program":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-        elif _node.name == "statement_list":
-            for child in _node.children:
-                ASTNODE.emit_ast(child) 
-        elif _node.name == "statement":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-        elif _node.name == "statement_block":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-        elif _node.name == "while":
-            data = _node.data
-            branch_index = data["branch_index"]
-            print(f"loop_{branch_index}: # initialize loop branch")
-            ASTNODE.emit_ast(_node.children[0])
-            print("lw $t4, 4($sp) # pop an integer off the stack and load it into t4")
-            print("addi $sp, $sp, 4")
-            print(f"beq $t4, 0, continue_{branch_index} # if t4 == 0 move to the continue_{branch_index} branch")
-            ASTNODE.emit_ast(_node.children[1])
-            print(f"j loop_{branch_index} # jump to the loop_{branch_index} branch")
-            print(f"continue_{branch_index}: # define a branch for the following code to continue")
-        elif _node.name == "for":
-            ASTNODE.emit_ast(_node.children[0])
+        emitter = Emitter.current()
+        emit = Emitter.emit
+        work = [_node]
+        while work:
+            item = work.pop()
+            if item.__class__ is str:
+                emit(item)
+            elif item.__class__ is tuple:
+                item[0](*item[1:])
+            else:
+                items = ASTNODE.expand(item, emitter)
+                if items:
+                    items.reverse()
+                    work.extend(items)
+
+    # the work items of one node (see emit_ast)
+    @staticmethod
+    def expand(_node, emitter: Emitter) -> list:
+        allocate_registers = emitter.allocate_registers
+        name = _node.name
+        # with static frames, the first node below the program's statement lists is a top-level statement, and
+        # its code gets a frame of its own
+        if emitter.static_frames and emitter.frame_depth is None and name not in ("program", "statement_list"):
+            return [(ASTNODE.open_frame, emitter), _node, (ASTNODE.close_frame, emitter)]
+        if allocate_registers and name in RegisterAllocator.expressions:
+            # an expression outside of a statement that consumes it still leaves its value on the stack
+            return [(RegisterAllocator.emit_expression, _node, "$t0"),
+                    *ASTNODE.push(emitter, "$t0", "store t0 on the stack")]
+        elif name == "statement" and _node.children and _node.children[0].name in RegisterAllocator.expressions:
+            # the value of an expression statement is not used, so it is popped again instead of left on the stack
+            return ASTNODE.value_items(_node.children[0], "$t0", emitter)
+        elif name in ("program", "statement_list", "statement", "statement_block", "range", "expression",
+                      "print_list"):
+            return list(_node.children)
+        elif name == "while":
+            branch_index = _node.data["branch_index"]
+            branch = ASTNODE.branch_items(_node.children[0], False, f"continue_{branch_index}", emitter)
+            if branch is not None:
+                return [f"loop_{branch_index}: # initialize loop branch",
+                        *branch,
+                        _node.children[1],
+                        f"j loop_{branch_index} # jump to the loop_{branch_index} branch",
+                        f"continue_{branch_index}: # define a branch for the following code to continue"]
+            return [f"loop_{branch_index}: # initialize loop branch",
+                    *ASTNODE.value_items(_node.children[0], "$t4", emitter),
+                    f"beq $t4, 0, continue_{branch_index} # if t4 == 0 move to the continue_{branch_index} branch",
+                    _node.children[1],
+                    f"j loop_{branch_index} # jump to the loop_{branch_index} branch",
+                    f"continue_{branch_index}: # define a branch for the following code to continue"]
+        elif name == "for":
+            start, end = _node.children[0].children
+            body = _node.children[1]
             data = _node.data
             branch_index = data["branch_index"]
             var_name = data["var_name"]
-            print("lw $t7, 4($sp) # pop the integer off the stack and load into t2")
-            print("addi $sp, $sp, 4")
-            print("lw $t6, 4($sp) # pop the integer off the stack and store it into t1")
-            print("addi $sp, $sp, 4")
-            print(f"sw $t6, {var_name} # store the value of {var_name} in t1")
-            print(f"loop_{branch_index}: # create a loop branch")
-            ASTNODE.emit_ast(_node.children[1])
-            print("   addi $t6, $t6, 1")
-            print(f"   sw $t6, {var_name} # store the value of {var_name} in t1")
-            print(f"   bge $t7, $t6, loop_{branch_index} # if t2 is greater than or equal to t1 branch to loop_{branch_index}")
-
-        elif _node.name == "conditional":
-            pass
-        elif _node.name == "for_assign":
-            pass
-        elif _node.name == "assign":
-            data = _node.data
-            var_name = data["var_name"]
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            print("lw $t0, 4($sp) # pop an integer off the stack and store in t0")
-            print("addi $sp, $sp, 4")
-            print(f"sw $t0, {var_name} # store t0 in {var_name}")
-        elif _node.name == "range":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-        elif _node.name == "input":
-            print("li $v0, 5 # load the integer 5 into v0 to accept a user integer input")
-            print("syscall")
-            print("move $t0, $v0 # move the value of v0 into t0")
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp) # store t0 on the stack")
-        elif _node.name == "print":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            print("lw $a0, 4($sp) # pop a value off the stack and store it on a0")
-            print("addi $sp, $sp, 4")
-            print("li $v0, 1 # load 1 into v0 for an integer print syscall")
-            print("syscall")
-            print("li $a0, 10")
-            print("li $v0, 11 # print a newline")
-            print("syscall")
-            print("li $a0, 0")
-        elif _node.name == "expression":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-        elif _node.name == "binop":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            print("lw $t0, 4($sp)")
-            print("addi $sp, $sp, 4")
-            print("lw $t1, 4($sp)")
-            print("addi $sp, $sp, 4")
+            depth = emitter.loop_depth
+            items = []
+            if depth:
+                # the counter and bound of the enclosing loop wait on the stack; a loop variable that lives in
+                # $t6 is written to memory first if this loop reads it
+                items += [f"sw {register}, {outer} # store the value of {outer} in memory"
+                          for outer, register in emitter.induction.items() if ASTNODE.reads(_node, outer)]
+                if emitter.static_frames:
+                    items += [*ASTNODE.push(emitter, "$t6", "save the counter of the enclosing loop"),
+                              *ASTNODE.push(emitter, "$t7", "save the bound of the enclosing loop")]
+                else:
+                    items += ["addi $sp, $sp, -8",
+                              "sw $t6, 8($sp) # save the counter of the enclosing loop",
+                              "sw $t7, 4($sp) # save the bound of the enclosing loop"]
+            items += [(ASTNODE.enter_loop, emitter, {}, depth),
+                      *ASTNODE.value_items(start, "$t6", emitter),
+                      *ASTNODE.value_items(end, "$t7", emitter)]
+            if var_name in emitter.promoted:
+                # the loop still counts in $t6, so an assignment in the body does not change the iteration
+                register = emitter.promoted[var_name]
+                items += [f"move {register}, $t6 # {var_name} lives in {register}",
+                          (ASTNODE.enter_loop, emitter, {}, depth + 1),
+                          f"loop_{branch_index}: # create a loop branch",
+                          body,
+                          "   addi $t6, $t6, 1",
+                          f"   move {register}, $t6",
+                          f"   bge $t7, $t6, loop_{branch_index} # if t2 is greater than or equal to t1 branch to loop_{branch_index}",
+                          (ASTNODE.enter_loop, emitter, emitter.induction, depth)]
+            elif ASTNODE.assigns(body, var_name):
+                items += [f"sw $t6, {var_name} # store the value of {var_name} in t1",
+                          (ASTNODE.enter_loop, emitter, {}, depth + 1),
+                          f"loop_{branch_index}: # create a loop branch",
+                          body,
+                          "   addi $t6, $t6, 1",
+                          f"   sw $t6, {var_name} # store the value of {var_name} in t1",
+                          f"   bge $t7, $t6, loop_{branch_index} # if t2 is greater than or equal to t1 branch to loop_{branch_index}",
+                          (ASTNODE.enter_loop, emitter, emitter.induction, depth)]
+            else:
+                # the body reads the variable straight from the counter, so memory is only written once the
+                # loop is done
+                items += [(ASTNODE.enter_loop, emitter, {var_name: "$t6"}, depth + 1),
+                          f"loop_{branch_index}: # create a loop branch",
+                          body,
+                          "   addi $t6, $t6, 1",
+                          f"   bge $t7, $t6, loop_{branch_index} # if t2 is greater than or equal to t1 branch to loop_{branch_index}",
+                          (ASTNODE.enter_loop, emitter, emitter.induction, depth),
+                          f"sw $t6, {var_name} # store the value of {var_name} in t1"]
+            if depth and emitter.static_frames:
+                items += [*ASTNODE.pop(emitter, "$t7", "restore the bound of the enclosing loop"),
+                          *ASTNODE.pop(emitter, "$t6", "restore the counter of the enclosing loop")]
+            elif depth:
+                items += ["lw $t7, 4($sp) # restore the bound of the enclosing loop",
+                          "lw $t6, 8($sp) # restore the counter of the enclosing loop",
+                          "addi $sp, $sp, 8"]
+            return items
+        elif name == "assign":
+            var_name = _node.data["var_name"]
+            if var_name in emitter.promoted:
+                register = emitter.promoted[var_name]
+                if not allocate_registers or not ASTNODE.reads(_node.children[0], var_name):
+                    # evaluate straight into the variable's register
+                    return ASTNODE.value_items(_node.children[0], register, emitter)
+                # the register allocator could overwrite the variable before the expression has read it
+                return [*ASTNODE.value_items(_node.children[0], "$t0", emitter),
+                        f"move {register}, $t0 # store t0 in {var_name}"]
+            return [*ASTNODE.value_items(_node.children[0], "$t0", emitter),
+                    f"sw $t0, {var_name} # store t0 in {var_name}"]
+        elif name == "input":
+            return ["li $v0, 5 # load the integer 5 into v0 to accept a user integer input",
+                    "syscall",
+                    "move $t0, $v0 # move the value of v0 into t0",
+                    *ASTNODE.push(emitter, "$t0", "store t0 on the stack")]
+        elif name == "print":
+            return [*ASTNODE.value_items(_node.children[0], "$a0", emitter),
+                    "li $v0, 1 # load 1 into v0 for an integer print syscall",
+                    "syscall",
+                    "li $a0, 10",
+                    "li $v0, 11 # print a newline",
+                    "syscall",
+                    "li $a0, 0"]
+        elif name == "binop":
+            reduction = StrengthReduction.reduce(_node) if emitter.strength_reduce else None
+            if reduction is not None:
+                operand, plan = reduction
+                return [operand,
+                        *ASTNODE.pop(emitter, "$t1"),
+                        *StrengthReduction.lines(plan, ASTNODE.reduction_registers),
+                        *ASTNODE.push(emitter, "$t2"),
+                        "li $t2, 0"]
+            items = [*_node.children,
+                     *ASTNODE.pop(emitter, "$t0"),
+                     *ASTNODE.pop(emitter, "$t1")]
             if _node.value == "+":
-                print("add $t2, $t1, $t0")
+                items.append("add $t2, $t1, $t0")
             elif _node.value == "-":
-                print("sub $t2, $t1, $t0")
+                items.append("sub $t2, $t1, $t0")
             elif _node.value == "*":
-                print("mult $t1, $t0")
-                print("mflo $t2")
+                items.append("mult $t1, $t0")
+                items.append("mflo $t2")
             elif _node.value == "/":
-                print("div $t2, $t1, $t0")
-            print("addi $sp, $sp, -4")
-            print("sw $t2, 4($sp)")
-            print("li $t2, 0")
-        elif _node.name == "if":
-            data = _node.data
-            branch_index = data["branch_index"]
-            ASTNODE.emit_ast(_node.children[0])
-            
-            print("lw $t0, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print(f"beq $t0, 1, true_{branch_index}")
-            print(f"false_{branch_index}:")
-            print(f"     j continue_{branch_index}")
-            print(f"true_{branch_index}:")
-            
-            ASTNODE.emit_ast(_node.children[1])
-            print(f"continue_{branch_index}:")
-            print("addi $sp, $sp, -4")
-            print("sw $t2, 4($sp)")
-            print("li $t2, 0")
-        elif _node.name == "ifelse":
-            data = _node.data
-            branch_index = data["branch_index"]
-            ASTNODE.emit_ast(_node.children[0])
-            
-            print("lw $t0, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print(f"beq $t0, 1, true_{branch_index}")
-            print(f"false_{branch_index}:")
-            ASTNODE.emit_ast(_node.children[2])
-            print(f"     j continue_{branch_index}")
-            print(f"true_{branch_index}:")
-            
-            ASTNODE.emit_ast(_node.children[1])
-            print(f"continue_{branch_index}:")
-            print("addi $sp, $sp, -4")
-            print("sw $t2, 4($sp)")
-            print("li $t2, 0")
-        elif _node.name == "abs":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            data = _node.data
-            branch_index = data["branch_index"]
-            print(f"bge $t0, $zero, continue_{branch_index}")
-            print(f"negate_{branch_index}:")
-            print("li $t1, -1")
-            print("mult $t0, $t1")
-            print("mflo $t0")
-            print(f"continue_{branch_index}:")
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp)")            
-        elif _node.name == "min":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            data = _node.data
-            branch_index = data["branch_index"]
-            print("lw $t0, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print("lw $t1, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print(f"bge $t0, $t1, second_{branch_index}")
-            print(f"first_{branch_index}:")
-            print("move $t2, $t0")
-            print(f"j continue_{branch_index}")
-            print(f"second_{branch_index}:")
-            print("move $t2, $t1")
-            print(f"continue_{branch_index}:")
-            print("addi $sp, $sp, -4")
-            print("sw $t2, 4($sp)")
-        elif _node.name == "max":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            data = _node.data
-            branch_index = data["branch_index"]  
-            print("lw $t0, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print("lw $t1, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print(f"ble $t0, $t1, second_{branch_index}")
-            print(f"first_{branch_index}:")
-            print("move $t2, $t0")
-            print(f"j continue_{branch_index}")
-            print(f"second_{branch_index}:")
-            print("move $t2, $t1")
-            print(f"continue_{branch_index}:")
-            print("addi $sp, $sp, -4")
-            print("sw $t2, 4($sp)")
-            print("l2 $t0, 0")
-        elif _node.name == "exponent":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            data = _node.data
-            branch_index = data["branch_index"]  
-            print("li      $t0, 1 # res = 1")
-            print("li      $t1, 1 # iterator = 1")
-            print("lw $t2, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print("lw $t3, 4($sp)")  
-            print("addi $sp, $sp, 4")
-
-            print(f"loop_{branch_index}:") 
-
-            print("mult     $t0, $t3  # res * iterator")
-            print("mflo $t0")
-            print("add      $t1, $t1, 1")
-            print(f"ble     $t1, $t2, loop_{branch_index}")
-                    
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp)")
-
-        elif _node.name == "comparison":
-            data = _node.data
-            branch_index = data["branch_index"]            
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            print("lw $t0, 4($sp)")  
-            print("addi $sp, $sp, 4")
-            print("lw $t1, 4($sp)")
-            print("addi $sp, $sp, 4")
+                items.append("div $t2, $t1, $t0")
+            elif _node.value == "%":
+                items.append("rem $t2, $t1, $t0")
+            items += [*ASTNODE.push(emitter, "$t2"),
+                      "li $t2, 0"]
+            return items
+        elif name == "if":
+            branch_index = _node.data["branch_index"]
+            branch = ASTNODE.branch_items(_node.children[0], False, f"continue_{branch_index}", emitter)
+            if branch is not None:
+                return [*branch,
+                        _node.children[1],
+                        f"continue_{branch_index}:"]
+            return [*ASTNODE.value_items(_node.children[0], "$t0", emitter),
+                    f"beq $t0, 1, true_{branch_index}",
+                    f"false_{branch_index}:",
+                    f"     j continue_{branch_index}",
+                    f"true_{branch_index}:",
+                    _node.children[1],
+                    f"continue_{branch_index}:"]
+        elif name == "ifelse":
+            branch_index = _node.data["branch_index"]
+            branch = ASTNODE.branch_items(_node.children[0], True, f"true_{branch_index}", emitter)
+            if branch is not None:
+                return [*branch,
+                        f"false_{branch_index}:",
+                        _node.children[2],
+                        f"     j continue_{branch_index}",
+                        f"true_{branch_index}:",
+                        _node.children[1],
+                        f"continue_{branch_index}:"]
+            return [*ASTNODE.value_items(_node.children[0], "$t0", emitter),
+                    f"beq $t0, 1, true_{branch_index}",
+                    f"false_{branch_index}:",
+                    _node.children[2],
+                    f"     j continue_{branch_index}",
+                    f"true_{branch_index}:",
+                    _node.children[1],
+                    f"continue_{branch_index}:"]
+        elif name == "abs":
+            branch_index = _node.data["branch_index"]
+            return [*_node.children,
+                    *ASTNODE.pop(emitter, "$t0"),
+                    f"bge $t0, $zero, continue_{branch_index}",
+                    f"negate_{branch_index}:",
+                    "li $t1, -1",
+                    "mult $t0, $t1",
+                    "mflo $t0",
+                    f"continue_{branch_index}:",
+                    *ASTNODE.push(emitter, "$t0")]
+        elif name == "min" or name == "max":
+            branch_index = _node.data["branch_index"]
+            items = [*_node.children,
+                     *ASTNODE.pop(emitter, "$t0"),
+                     *ASTNODE.pop(emitter, "$t1"),
+                     f"{'bge' if name == 'min' else 'ble'} $t0, $t1, second_{branch_index}",
+                     f"first_{branch_index}:",
+                     "move $t2, $t0",
+                     f"j continue_{branch_index}",
+                     f"second_{branch_index}:",
+                     "move $t2, $t1",
+                     f"continue_{branch_index}:",
+                     *ASTNODE.push(emitter, "$t2")]
+            if name == "max":
+                items.append("li $t0, 0")
+            return items
+        elif name == "exponent":
+            branch_index = _node.data["branch_index"]
+            base, exponent = _node.children
+            if exponent.name == "number" and isinstance(exponent.value, int):
+                # a constant exponent becomes a straight-line chain of squarings and multiplies
+                if exponent.value <= 0:
+                    if emitter.static_frames:
+                        return [base,
+                                (ASTNODE.frame_drop, emitter),
+                                "li $t0, 1",
+                                *ASTNODE.push(emitter, "$t0")]
+                    return [base,
+                            "addi $sp, $sp, 4 # drop the base; x ** 0 = 1",
+                            "li $t0, 1",
+                            "addi $sp, $sp, -4",
+                            "sw $t0, 4($sp)"]
+                return [base,
+                        *ASTNODE.pop(emitter, "$t3"),
+                        "move $t0, $t3",
+                        *RegisterAllocator.power_chain(exponent.value, "$t0", "$t3"),
+                        *ASTNODE.push(emitter, "$t0")]
+            # square-and-multiply: one multiply per bit of the exponent and one squaring per bit but the last
+            return [base,
+                    exponent,
+                    "li      $t0, 1 # res = 1",
+                    *ASTNODE.pop(emitter, "$t2"),
+                    *ASTNODE.pop(emitter, "$t3"),
+                    f"ble $t2, $zero, continue_{branch_index} # x ** 0 = 1",
+                    f"loop_{branch_index}:",
+                    "andi $t1, $t2, 1",
+                    f"beq $t1, $zero, square_{branch_index} # multiply only for the exponent's 1 bits",
+                    "mult $t0, $t3  # res * base",
+                    "mflo $t0",
+                    f"square_{branch_index}:",
+                    "srl $t2, $t2, 1",
+                    f"beq $t2, $zero, continue_{branch_index}",
+                    "mult $t3, $t3 # base * base",
+                    "mflo $t3",
+                    f"j loop_{branch_index}",
+                    f"continue_{branch_index}:",
+                    *ASTNODE.push(emitter, "$t0")]
+        elif name == "comparison":
+            branch_index = _node.data["branch_index"]
+            items = [*_node.children,
+                     *ASTNODE.pop(emitter, "$t0"),
+                     *ASTNODE.pop(emitter, "$t1")]
             if _node.value == "==":
-                print(f"beq $t0, $t1, true_{branch_index}")
+                items.append(f"beq $t0, $t1, true_{branch_index}")
+            elif _node.value == "!=":
+                items.append(f"bne $t0, $t1, true_{branch_index}")
             elif _node.value == "<":
-                print(f"bgt $t0, $t1, true_{branch_index}")
-
+                items.append(f"bgt $t0, $t1, true_{branch_index}")
             elif _node.value == "<=":
-                print(f"bge $t0, $t1, true_{branch_index}")
-
+                items.append(f"bge $t0, $t1, true_{branch_index}")
             elif _node.value == ">":
-                print(f"blt $t0, $t1, true_{branch_index}")
+                items.append(f"blt $t0, $t1, true_{branch_index}")
             elif _node.value == ">=":
-                print(f"ble $t0, $t1, true_{branch_index}")
-
-            print(f"false_{branch_index}:")
-            print("     li $t2, 0")
-            print(f"     j continue_{branch_index}")
-            print(f"true_{branch_index}:")
-            print("     li $t2, 1")
-            print(f"continue_{branch_index}:")
-            print("addi $sp, $sp, -4")
-            print("sw $t2, 4($sp)")
-            print("li $t2, 0")
-        elif _node.name == "print_list":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-        elif _node.name == "uminus":
-            for child in _node.children:
-                ASTNODE.emit_ast(child)
-            print("lw $t0, 4($sp) # pop an integer off the stack and store it in 10")  
-            print("addi $sp, $sp, 4")
-            print("li $t1, -1 # load -1 into t1")
-            print("mult $t0, $t1 # multiply t0 and t1")
-            print("mflo $t0")
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp) # store t0 onto the stack")
-            print("li $t0, 0")
-            print("li $t1, 0")
-        elif _node.name == "name":
-            data = _node.data
-            var_name = data["var_name"]
-            print(f"lw $t0, {var_name} # load the value of {var_name} into t0")
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp) # store the value of t0 on the stack")        
-            print("li $t0, 0")
-        elif _node.name == "number":
-            print("li $t0, {} # load an integer into t0".format(_node.value))
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp) # store the integer on the stack")
-            print("li $t0, 0")
-        elif _node.name == "string":
-            print("li $t0, {} # store a string into t0".format(_node.value))
-            print("addi $sp, $sp, -4")
-            print("sw $t0, 4($sp) # put the value of sw t0 onto the stack")
+                items.append(f"ble $t0, $t1, true_{branch_index}")
+            items += [f"false_{branch_index}:",
+                      "     li $t2, 0",
+                      f"     j continue_{branch_index}",
+                      f"true_{branch_index}:",
+                      "     li $t2, 1",
+                      f"continue_{branch_index}:",
+                      *ASTNODE.push(emitter, "$t2"),
+                      "li $t2, 0"]
+            return items
+        elif name == "uminus":
+            return [*_node.children,
+                    *ASTNODE.pop(emitter, "$t0", "pop an integer off the stack and store it in 10",
+                                 "load the integer in the top slot of the frame into t0"),
+                    "li $t1, -1 # load -1 into t1",
+                    "mult $t0, $t1 # multiply t0 and t1",
+                    "mflo $t0",
+                    *ASTNODE.push(emitter, "$t0", "store t0 onto the stack"),
+                    "li $t0, 0",
+                    "li $t1, 0"]
+        elif name == "name":
+            var_name = _node.data["var_name"]
+            if var_name in emitter.promoted:
+                return ASTNODE.push(emitter, emitter.promoted[var_name], f"store the value of {var_name} on the stack")
+            if var_name in emitter.induction:
+                return ASTNODE.push(emitter, emitter.induction[var_name], f"store the value of {var_name} on the stack")
+            return [f"lw $t0, {var_name} # load the value of {var_name} into t0",
+                    *ASTNODE.push(emitter, "$t0", "store the value of t0 on the stack"),
+                    "li $t0, 0"]
+        elif name == "number":
+            return ["li $t0, {} # load an integer into t0".format(_node.value),
+                    *ASTNODE.push(emitter, "$t0", "store the integer on the stack"),
+                    "li $t0, 0"]
+        elif name == "string":
+            return ["li $t0, {} # store a string into t0".format(_node.value),
+                    *ASTNODE.push(emitter, "$t0", "put the value of sw t0 onto the stack")]
+        # conditional, for_assign and empty_list generate nothing
+        return []
+
+    @staticmethod
+    def initialize_variables(variables, promoted=()) -> None:
+        Emitter.emit(".data")
+        for var_name in variables:
+            if var_name not in promoted:
+                Emitter.emit(f"{var_name}: .word 0")
+
+    # the variables the tree rooted at _node mentions, in order of first appearance; these get .data words, so a
+    # redeclared name keeps a word for each declaration and a variable all of whose code was removed has none
+    @staticmethod
+    def variables(_node) -> list:
+        seen = {}
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name in ("name", "assign", "for"):
+                seen.setdefault(node.data["var_name"])
+            work.extend(reversed(node.children))
+        return list(seen)
+
+    # True when the expression _node reads the variable var_name
+    @staticmethod
+    def reads(_node, var_name: str) -> bool:
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name == "name" and node.data["var_name"] == var_name:
+                return True
+            work.extend(node.children)
+        return False
+
+    # True when the statements of _node assign the variable var_name
+    @staticmethod
+    def assigns(_node, var_name: str) -> bool:
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name in ("assign", "for") and node.data["var_name"] == var_name:
+                return True
+            work.extend(node.children)
+        return False
+
+    # work item run where the code of a for loop's body starts and ends: the loop variables kept in registers
+    # and the number of enclosing for loops from there on
+    @staticmethod
+    def enter_loop(emitter: Emitter, induction: dict, depth: int) -> None:
+        emitter.induction = induction
+        emitter.loop_depth = depth
+
+    # work items run around the code of a top-level statement with Emitter.static_frames: the statement's lines
+    # are collected apart, and once its deepest stack is known they are put between one move of $sp down over
+    # that many words and the move back up.  Inside, the value at depth d (the first pushed being 1) lives in
+    # d * 4($sp), so a push or a pop is a single sw or lw
+    @staticmethod
+    def open_frame(emitter: Emitter) -> None:
+        emitter.frame_lines = emitter.lines
+        emitter.lines = []
+        emitter.frame_depth = 0
+        emitter.frame_size = 0
+
+    @staticmethod
+    def close_frame(emitter: Emitter) -> None:
+        lines = emitter.lines
+        emitter.lines = emitter.frame_lines
+        emitter.frame_lines = None
+        emitter.frame_depth = None
+        size = 4 * emitter.frame_size
+        if size:
+            Emitter.emit(f"addi $sp, $sp, -{size} # reserve the statement's stack frame")
+        emitter.lines.extend(lines)
+        if size:
+            Emitter.emit(f"addi $sp, $sp, {size} # release the statement's stack frame")
+
+    @staticmethod
+    def frame_push(emitter: Emitter, register: str, comment: str) -> None:
+        emitter.frame_depth += 1
+        emitter.frame_size = max(emitter.frame_size, emitter.frame_depth)
+        Emitter.emit(f"sw {register}, {4 * emitter.frame_depth}($sp)" + (f" # {comment}" if comment else ""))
+
+    @staticmethod
+    def frame_pop(emitter: Emitter, register: str, comment: str) -> None:
+        Emitter.emit(f"lw {register}, {4 * emitter.frame_depth}($sp)" + (f" # {comment}" if comment else ""))
+        emitter.frame_depth -= 1
+
+    # pop the value on top of the stack without loading it
+    @staticmethod
+    def frame_drop(emitter: Emitter) -> None:
+        emitter.frame_depth -= 1
+
+    # clear the given registers of promoted variables, so they start at 0 like the .data words they replace
     @staticmethod
-    def initialize_variables(symbol_table) -> None:
-        print(".data")
-        for scope, data in symbol_table.items():
-            for variable, values in data.items():
-                print(f"{values['var_name']}: .word 0")
+    def initialize_registers(registers: list) -> None:
+        for register in registers:
+            Emitter.emit(f"move {register}, $zero")
 
 # limited functional testing
 # 2023-04-24, DMW, updated to use test() to prevent pycharm warnings about shadowing "child"
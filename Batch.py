@@ -0,0 +1,182 @@
+# Purpose:  Compile a directory or glob of programs in parallel
+# History:
+#           2026-10-18, every file returns the changes to its worker's cache hits, misses, stores and evictions, and
+#                       the summary and stats.json add those up instead of deriving them from the number of files
+#           2026-10-18, --profile: every .asm file counts the runs of its labelled blocks (see Profiler.py)
+#           2026-10-18, the workers get every code generation option of main.py: --no-strength-reduction, --promote,
+#                       --no-static-frames, --no-loop-optimization, --no-dead-code-elimination and --fast-lexer
+#           2026-10-18, --strip-comments; each .asm file is written with one Emitter.write_lines() call
+#           2026-10-18, --cache shares a CompileCache directory between the workers
+#           2026-10-18, created; fans the files out over a process pool whose workers each build one Compiler
+#                       (a warm lexer and parser from parsetab.py) and reuse it for every file they are given
+#
+# usage:  python Batch.py challenges [--output-dir out] [--jobs N] [--registers | --ir] [--peephole [RULES]]
+#                          [--cache DIR] [--strip-comments] [--no-fold] [--no-strength-reduction] [--promote]
+#                          [--no-static-frames] [--no-loop-optimization] [--no-dead-code-elimination] [--fast-lexer]
+#                          [--profile]
+#
+# Every input file.txt produces file.asm, next to it or under --output-dir with the same relative path.  A summary
+# of files per second, failures and the total number of instructions emitted is printed at the end; the exit
+# status is 1 when any file failed.
+
+import argparse
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from CompileCache import CompileCache
+from Compiler import Compiler
+from Emitter import Emitter
+
+# the Compiler and optional CompileCache of this worker process, built once by start_worker
+worker_compiler = None
+worker_cache = None
+
+
+def start_worker(backend: str, fold: bool, peephole, cache_directory=None, cache_bytes: int = 0,
+                 strip_comments: bool = False, strength_reduce: bool = True, promote: bool = False,
+                 optimize_loops: bool = True, eliminate_dead_code: bool = True, fast_lexer: bool = False,
+                 static_frames: bool = True, profile: bool = False) -> None:
+    global worker_compiler, worker_cache
+    worker_compiler = Compiler(backend, fold=fold, peephole=peephole, strip_comments=strip_comments,
+                               strength_reduce=strength_reduce, promote=promote, optimize_loops=optimize_loops,
+                               eliminate_dead_code=eliminate_dead_code, fast_lexer=fast_lexer,
+                               static_frames=static_frames, profile=profile)
+    if cache_directory is not None:
+        worker_cache = CompileCache(cache_directory, cache_bytes)
+
+
+# compile one file and return (source path, instructions emitted or None, error message or None, the changes to
+# the worker's cache statistics)
+def compile_file(job: tuple) -> tuple:
+    source_path, output_path = job
+    before = dict(worker_cache.stats) if worker_cache is not None else {}
+    try:
+        with open(source_path, "r", encoding="utf8") as source:
+            if worker_cache is not None:
+                lines = worker_cache.compile(worker_compiler, source.read()).splitlines()
+            else:
+                lines = worker_compiler.compile_lines(source.read())
+        if os.path.dirname(output_path):
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        Emitter.write_lines(lines, output_path)
+        return source_path, Compiler.count_instructions(lines), None, cache_changes(before)
+    except Exception as error:
+        message = str(error).splitlines()[0] if str(error) else ""
+        return source_path, None, "{}: {}".format(type(error).__name__, message), cache_changes(before)
+
+
+# how far each statistic of the worker's cache has moved since before
+def cache_changes(before: dict) -> dict:
+    if worker_cache is None:
+        return {}
+    return {name: count - before[name] for name, count in worker_cache.stats.items()}
+
+
+# the files named by a directory (every *.txt below it) or a glob pattern, and the directory their output paths
+# are relative to
+def find_sources(pattern: str) -> tuple:
+    if os.path.isdir(pattern):
+        files = sorted(glob.glob(os.path.join(pattern, "**", "*.txt"), recursive=True))
+        return files, pattern
+    files = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    base = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files]) if files else "."
+    return files, base
+
+
+def output_path(source_path: str, base: str, output_dir) -> str:
+    stem = os.path.splitext(source_path)[0] + ".asm"
+    if output_dir is None:
+        return stem
+    return os.path.join(output_dir, os.path.relpath(os.path.abspath(stem), os.path.abspath(base)))
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Compile many programs to MIPS assembly in parallel.")
+    arg_parser.add_argument("sources", nargs="+", help="directories (every *.txt below them) or glob patterns")
+    arg_parser.add_argument("--output-dir", help="write the .asm files here instead of next to each source")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                            help="worker processes (default: one per core; 1 compiles in this process)")
+    backend = arg_parser.add_mutually_exclusive_group()
+    backend.add_argument("--registers", action="store_true", help="use the register allocating backend")
+    backend.add_argument("--ir", action="store_true", help="use the three-address IR backend")
+    arg_parser.add_argument("--no-fold", action="store_true", help="do not fold constant expressions")
+    arg_parser.add_argument("--no-strength-reduction", action="store_true",
+                            help="multiply and divide by constants with mult and div instead of shifts and magic "
+                                 "numbers")
+    arg_parser.add_argument("--no-static-frames", action="store_true",
+                            help="move $sp for every value pushed or popped instead of reserving one stack frame per "
+                                 "statement")
+    arg_parser.add_argument("--no-loop-optimization", action="store_true",
+                            help="do not unroll short constant for loops or hoist invariant expressions out of loops")
+    arg_parser.add_argument("--no-dead-code-elimination", action="store_true",
+                            help="keep constant branches, unused expression statements and assignments nothing reads")
+    arg_parser.add_argument("--promote", action="store_true",
+                            help="keep the most used variables in the saved registers $s0-$s7 instead of memory")
+    arg_parser.add_argument("--fast-lexer", action="store_true",
+                            help="lex with the hand-written single-pass lexer instead of PLY's (same tokens, faster)")
+    arg_parser.add_argument("--peephole", nargs="?", const="all", metavar="RULES",
+                            help="run the peephole optimizer; optionally a comma-separated list of rules")
+    arg_parser.add_argument("--profile", action="store_true",
+                            help="count how often every labelled block runs and print the counts when the program "
+                                 "exits, one '@<block> <count>' line each (see Profiler.py)")
+    arg_parser.add_argument("--cache", metavar="DIR",
+                            help="reuse the output of identical earlier compiles stored in DIR")
+    arg_parser.add_argument("--cache-size", type=int, default=64, metavar="MB",
+                            help="evict the least recently used cache entries beyond this size (default 64)")
+    arg_parser.add_argument("--strip-comments", action="store_true",
+                            help="leave the explanatory comments out of the generated assembly")
+    arg_parser.add_argument("--quiet", action="store_true", help="only print failures and the summary")
+    args = arg_parser.parse_args()
+
+    jobs = []
+    for pattern in args.sources:
+        files, base = find_sources(pattern)
+        jobs += [(path, output_path(path, base, args.output_dir)) for path in files]
+    if not jobs:
+        print("No programs found.", file=sys.stderr)
+        sys.exit(1)
+
+    settings = ("ir" if args.ir else "registers" if args.registers else "stack", not args.no_fold,
+                args.peephole if args.peephole in (None, "all") else args.peephole.split(","),
+                args.cache, args.cache_size * 2 ** 20, args.strip_comments, not args.no_strength_reduction,
+                args.promote, not args.no_loop_optimization, not args.no_dead_code_elimination, args.fast_lexer,
+                not args.no_static_frames, args.profile)
+    start = time.perf_counter()
+    if args.jobs <= 1:
+        start_worker(*settings)
+        results = map(compile_file, jobs)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(args.jobs, initializer=start_worker, initargs=settings)
+        # hand out the files in chunks so that small programs are not dominated by inter-process traffic
+        results = pool.map(compile_file, jobs, chunksize=max(1, len(jobs) // (args.jobs * 8)))
+
+    failures = 0
+    instructions = 0
+    cache_stats = {}
+    for path, count, error, changes in results:
+        for name, change in changes.items():
+            cache_stats[name] = cache_stats.get(name, 0) + change
+        if error is not None:
+            failures += 1
+            print("FAILED {}: {}".format(path, error), file=sys.stderr)
+        else:
+            instructions += count
+            if not args.quiet:
+                print("{}: {} instructions".format(path, count))
+    if pool is not None:
+        pool.shutdown()
+    seconds = time.perf_counter() - start
+
+    print("{} files in {:.2f}s ({:.1f} files/sec) with {} workers, {} failed, {} instructions".format(
+        len(jobs), seconds, len(jobs) / seconds if seconds > 0 else 0.0, max(args.jobs, 1), failures, instructions))
+    if args.cache:
+        # the workers' caches are gone with their processes, so the totals they sent back are recorded from here
+        cache = CompileCache(args.cache)
+        cache.stats.update(cache_stats)
+        print(CompileCache.report(cache.stats))
+        cache.save_stats()
+    sys.exit(1 if failures else 0)
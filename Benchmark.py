@@ -0,0 +1,273 @@
+# Purpose:  Benchmark suite for compile time and generated-code quality
+# History:
+#           2026-10-18, the cases run at the default recursion limit now that no backend recurses, with a nesting
+#                       case of depth 3000; a failed case makes the exit status 1
+#           2026-10-18, the hand-written Lexer is timed next to PLY's lexer, checked to give the same tokens, and
+#                       both are reported in MB/s
+#           2026-10-18, the memory pass also reports the bytes the parsed tree holds per node
+#           2026-10-18, created; generates programs of scaling size, times each compiler phase, measures peak
+#                       memory and counts the static instructions every backend emits, and stores it all as JSON
+#
+# usage:  python Benchmark.py [--quick] [--max-size N] [--output results.json] [--baseline old.json]
+#
+# Lexing, parsing, folding and every backend walk the tree without recursion, so the cases run at Python's
+# default recursion limit: the nesting and expression cases go well past it, and a phase that starts to recurse
+# over the depth again fails its case with a RecursionError.  A case that fails is recorded as an error rather
+# than ending the run, and makes the exit status 1.
+#
+# With --baseline the run is compared against an earlier results file: slower phases (beyond --tolerance),
+# more memory, or more emitted instructions are reported and the exit status is 1.
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from Compiler import Compiler
+from ConstantFolder import ConstantFolder
+from Lexer import Lexer
+from Peephole import Peephole
+
+
+# ------------------------------------------------------------------------------------------- program generators
+
+# a straight-line program of size statements mixing assignments, arithmetic and prints
+def statements_program(size: int) -> str:
+    lines = ["var x = readLine()", "var total = 0"]
+    for k in range(max(size - 2, 0)):
+        kind = k % 4
+        if kind == 0:
+            lines.append(f"total = total + x * {k % 97}")
+        elif kind == 1:
+            lines.append(f"x = x - {k % 5 + 1}")
+        elif kind == 2:
+            lines.append(f"total = max(total, x) / {k % 7 + 1}")
+        else:
+            lines.append("print(total)")
+    return "\n".join(lines) + "\n"
+
+
+# size while loops nested inside each other
+def nesting_program(size: int) -> str:
+    lines = ["var d = readLine()"]
+    for k in range(size):
+        lines.append("   " * k + "while (d > 0) {")
+        lines.append("   " * (k + 1) + "d = d - 1")
+    lines.append("   " * size + "print(d)")
+    for k in reversed(range(size)):
+        lines.append("   " * k + "}")
+    return "\n".join(lines) + "\n"
+
+
+# one assignment whose expression has size operands
+def expression_program(size: int) -> str:
+    operators = ["+", "-", "*"]
+    terms = ["x"]
+    for k in range(1, size):
+        terms.append(operators[k % 3])
+        terms.append("x" if k % 2 else str(k % 13))
+    return "var x = readLine()\nvar y = " + " ".join(terms) + "\nprint(y)\n"
+
+
+# size distinct variables, each computed from the one before
+def variables_program(size: int) -> str:
+    lines = ["var v0 = readLine()"]
+    for k in range(1, size):
+        lines.append(f"var v{k} = v{k - 1} + {k % 11}")
+    lines.append(f"print(v{size - 1})")
+    return "\n".join(lines) + "\n"
+
+
+suite = {
+    "statements": (statements_program, [1000, 10000, 100000, 1000000]),
+    "nesting": (nesting_program, [10, 100, 1000, 3000]),
+    "expression": (expression_program, [100, 1000, 10000]),
+    "variables": (variables_program, [1000, 10000, 100000]),
+}
+
+backends = ["stack", "registers", "ir"]
+
+
+# ------------------------------------------------------------------------------------------------- measurement
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def lex(compiler: Compiler, source: str) -> list:
+    compiler.build()
+    lexer = compiler.lexer.clone()
+    lexer.input(source)
+    return list(iter(lexer.token, None))
+
+
+def fast_lex(compiler: Compiler, source: str) -> list:
+    lexer = Lexer(compiler)
+    lexer.input(source)
+    return list(iter(lexer.token, None))
+
+
+def same_tokens(tokens: list, others: list) -> bool:
+    return len(tokens) == len(others) and all(
+        (token.type, token.value, token.lineno, token.lexpos) == (other.type, other.value, other.lineno, other.lexpos)
+        for token, other in zip(tokens, others))
+
+
+def parse(compiler: Compiler, tokens: list):
+    stream = iter(tokens)
+    return compiler.parse(None, tokenfunc=lambda: next(stream, None))
+
+
+def count_nodes(tree) -> int:
+    count = 0
+    work = [tree]
+    while work:
+        node = work.pop()
+        count += 1
+        work.extend(node.children)
+    return count
+
+
+# compile source through every phase and backend and return the measurements for one case
+def run_case(name: str, size: int, source: str, measure_memory: bool) -> dict:
+    result = {"name": name, "size": size, "bytes": len(source), "error": None}
+    compiler = Compiler()
+    phase = "lex"
+    try:
+        tokens, result["lex_s"] = timed(lex, compiler, source)
+        result["tokens"] = len(tokens)
+        phase = "fast lex"
+        fast_tokens, result["fast_lex_s"] = timed(fast_lex, compiler, source)
+        if not same_tokens(tokens, fast_tokens):
+            raise Exception("the tokens of Lexer differ from those of the PLY lexer")
+        del fast_tokens
+        phase = "parse"
+        tree, result["parse_s"] = timed(parse, compiler, tokens)
+        phase = "fold"
+        tree, result["fold_s"] = timed(ConstantFolder.fold_program, tree)
+
+        result["codegen"] = {}
+        for backend in backends:
+            phase = backend
+            compiler.backend = backend
+            lines, seconds = timed(compiler.generate, tree)
+            result["codegen"][backend] = {"seconds": seconds, "instructions": Compiler.count_instructions(lines)}
+            if backend == "stack":
+                phase = "peephole"
+                optimized, seconds = timed(Peephole().optimize, lines)
+                result["codegen"]["stack+peephole"] = {"seconds": seconds,
+                                                       "instructions": Compiler.count_instructions(optimized)}
+
+        if measure_memory:
+            phase = "memory"
+            compiler.backend = "stack"
+            tokens = lex(compiler, source)
+            tracemalloc.start()
+            tree = parse(compiler, tokens)
+            # what the parsed tree still holds on to, per node
+            result["nodes"] = count_nodes(tree)
+            result["tree_bytes_per_node"] = tracemalloc.get_traced_memory()[0] / result["nodes"]
+            compiler.generate(ConstantFolder.fold_program(tree))
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    except (Exception, RecursionError) as error:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        result["error"] = "{}: {}: {}".format(phase, type(error).__name__, str(error)[:200])
+    return result
+
+
+# metrics worth comparing between runs, as (label, value, is_time) tuples
+def metrics(case: dict) -> list:
+    values = [(phase, case.get(phase + "_s"), True) for phase in ("lex", "fast_lex", "parse", "fold")]
+    for backend, measured in case.get("codegen", {}).items():
+        values.append((backend + " codegen", measured["seconds"], True))
+        values.append((backend + " instructions", measured["instructions"], False))
+    values.append(("peak memory", case.get("peak_memory_bytes"), False))
+    values.append(("tree bytes per node", case.get("tree_bytes_per_node"), False))
+    return values
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list:
+    previous = {(case["name"], case["size"]): case for case in baseline["cases"]}
+    found = []
+    for case in results["cases"]:
+        old = previous.get((case["name"], case["size"]))
+        if old is None:
+            continue
+        if case["error"] and not old["error"]:
+            found.append("{} {}: now fails ({})".format(case["name"], case["size"], case["error"]))
+            continue
+        old_metrics = {label: value for label, value, _ in metrics(old)}
+        for label, value, is_time in metrics(case):
+            before = old_metrics.get(label)
+            if value is None or before is None:
+                continue
+            if is_time:
+                # ignore differences too small to be anything but timer noise
+                worse = value > before * (1 + tolerance) and value - before > 0.01
+            elif label in ("peak memory", "tree bytes per node"):
+                worse = value > before * (1 + tolerance)
+            else:
+                worse = value > before
+            if worse:
+                found.append("{} {}: {} {:.6g} -> {:.6g}".format(case["name"], case["size"], label, before, value))
+    return found
+
+
+def report(case: dict) -> str:
+    if case["error"]:
+        return "{:<11} {:>8}  {}".format(case["name"], case["size"], case["error"])
+    codegen = "  ".join("{} {:.3f}s/{}".format(backend, measured["seconds"], measured["instructions"])
+                        for backend, measured in case["codegen"].items())
+    memory = case.get("peak_memory_bytes")
+    megabytes = case["bytes"] / 2 ** 20
+    lexing = "lex {:.3f}s {:.2f} MB/s  fast lex {:.3f}s {:.2f} MB/s".format(
+        case["lex_s"], megabytes / case["lex_s"], case["fast_lex_s"], megabytes / case["fast_lex_s"])
+    return "{:<11} {:>8}  {}  parse {:.3f}s  fold {:.3f}s  {}{}".format(
+        case["name"], case["size"], lexing, case["parse_s"], case["fold_s"], codegen,
+        "  peak {:.1f} MB, {:.0f} B/node".format(memory / 2 ** 20, case["tree_bytes_per_node"])
+        if memory is not None else "")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="Benchmark compile time and generated code size.")
+    arg_parser.add_argument("--quick", action="store_true", help="run only the smallest size of every case")
+    arg_parser.add_argument("--max-size", type=int, help="skip sizes larger than this")
+    arg_parser.add_argument("--cases", help="comma-separated subset of: " + ", ".join(suite))
+    arg_parser.add_argument("--no-memory", action="store_true", help="skip the traced run that measures peak memory")
+    arg_parser.add_argument("--output", default="benchmark_results.json", help="where to write the JSON results")
+    arg_parser.add_argument("--baseline", help="earlier results to check for regressions")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25,
+                            help="relative slowdown or memory growth allowed against the baseline (default 0.25)")
+    args = arg_parser.parse_args()
+
+    results = {"python": platform.python_version(), "platform": platform.platform(),
+               "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "cases": []}
+
+    for name in (args.cases.split(",") if args.cases else suite):
+        generator, sizes = suite[name]
+        if args.quick:
+            sizes = sizes[:1]
+        for size in sizes:
+            if args.max_size is not None and size > args.max_size:
+                continue
+            case = run_case(name, size, generator(size), not args.no_memory)
+            results["cases"].append(case)
+            print(report(case), flush=True)
+
+    with open(args.output, "w", encoding="utf8") as output:
+        json.dump(results, output, indent=2)
+
+    failed = any(case["error"] for case in results["cases"])
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf8") as previous:
+            found = regressions(results, json.load(previous), args.tolerance)
+        for regression in found:
+            print("REGRESSION " + regression)
+        failed = failed or bool(found)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,199 @@
+# Purpose:  Content-addressed on-disk cache of compiled programs
+# History:
+#           2026-10-18, Lexer is part of the fingerprint
+#           2026-10-18, DeadCodeEliminator is part of the fingerprint
+#           2026-10-18, compiles through Compiler.transform(); LoopOptimizer is part of the fingerprint
+#           2026-10-18, StrengthReduction and VariablePromoter are part of the fingerprint
+#           2026-10-18, created; assembly (and optionally the pickled AST) stored under a hash of the source, the
+#                       compiler version and the options, with size-bounded least recently used eviction
+#
+# usage:
+#           cache = CompileCache(".compile_cache", max_bytes=64 * 2 ** 20)
+#           asm = cache.compile(compiler, source)
+#
+# The key is the SHA-256 of the compiler fingerprint (Compiler.version and the text of every module that takes
+# part in code generation), the options of the compiler and the source text, so editing the compiler invalidates
+# every entry.  Entries are written to a temporary file and renamed into place, so processes that share a cache
+# directory never read half an entry.  A hit touches the entry's modification time, which is the recency the
+# eviction goes by.  Hit and miss counts are kept per instance and, with save_stats(), added to stats.json in the
+# cache directory.
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+
+from Compiler import Compiler
+
+
+class CompileCache:
+    # the modules whose text is part of the fingerprint
+    modules = ("Compiler", "ASTNODE", "Emitter", "ConstantFolder", "RegisterAllocator", "IR", "MIPSLowering",
+               "Peephole", "StrengthReduction", "VariablePromoter",
+               "LoopOptimizer", "DeadCodeEliminator", "Lexer", "Profiler")
+    fingerprint_value = None
+
+    def __init__(self, directory: str = ".compile_cache", max_bytes: int = 64 * 2 ** 20, store_ast: bool = False):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.store_ast = store_ast
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        # key -> (size, modification time) of every entry, read from the directory when first needed
+        self.index = None
+        self.total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def fingerprint() -> str:
+        if CompileCache.fingerprint_value is None:
+            digest = hashlib.sha256(Compiler.version.encode("utf8"))
+            for name in CompileCache.modules:
+                with open(sys.modules[name].__file__, "rb") as module:
+                    digest.update(module.read())
+            CompileCache.fingerprint_value = digest.hexdigest()
+        return CompileCache.fingerprint_value
+
+    @staticmethod
+    def key(source: str, options: str) -> str:
+        digest = hashlib.sha256(CompileCache.fingerprint().encode("ascii"))
+        digest.update(b"\0" + options.encode("utf8") + b"\0")
+        digest.update(source.encode("utf8"))
+        return digest.hexdigest()
+
+    def path(self, key: str, extension: str = ".asm") -> str:
+        return os.path.join(self.directory, key[:2], key + extension)
+
+    # the assembly stored under key, or None
+    def get(self, key: str):
+        path = self.path(key)
+        try:
+            with open(path, "r", encoding="utf8") as entry:
+                asm = entry.read()
+            os.utime(path)
+        except OSError:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return asm
+
+    # the AST stored under key, or None
+    def load_tree(self, key: str):
+        try:
+            with open(self.path(key, ".ast"), "rb") as entry:
+                return pickle.load(entry)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def put(self, key: str, asm: str, tree=None) -> None:
+        size = self.write(self.path(key), asm.encode("utf8"))
+        if tree is not None:
+            try:
+                size += self.write(self.path(key, ".ast"), pickle.dumps(tree, pickle.HIGHEST_PROTOCOL))
+            except RecursionError:
+                # very deep trees cannot be pickled; the assembly is still worth keeping
+                pass
+        self.stats["stores"] += 1
+        self.load_index()
+        previous = self.index.get(key)
+        if previous is not None:
+            self.total_bytes -= previous[0]
+        self.index[key] = (size, os.path.getmtime(self.path(key)))
+        self.total_bytes += size
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+
+    @staticmethod
+    def write(path: str, data: bytes) -> int:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(handle, "wb") as entry:
+            entry.write(data)
+        os.replace(temporary, path)
+        return len(data)
+
+    # compile source with compiler, or return the stored assembly of an identical earlier compile
+    def compile(self, compiler: Compiler, source: str) -> str:
+        key = CompileCache.key(source, compiler.options())
+        asm = self.get(key)
+        if asm is not None:
+            return asm
+        with compiler.lock:
+            tree = compiler.transform(compiler.parse(source))
+            asm = "\n".join(compiler.optimize(compiler.generate(tree))) + "\n"
+        self.put(key, asm, tree if self.store_ast else None)
+        return asm
+
+    def load_index(self) -> None:
+        if self.index is not None:
+            return
+        self.index = {}
+        self.total_bytes = 0
+        for root, directories, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(".asm"):
+                    continue
+                key = name[:-4]
+                try:
+                    size = os.path.getsize(os.path.join(root, name))
+                    modified = os.path.getmtime(os.path.join(root, name))
+                    if os.path.exists(os.path.join(root, key + ".ast")):
+                        size += os.path.getsize(os.path.join(root, key + ".ast"))
+                except OSError:
+                    continue
+                self.index[key] = (size, modified)
+                self.total_bytes += size
+
+    # remove the least recently used entries until the cache is back under 90% of its bound, leaving room for
+    # a few more stores before the next eviction
+    def evict(self) -> None:
+        # recency may have changed through hits in this or another process since the index was read
+        for key, (size, modified) in list(self.index.items()):
+            try:
+                self.index[key] = (size, os.path.getmtime(self.path(key)))
+            except OSError:
+                self.total_bytes -= size
+                del self.index[key]
+        for key in sorted(self.index, key=lambda entry: self.index[entry][1]):
+            if self.total_bytes <= self.max_bytes * 0.9:
+                break
+            for extension in (".asm", ".ast"):
+                try:
+                    os.remove(self.path(key, extension))
+                except OSError:
+                    pass
+            self.total_bytes -= self.index.pop(key)[0]
+            self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        self.load_index()
+        for key in list(self.index):
+            for extension in (".asm", ".ast"):
+                try:
+                    os.remove(self.path(key, extension))
+                except OSError:
+                    pass
+        self.index = {}
+        self.total_bytes = 0
+
+    # add this instance's counts to the totals in stats.json and return the new totals
+    def save_stats(self) -> dict:
+        path = os.path.join(self.directory, "stats.json")
+        try:
+            with open(path, "r", encoding="utf8") as previous:
+                totals = json.load(previous)
+        except (OSError, ValueError):
+            totals = {}
+        for name, count in self.stats.items():
+            totals[name] = totals.get(name, 0) + count
+        CompileCache.write(path, json.dumps(totals, indent=2).encode("utf8"))
+        self.stats = {name: 0 for name in self.stats}
+        return totals
+
+    @staticmethod
+    def report(stats: dict) -> str:
+        lookups = stats.get("hits", 0) + stats.get("misses", 0)
+        rate = 100.0 * stats.get("hits", 0) / lookups if lookups else 0.0
+        return "cache: {} hits, {} misses ({:.1f}% hit rate), {} stores, {} evictions".format(
+            stats.get("hits", 0), stats.get("misses", 0), rate, stats.get("stores", 0), stats.get("evictions", 0))
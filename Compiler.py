@@ -0,0 +1,695 @@
+# Purpose:  Reentrant compiler for the print number language
+# History:
+#           2026-10-18, lextab.py and parsetab.py are loaded from table_dir by path, so a table module of the same name
+#                       earlier on sys.path is never used in their place
+#           2026-10-18, static_frames option: each top-level statement reserves its stack once and addresses its
+#                       values at fixed offsets from $sp; off, every push and pop moves $sp as before
+#           2026-10-18, profile option: Profiler counts the executions of every labelled block; nodes with labels
+#                       record their source line
+#           2026-10-18, statistics: a Statistics collects phase times, token, node, symbol and opcode counts
+#           2026-10-18, fast_lexer option: the hand-written Lexer produces the tokens instead of PLY's lexer
+#           2026-10-18, the lexer and parser are built on first use from the shipped lextab.py and parsetab.py in PLY's
+#                       optimize mode; write_tables() regenerates them, parser.out is no longer written
+#           2026-10-18, eliminate_dead_code option (DeadCodeEliminator); .data lists the variables the code uses
+#           2026-10-18, optimize_loops option (LoopOptimizer); transform() runs the AST passes
+#           2026-10-18, promote option; VariablePromoter keeps the busiest variables in $s0-$s7
+#           2026-10-18, strength_reduce option (StrengthReduction); % binds like * and /
+#           2026-10-18, strip_comments option; generated lines are written out through Emitter.write_lines()
+#           2026-10-18, compile_stream() emits each top-level statement as soon as it is parsed
+#           2026-10-18, expression nodes share ASTNODE.int_data and names share their symbol table entry as data
+#           2026-10-18, created; the lexer and grammar of main.py (2024-02-12, DMW) moved into a class so that every
+#                       instance has its own symbol table, label counter, lexer, parser and output
+#
+# usage:
+#           compiler = Compiler(backend="registers")
+#           asm = compiler.compile(source)
+#
+#           python -c "from Compiler import Compiler; Compiler.write_tables()"
+#                       after changing a token rule or the grammar; the tables are not checked against them
+#
+# One instance compiles any number of programs one after another; state left by the previous program is reset
+# when the next one is parsed.  Instances are independent, so threads can compile at the same time with one
+# Compiler each.  compile() on a shared instance is serialized by a lock.
+#
+# compile_stream() reads the source line by line and writes the code of every top-level statement to the output
+# as soon as the statement has been parsed, then drops its tree; .text comes first and the .data section is
+# appended at the end, once every variable is known.  Memory then stays bounded by the largest statement and the
+# number of variables rather than the length of the program.  Folding is limited to each statement on its own
+# (a variable's later assignments are not known yet, so nothing is propagated), the peephole pass sees one
+# statement at a time, and the ir backend, which lowers the whole program at once, cannot stream.
+
+import functools
+import importlib.util
+import os
+import sys
+import ply.lex as lex
+import ply.yacc as yacc
+import threading
+from types import MappingProxyType
+from ASTNODE import ASTNODE
+from ConstantFolder import ConstantFolder
+from DeadCodeEliminator import DeadCodeEliminator
+from Emitter import Emitter
+from IR import IRBuilder
+from Lexer import Lexer
+from LoopOptimizer import LoopOptimizer
+from MIPSLowering import MIPSLowering
+from Peephole import Peephole
+from Profiler import Profiler
+from Statistics import Statistics
+from VariablePromoter import VariablePromoter
+
+
+class Compiler:
+
+    # part of the key of cached output (see CompileCache); raise it whenever the generated code changes
+    version = "2026.10.18"
+
+    backends = ("stack", "registers", "ir")
+
+    # where lextab.py and parsetab.py, the prebuilt lexer and parser tables, are kept
+    table_dir = os.path.dirname(os.path.abspath(__file__))
+
+    reserved = {
+        'print': 'PRINT',
+        'readLine': 'READLINE',
+        'abs': 'ABS',
+        'min': 'MIN',
+        'max': 'MAX',
+        'for': 'FOR',
+        'while': 'WHILE',
+        'let': 'LET',
+        'var': 'VAR',
+        'if': "IF",
+        'else': "ELSE",
+        'in': "IN",
+    }
+
+    tokens = [
+        'NUMBER',
+        'SQ_STRING',
+        'DQ_STRING',
+        'DOUBLE_EQ',
+        'NAME',
+        'NOT_EQ',
+        'LESS_EQ',
+        'GREATER_EQ',
+        'ELLIPSIS',
+        'POWER'
+    ]
+    tokens += list(reserved.values())
+
+    literals = ['(', ')', ';', '{', '}', '+', '-', '/', '%', '*', "=", '"', '<', '>', '!', ',']
+
+    precedence = (
+        # ('nonassoc', '?', ':'), # 'EQUALS', 'LESSTHAN', 'GREATERTHAN', 'LTEQ', 'GTEQ',
+        ('left', '+', '-'),
+        ('left', 'ELLIPSIS'),
+        ('left', '*', '/', '%'),  # 'INTDIV'),
+        ("nonassoc", 'IF'),
+        ('right', 'UMINUS')
+    )
+
+    def __init__(self, backend: str = "stack", fold: bool = True, peephole=None, strip_comments: bool = False,
+                 strength_reduce: bool = True, promote: bool = False, optimize_loops: bool = True,
+                 eliminate_dead_code: bool = True, fast_lexer: bool = False, profile: bool = False,
+                 static_frames: bool = True) -> None:
+        if backend not in Compiler.backends:
+            raise Exception("Unknown backend '{}'.".format(backend))
+        self.backend = backend
+        self.fold = fold
+        # None for no peephole pass, otherwise a list of rule names, or "all"
+        self.peephole = peephole
+        self.peephole_report = {}
+        # leave the explanatory comments out of the generated assembly
+        self.strip_comments = strip_comments
+        # multiply, divide and take remainders by constants without the multiply and divide unit
+        self.strength_reduce = strength_reduce
+        # keep the most used variables in the saved registers instead of .data words
+        self.promote = promote
+        # unroll short constant for loops and hoist invariant expressions out of loops
+        self.optimize_loops = optimize_loops
+        self.loop_report = []
+        # remove constant branches, unused expression statements and assignments nothing reads
+        self.eliminate_dead_code = eliminate_dead_code
+        # give every top-level statement one stack frame for its values instead of moving $sp for every push
+        self.static_frames = static_frames
+        # lex with the hand-written Lexer instead of PLY's; the tokens are the same
+        self.fast_lexer = fast_lexer
+        # count how often every labelled block runs and print the counts at exit (see Profiler), and the labels
+        # of the counted blocks in the order they are printed
+        self.profile = profile
+        self.profile_labels = []
+        # a Statistics that records how long every phase takes and how big the program is, or None
+        self.statistics = None
+
+        self.symbol_table = {0: {}}
+        self.branch_index = 0
+        self.program = None
+        self.errors = []
+        self.lock = threading.Lock()
+        # while compile_stream() runs: the file top-level statements are written to, and the peephole optimizer
+        self.stream = None
+        self.stream_peephole = None
+        # the variables of the statements written so far, in order, as the keys of a dict
+        self.stream_variables = {}
+
+        # built by build() on first use
+        self.lexer = None
+        self.parser = None
+
+    # build the lexer, from lextab.py unless it is the hand-written Lexer, and the parser from parsetab.py, once.
+    # PLY's optimize mode skips validating the token rules and comparing the grammar's signature to the table's,
+    # and the parser never writes parser.out or rewrites its table; write_tables() brings the tables up to date
+    # after a grammar change.  The tables are the modules in table_dir, handed to PLY as modules: by name, PLY
+    # would import whichever lextab or parsetab comes first on sys.path.  Without a table file the lexer and
+    # parser are built from the rules, checked as usual
+    def build(self) -> None:
+        if self.parser is None:
+            lextab = Compiler.table("lextab")
+            parsetab = Compiler.table("parsetab")
+            if self.fast_lexer:
+                self.lexer = Lexer(self)
+            elif lextab is not None:
+                self.lexer = lex.lex(module=self, optimize=True, lextab=lextab)
+            else:
+                self.lexer = lex.lex(module=self)
+            if parsetab is not None:
+                self.parser = yacc.yacc(module=self, optimize=True, debug=False, write_tables=False,
+                                        tabmodule=parsetab, outputdir=Compiler.table_dir)
+            else:
+                self.parser = yacc.yacc(module=self, debug=False, write_tables=False, outputdir=Compiler.table_dir)
+
+    # the table module name (lextab or parsetab) loaded from its file in table_dir, once per process, or None when
+    # there is no such file
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def table(name: str):
+        path = os.path.join(Compiler.table_dir, name + ".py")
+        if not os.path.exists(path):
+            return None
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    # regenerate lextab.py and parsetab.py from the token rules and grammar of this class, with the grammar and
+    # its states written to parser.out when debug is set
+    @staticmethod
+    def write_tables(debug: bool = False) -> None:
+        compiler = Compiler()
+        Compiler.table.cache_clear()
+        for name in ("lextab", "parsetab"):
+            # PLY first tries to import a table by name; None in sys.modules makes that fail, so a table module
+            # elsewhere on sys.path is not read instead of building the new one
+            sys.modules[name] = None
+            if os.path.exists(os.path.join(Compiler.table_dir, name + ".py")):
+                os.remove(os.path.join(Compiler.table_dir, name + ".py"))
+        try:
+            lex.lex(module=compiler, optimize=True, lextab="lextab", outputdir=Compiler.table_dir)
+            yacc.yacc(module=compiler, debug=debug, outputdir=Compiler.table_dir)
+        finally:
+            for name in ("lextab", "parsetab"):
+                sys.modules.pop(name, None)
+
+    # the options that change the generated code, as text
+    def options(self) -> str:
+        peephole = self.peephole if self.peephole in (None, "all") else ",".join(self.peephole)
+        return "backend={} fold={} peephole={} strip_comments={} strength_reduce={} promote={} loops={} " \
+               "dead_code={} profile={} static_frames={}".format(self.backend, self.fold, peephole,
+                                                                 self.strip_comments, self.strength_reduce,
+                                                                 self.promote, self.optimize_loops,
+                                                                 self.eliminate_dead_code, self.profile,
+                                                                 self.static_frames)
+
+    # an Emitter with the code generation options of this compiler
+    def emitter(self, promoted=None) -> Emitter:
+        return Emitter(allocate_registers=self.backend == "registers", strip_comments=self.strip_comments,
+                       strength_reduce=self.strength_reduce, promoted=promoted, static_frames=self.static_frames)
+
+    # run function(*args) as phase name, timed when statistics are collected
+    def timed(self, name: str, function, *args):
+        if self.statistics is None:
+            return function(*args)
+        return self.statistics.time(name, function, *args)
+
+    # compile source and return the assembly as one string
+    def compile(self, source: str) -> str:
+        return "\n".join(self.compile_lines(source)) + "\n"
+
+    # compile source and return the assembly as a list of lines
+    def compile_lines(self, source: str) -> list:
+        with self.lock:
+            tree = self.transform(self.parse(source))
+            return self.optimize(self.generate(tree))
+
+    # run the AST passes the options ask for over the tree of the last parsed program: constant folding, then the
+    # loop optimizations, whose unrolled copies and hoisted expressions are folded once more, and dead code
+    # elimination last, when folding has decided every constant condition
+    def transform(self, tree) -> ASTNODE:
+        if self.fold:
+            tree = self.timed("fold", ConstantFolder.fold_program, tree)
+        if self.optimize_loops:
+            optimizer = LoopOptimizer(self.symbol_table, self.branch_index)
+            tree = self.timed("loops", optimizer.optimize, tree)
+            self.branch_index = optimizer.branch_index
+            self.loop_report = optimizer.report
+            if self.fold and optimizer.report:
+                tree = self.timed("refold", ConstantFolder.fold_program, tree)
+        if self.eliminate_dead_code:
+            tree = self.timed("dead code", DeadCodeEliminator.eliminate, tree)
+        if self.statistics is not None:
+            self.statistics.nodes = Statistics.count_nodes(tree)
+            self.statistics.record_symbols(self.symbol_table)
+        return tree
+
+    # compile the program read from the file object source and write the assembly to the file object output,
+    # one top-level statement at a time
+    def compile_stream(self, source, output) -> None:
+        if self.backend == "ir":
+            raise Exception("The ir backend cannot stream; it lowers the whole program at once.")
+        if self.promote:
+            raise Exception("Variables cannot be promoted while streaming; that needs the whole program.")
+        if self.profile:
+            raise Exception("Programs cannot be profiled while streaming; the counters go into .data at the start.")
+        with self.lock:
+            self.stream = output
+            if self.peephole is not None:
+                self.stream_peephole = Peephole(None if self.peephole == "all" else self.peephole)
+            try:
+                output.write(".text\n")
+                self.parse(None, tokenfunc=functools.partial(next, self.stream_tokens(source), None))
+                with self.emitter() as emitter:
+                    Emitter.emit("li $v0, 10")
+                    Emitter.emit("syscall")
+                    ASTNODE.initialize_variables(self.stream_variables)
+                emitter.write(output)
+                if self.stream_peephole is not None:
+                    self.peephole_report = self.stream_peephole.report
+            finally:
+                self.stream = None
+                self.stream_peephole = None
+                self.stream_variables = {}
+
+    # the tokens of source, lexed one line at a time (a string literal cannot span lines)
+    def stream_tokens(self, source):
+        for line in source:
+            self.lexer.input(line)
+            yield from iter(self.lexer.token, None)
+
+    # fold, generate and write the code of one top-level statement while streaming
+    def emit_statement(self, statement) -> None:
+        if self.errors:
+            # after a syntax error the rest of the program is only checked
+            return
+        if self.fold:
+            statement = ConstantFolder.fold(statement, {}, set())
+        if self.optimize_loops:
+            # the loop optimizer replaces loops in their parent, so the statement gets one
+            statement = ASTNODE("statement_list", children=[statement])
+            optimizer = LoopOptimizer(self.symbol_table, self.branch_index)
+            optimizer.optimize(statement)
+            self.branch_index = optimizer.branch_index
+            self.loop_report += optimizer.report
+            if self.fold and optimizer.report:
+                statement = ConstantFolder.fold(statement, {}, set())
+        if self.eliminate_dead_code:
+            # later statements are not known yet, so only what is dead on its own goes
+            statement = ASTNODE("statement_list", children=[statement])
+            DeadCodeEliminator.prune(statement)
+        self.stream_variables.update(dict.fromkeys(ASTNODE.variables(statement)))
+        with self.emitter() as emitter:
+            ASTNODE.emit_ast(statement)
+        lines = emitter.lines
+        if self.stream_peephole is not None:
+            lines = self.stream_peephole.optimize(lines)
+        Emitter.write_lines(lines, self.stream)
+
+    # parse source and return its AST.  tokenfunc, when given, supplies already lexed tokens instead of running
+    # the lexer
+    def parse(self, source, tokenfunc=None, debug=None) -> ASTNODE:
+        self.program = None
+        self.branch_index = 0
+        self.symbol_table = {0: {}}
+        self.errors = []
+        self.loop_report = []
+        self.build()
+        self.lexer.lineno = 1
+        try:
+            if tokenfunc is None and self.statistics is not None:
+                # lex the whole source before parsing, so that the two are timed apart
+                self.statistics.source_bytes = len(source)
+                self.lexer.input(source)
+                tokens = self.statistics.time("lex", list, iter(self.lexer.token, None))
+                self.statistics.tokens = len(tokens)
+                tokenfunc = functools.partial(next, iter(tokens), None)
+            if tokenfunc is not None:
+                self.timed("parse", functools.partial(self.parser.parse, tokenfunc=tokenfunc, lexer=self.lexer,
+                                                      debug=debug))
+            else:
+                self.parser.parse(source, lexer=self.lexer, debug=debug)
+        except Exception:
+            # a grammar action that fails while the parser recovers from a syntax error is not worth reporting
+            if not self.errors:
+                raise
+        if self.errors:
+            raise Exception("\n".join(self.errors))
+        if self.program is None:
+            raise Exception("The program is empty.")
+        if self.statistics is not None:
+            self.statistics.parsed_nodes = Statistics.count_nodes(self.program)
+        return self.program
+
+    # generate the assembly for the AST of the last parsed program as a list of lines
+    def generate(self, tree) -> list:
+        promoted = self.timed("promote", VariablePromoter.plan, tree) if self.promote else {}
+        cleared = VariablePromoter.cleared(tree, promoted)
+        if self.backend == "ir":
+            ir = self.timed("ir", IRBuilder.build, tree, self.strength_reduce)
+            lines = self.timed("lowering", MIPSLowering.lower, ir, promoted, cleared)
+            return Emitter.without_comments(lines) if self.strip_comments else lines
+        return self.timed("codegen", self.emit_program, tree, promoted, cleared)
+
+    # the assembly of the stack or registers backend for tree
+    def emit_program(self, tree, promoted: dict, cleared: list) -> list:
+        with self.emitter(promoted) as emitter:
+            ASTNODE.initialize_variables(ASTNODE.variables(tree), promoted)
+            Emitter.emit(".text")
+            ASTNODE.initialize_registers(cleared)
+            ASTNODE.emit_ast(tree)
+            Emitter.emit("li $v0, 10")
+            Emitter.emit("syscall")
+        return emitter.lines
+
+    def optimize(self, lines: list) -> list:
+        if self.peephole is not None:
+            peephole = Peephole(None if self.peephole == "all" else self.peephole)
+            lines = self.timed("peephole", peephole.optimize, lines)
+            self.peephole_report = peephole.report
+        if self.profile:
+            lines, self.profile_labels = Profiler.instrument(lines, not self.strip_comments)
+        if self.statistics is not None:
+            self.statistics.record_lines(lines)
+        return lines
+
+    # number of assembly lines that are instructions, not labels, directives or comments
+    @staticmethod
+    def count_instructions(lines: list) -> int:
+        count = 0
+        for line in lines:
+            text = line.split("#", 1)[0].strip()
+            if text and not text.startswith(".") and ":" not in text:
+                count += 1
+        return count
+
+    # ------------------------------------------------------------------------------------------------------ lexer
+
+    @staticmethod
+    def str_to_num(s):
+        ans = 0
+        try:
+            ans = int(s)
+        except ValueError:
+            ans = float(s)
+
+        return ans
+
+    def t_SQ_STRING(self, t):
+        r"'[^'\\]*(?:\\.[^'\\]*)*'"
+        return t
+
+    def t_DQ_STRING(self, t):
+        r'"[^"\\]*(?:\\.[^"\\]*)*"'
+        return t
+
+    def t_ELLIPSIS(self, t):
+        r"\.\.\."
+        return t
+
+    def t_POWER(self, t):
+        r"\*\*"
+        return t
+
+    def t_NUMBER(self, t):
+        # https://www.regular-expressions.info/floatingpoint.html
+        r'[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?'
+        t.value = Compiler.str_to_num(t.value)  # int(t.value)
+        return t
+
+    def t_DOUBLE_EQ(self, t):
+        r'=='
+        return t
+
+    def t_NOT_EQ(self, t):
+        r'!='
+        return t
+
+    def t_LESS_EQ(self, t):
+        r'<='
+        return t
+
+    def t_GREATER_EQ(self, t):
+        r'>='
+        return t
+
+    def t_PRINT(self, t):
+        'print'
+        return t
+
+    def t_NAME(self, t):
+        r'[a-zA-Z_][a-zA-Z0-9_]*'
+        t.type = Compiler.reserved.get(t.value, 'NAME')    # Check for reserved words
+        return t
+
+    t_ignore = " \t\v\f"
+
+    def t_newline(self, t):
+        r'\n+'
+        t.lexer.lineno += t.value.count("\n")
+
+    def t_error(self, t):
+        self.errors.append("Illegal character '%s' on line %d" % (t.value[0], t.lexer.lineno))
+        t.lexer.skip(1)
+
+    # ----------------------------------------- 2024-02-14, DMW, PARSER
+
+    def p_PROGRAM(self, p):
+        "program : statement_list"
+        self.program = ASTNODE("program", children=[ASTNODE("statement_list", children=p[1])])
+
+    def p_STATEMENT_LIST2(self, p):
+        "statement_list : statement_list statement"  # 2024-02-14, DMW, changed the print grammar to the following
+        # statements are collected in a flat list rather than a left-deep chain of statement_list nodes; while
+        # streaming, a top-level statement (nothing else left on the parser's stack) is emitted instead
+        if self.stream is not None and len(p.stack) == 1:
+            self.emit_statement(p[2])
+        else:
+            p[1].append(p[2])
+        p[0] = p[1]
+
+    def p_STATEMENT_LIST(self, p):
+        "statement_list : statement"  # 2024-02-14, DMW, changed the print grammar to the following
+        if self.stream is not None and len(p.stack) == 1:
+            self.emit_statement(p[1])
+            p[0] = []
+        else:
+            p[0] = [p[1]]
+
+    def p_FOR(self, p):
+        "for : FOR for_assign IN expression statement_block"
+        self.branch_index += 1
+        p[0] = ASTNODE("for", children=[p[4], p[5]], line=p.lineno(1),
+                       data={"var_name": p[2].data["var_name"], "branch_index": self.branch_index})
+
+    def p_WHILE(self, p):
+        "for : WHILE expression statement_block"
+        self.branch_index += 1
+        p[0] = ASTNODE("while", children=[p[2], p[3]], line=p.lineno(1), data={"branch_index": self.branch_index})
+
+    def p_STATEMENT_ASSIGN(self, p):
+        "statement : assign"  # 2024-02-14, DMW, changed the print grammar to the following
+        p[0] = ASTNODE("statement", children=[p[1]])
+
+    def p_LET_ASSIGN(self, p):
+        "assign : LET NAME '=' expression"
+        self.branch_index += 1
+        symbol = MappingProxyType({"var_name": f"{p[2]}_{self.branch_index}", "type": p[4].data["type"]})
+        self.symbol_table[0][p[2]] = symbol
+        p[0] = ASTNODE("assign", children=[p[4]], data=symbol)
+
+    def p_VAR_ASSIGN(self, p):
+        "assign : VAR NAME '=' expression"
+        self.branch_index += 1
+        symbol = MappingProxyType({"var_name": f"{p[2]}_{self.branch_index}", "type": p[4].data["type"]})
+        self.symbol_table[0][p[2]] = symbol
+        p[0] = ASTNODE("assign", children=[p[4]], data=symbol)
+
+    def p_REASSIGN(self, p):
+        "assign : NAME '=' expression"
+        p[0] = ASTNODE("assign", children=[p[3]], data=self.symbol_table[0][p[1]])
+
+    def p_STATEMENT_BLOCK(self, p):
+        "statement_block : '{' statement_list '}'"
+        p[0] = ASTNODE("statement_block", children=[ASTNODE("statement_list", children=p[2])])
+
+    def p_FOR_ASSIGN(self, p):
+        "for_assign : NAME"
+        self.branch_index += 1
+        symbol = MappingProxyType({"var_name": f"{p[1]}_{self.branch_index}", "type": "int"})
+        self.symbol_table[0][p[1]] = symbol
+        p[0] = ASTNODE("for_assign", data=symbol)
+
+    def p_STATEMENT_BLOCK2(self, p):
+        "statement_block : statement"
+        p[0] = p[1]
+
+    def p_STATEMENT_PRINT(self, p):
+        "statement : print"  # 2024-02-14, DMW, changed the print grammar to the following
+        p[0] = p[1]
+
+    def p_STATEMENT_COMPARISON(self, p):
+        "statement : expression"  # 2024-02-14, DMW, changed the print grammar to the following
+        p[0] = ASTNODE("statement", children=[p[1]])
+
+    def p_STATEMENT_FOR(self, p):
+        "statement : for"
+        p[0] = p[1]
+
+    def p_PRINT_STATEMENT(self, p):
+        """print : PRINT '(' print_expression_list ')' """
+        p[0] = ASTNODE("print_list", children=p[3])
+
+    def p_PRINT_STATEMENT2(self, p):
+        """print : PRINT '(' expression ')' """
+        p[0] = ASTNODE("print", children=[p[3]])
+
+    def p_EXPRESSION_INPUT(self, p):
+        "expression : READLINE '(' ')'"  # 2024-02-14, DMW, changed the print grammar to the following
+        self.branch_index += 1
+        p[0] = ASTNODE("input", data=ASTNODE.int_data)
+
+    def p_EXPRESSION_MIN(self, p):
+        "expression : MIN '(' expression ',' expression ')'"  # 2024-02-14, DMW, changed the print grammar to the following
+        self.branch_index += 1
+        p[0] = ASTNODE("min", children=[p[3], p[5]], line=p.lineno(1),
+                       data={"type": "int", "branch_index": self.branch_index})
+
+    def p_EXPRESSION_MAX(self, p):
+        "expression : MAX '(' expression ',' expression ')'"  # 2024-02-14, DMW, changed the print grammar to the following
+        self.branch_index += 1
+        p[0] = ASTNODE("max", children=[p[3], p[5]], line=p.lineno(1),
+                       data={"type": "int", "branch_index": self.branch_index})
+
+    def p_EXPRESSION_ABS(self, p):
+        "expression : ABS '(' expression ')'"  # 2024-02-14, DMW, changed the print grammar to the following
+        self.branch_index += 1
+        p[0] = ASTNODE("abs", children=[p[3]], line=p.lineno(1),
+                       data={"type": "int", "branch_index": self.branch_index})
+
+    def p_EXPRESSION_POWER(self, p):
+        "expression : expression POWER expression"
+        self.branch_index += 1
+        if p[1].data["type"] != "int" or p[3].data["type"] != "int":
+            raise Exception("Invalid types for binary operation.")
+        p[0] = ASTNODE("exponent", data={"type": "int", "branch_index": self.branch_index}, children=[p[1], p[3]],
+                       line=p.lineno(2))
+
+    def p_EXPRESSION_UMINUS(self, p):
+        """expression : '-' expression %prec UMINUS"""
+        if p[2].data["type"] != "int":
+            raise Exception("Invalid type for unary minus operation.")
+        p[0] = ASTNODE("uminus", children=[p[2]], data=ASTNODE.int_data)
+
+    def p_EXPRESSION_BINOP(self, p):
+        '''expression : expression '+' expression
+                  | expression '-' expression
+                  | expression '*' expression
+                  | expression '/' expression
+                  | expression '%' expression'''
+        if p[1].data["type"] != "int" or p[3].data["type"] != "int":
+            raise Exception("Invalid types for binary operations.")
+        p[0] = ASTNODE("binop", value=p[2], children=[p[1], p[3]], data=ASTNODE.int_data)
+
+    def p_EXPRESSION_RANGE(self, p):
+        "expression : expression ELLIPSIS expression"
+        if p[1].data["type"] != "int" or p[3].data["type"] != "int":
+            raise Exception("Invalid types for range operation.")
+        p[0] = ASTNODE("range", value=p[2], children=[p[1], p[3]])
+
+    def p_EXPRESSION_NUM(self, p):
+        "expression : NUMBER"
+        try:
+            int(p[1])
+        except Exception as e:
+            raise Exception
+
+        p[0] = ASTNODE("number", value=p[1], data=ASTNODE.int_data)
+
+    def p_EXPRESSION_NAME(self, p):
+        "expression : NAME"
+        # every use of a variable shares the read-only symbol table entry as its data
+        p[0] = ASTNODE("name", data=self.symbol_table[0][p[1]])
+
+    @staticmethod
+    def remove_quotes(s):
+        return s[1:-1]
+
+    def p_EXPRESSION_DQ_STRING(self, p):
+        "expression : DQ_STRING"
+        p[0] = ASTNODE("string", value=Compiler.remove_quotes(p[1]), data=ASTNODE.string_data)
+
+    def p_EXPRESSION_SQ_STRING(self, p):
+        "expression : SQ_STRING"
+        p[0] = ASTNODE("string", value=Compiler.remove_quotes(p[1]), data=ASTNODE.string_data)
+
+    def p_EXPRESSION_GROUP(self, p):
+        "expression : '(' expression ')'"
+        p[0] = p[2]
+
+    def p_EXPRESSION_COMPARE(self, p):
+        """expression : expression DOUBLE_EQ expression
+                 | expression NOT_EQ expression
+                 | expression '>' expression
+                 | expression '<' expression
+                 | expression LESS_EQ expression
+                 | expression GREATER_EQ expression
+                   """
+        self.branch_index += 1
+        if p[1].data["type"] != p[3].data["type"]:
+            raise Exception("Incompatible types for comparison operation.")
+        p[0] = ASTNODE("comparison", value=p[2], children=[p[1], p[3]], line=p.lineno(2),
+                       data={"type": "int", "branch_index": self.branch_index})
+
+    def p_IF_CONDITIONAL(self, p):
+        """statement : IF  expression '{' statement_block '}'"""
+        self.branch_index += 1
+        p[0] = ASTNODE("if", children=[p[2], p[4]], line=p.lineno(1), data={"branch_index": self.branch_index})
+
+    def p_IF_ELSE_CONDITIONAL(self, p):
+        """statement : IF expression '{' statement '}' ELSE '{' statement_block '}'"""
+        self.branch_index += 1
+        p[0] = ASTNODE("ifelse", children=[p[2], p[4], p[8]], line=p.lineno(1),
+                       data={"branch_index": self.branch_index})
+
+    def p_EMPTY_PRINT_LIST(self, p):
+        """print_expression_list : """
+        p[0] = []
+
+    def p_PRINT_EXPRESSION_LIST(self, p):
+        """print_expression_list : print_expression_list print_expression"""
+        p[1].append(p[2])
+        p[0] = p[1]
+
+    def p_PRINT_EXPRESSION_LIST2(self, p):
+        """print_expression_list : print_expression"""
+        p[0] = [p[1]]
+
+    def p_PRINT_EXPRESSION(self, p):
+        """print_expression : expression ',' """
+        p[0] = ASTNODE("print", children=[p[1]])
+
+    def p_error(self, p):
+        if p:
+            self.errors.append("Syntax error at '%s' on line %d" % (p.value, p.lineno))
+        else:
+            self.errors.append("Syntax error at EOF")
@@ -0,0 +1,192 @@
+# Purpose:  Constant folding and propagation over the AST
+# History:
+#           2026-10-18, negative exponents fold to 1; x ** 1 becomes x and x ** 0 becomes 1
+#           2026-10-18, fold, count_assignments and is_pure walk the tree with explicit stacks instead of recursion
+#           2026-10-18, created; replaces the folding that p_EXPRESSION_BINOP did while parsing
+#
+# Arithmetic follows the generated MIPS code: values are 32-bit two's complement and wrap on overflow, division
+# truncates toward zero and the remainder takes the sign of the dividend.  Division by zero is left for run
+# time, and a negative exponent gives 1, like x ** 0.
+#
+# A variable that is assigned exactly once (every let, and any var that is never reassigned) and whose value
+# folds to a number is replaced by that number wherever its assignment is known to have run: later in the same
+# block, or inside blocks nested after it.
+
+from ASTNODE import ASTNODE
+
+
+class ConstantFolder:
+
+    statements = ("program", "statement_list", "statement", "statement_block", "print_list", "print", "assign",
+                  "range", "empty_list")
+    blocks = ("for", "while", "if", "ifelse")
+
+    @staticmethod
+    def wrap(value: int) -> int:
+        return ((value + 2 ** 31) % 2 ** 32) - 2 ** 31
+
+    @staticmethod
+    def number(value: int) -> ASTNODE:
+        return ASTNODE("number", value=value, data=ASTNODE.int_data)
+
+    @staticmethod
+    def is_number(_node) -> bool:
+        return _node.name == "number" and isinstance(_node.value, int)
+
+    # True when evaluating _node cannot read input, so dropping it does not change the program
+    @staticmethod
+    def is_pure(_node) -> bool:
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name == "input":
+                return False
+            work.extend(node.children)
+        return True
+
+    # fold the whole program in place and return it
+    @staticmethod
+    def fold_program(program) -> ASTNODE:
+        assignments = {}
+        ConstantFolder.count_assignments(program, assignments)
+        single = {var_name for var_name, count in assignments.items() if count == 1}
+        return ConstantFolder.fold(program, {}, single)
+
+    @staticmethod
+    def count_assignments(_node, assignments: dict) -> None:
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name == "assign":
+                var_name = node.data["var_name"]
+                assignments[var_name] = assignments.get(var_name, 0) + 1
+            elif node.name == "for":
+                # the loop variable changes every iteration
+                assignments[node.data["var_name"]] = 2
+            work.extend(node.children)
+
+    # fold the subtree at _node; constants maps variables to the values known at this point of the program.  The
+    # tree is walked with an explicit stack of [node, constants, folded children] frames, children left to right
+    @staticmethod
+    def fold(_node, constants: dict, single: set) -> ASTNODE:
+        frames = [[_node, constants, []]]
+        while True:
+            node, scope, folded = frames[-1]
+            children = node.children
+            if len(folded) < len(children):
+                # whatever a nested block defines is not known once the block is left
+                frames.append([children[len(folded)], dict(scope) if node.name in ConstantFolder.blocks else scope,
+                               []])
+                continue
+            frames.pop()
+            result = ConstantFolder.finish(node, scope, folded, single)
+            if not frames:
+                return result
+            frames[-1][2].append(result)
+
+    # the folded replacement of _node once its children have been folded
+    @staticmethod
+    def finish(_node, constants: dict, folded: list, single: set) -> ASTNODE:
+        if folded:
+            _node.children = folded
+        if _node.name in ConstantFolder.blocks:
+            return _node
+        if _node.name in ConstantFolder.statements:
+            if _node.name == "assign":
+                var_name = _node.data["var_name"]
+                if var_name in single and ConstantFolder.is_number(_node.children[0]):
+                    constants[var_name] = _node.children[0].value
+            return _node
+
+        if _node.name == "name":
+            var_name = _node.data["var_name"]
+            if var_name in constants:
+                return ConstantFolder.number(constants[var_name])
+            return _node
+
+        if _node.name == "uminus" and ConstantFolder.is_number(_node.children[0]):
+            return ConstantFolder.number(ConstantFolder.wrap(-_node.children[0].value))
+        if _node.name == "abs" and ConstantFolder.is_number(_node.children[0]):
+            return ConstantFolder.number(ConstantFolder.wrap(abs(_node.children[0].value)))
+        if len(_node.children) != 2:
+            return _node
+
+        left, right = _node.children
+        if ConstantFolder.is_number(left) and ConstantFolder.is_number(right):
+            value = ConstantFolder.evaluate(_node.name, _node.value, left.value, right.value)
+            if value is not None:
+                return ConstantFolder.number(value)
+        if _node.name == "binop":
+            return ConstantFolder.simplify(_node)
+        if _node.name == "exponent" and ConstantFolder.is_number(right):
+            if right.value == 1:
+                return left
+            if right.value <= 0 and ConstantFolder.is_pure(left):
+                return ConstantFolder.number(1)
+        return _node
+
+    # value of a binary node with constant operands, or None when it has to be left for run time
+    @staticmethod
+    def evaluate(kind: str, operator, left: int, right: int):
+        if kind == "binop":
+            if operator == "+":
+                return ConstantFolder.wrap(left + right)
+            if operator == "-":
+                return ConstantFolder.wrap(left - right)
+            if operator == "*":
+                return ConstantFolder.wrap(left * right)
+            if right == 0:
+                return None
+            quotient = abs(left) // abs(right)
+            if (left < 0) != (right < 0):
+                quotient = -quotient
+            if operator == "/":
+                return ConstantFolder.wrap(quotient)
+            if operator == "%":
+                return ConstantFolder.wrap(left - right * quotient)
+        elif kind == "comparison":
+            return int({"==": left == right, "!=": left != right, "<": left < right, "<=": left <= right,
+                        ">": left > right, ">=": left >= right}[operator])
+        elif kind == "min":
+            return min(left, right)
+        elif kind == "max":
+            return max(left, right)
+        elif kind == "exponent":
+            return ConstantFolder.wrap(pow(left, max(right, 0), 2 ** 32))
+        return None
+
+    # algebraic identities and regrouping of constants in + and - chains
+    @staticmethod
+    def simplify(_node) -> ASTNODE:
+        left, right = _node.children
+        operator = _node.value
+        if ConstantFolder.is_number(right):
+            if right.value == 0 and operator in ("+", "-"):
+                return left
+            if right.value == 1 and operator in ("*", "/"):
+                return left
+            if right.value == 0 and operator == "*" and ConstantFolder.is_pure(left):
+                return ConstantFolder.number(0)
+        if ConstantFolder.is_number(left):
+            if left.value == 0 and operator == "+":
+                return right
+            if left.value == 1 and operator == "*":
+                return right
+            if left.value == 0 and operator == "*" and ConstantFolder.is_pure(right):
+                return ConstantFolder.number(0)
+
+        # (x + c1) + c2 -> x + (c1 + c2), with subtraction treated as adding the negated constant
+        if operator in ("+", "-") and ConstantFolder.is_number(right) and left.name == "binop" \
+                and left.value in ("+", "-") and ConstantFolder.is_number(left.children[1]):
+            inner = left.children[1].value if left.value == "+" else -left.children[1].value
+            outer = right.value if operator == "+" else -right.value
+            total = ConstantFolder.wrap(inner + outer)
+            operand = left.children[0]
+            if total == 0:
+                return operand
+            if total < 0 and total != -2 ** 31:
+                return ASTNODE("binop", value="-", children=[operand, ConstantFolder.number(-total)],
+                               data=ASTNODE.int_data)
+            return ASTNODE("binop", value="+", children=[operand, ConstantFolder.number(total)],
+                           data=ASTNODE.int_data)
+        return _node
@@ -0,0 +1,197 @@
+# Purpose:  Dead code, dead store and unused expression elimination over the AST
+# History:
+#           2026-10-18, created; branches decided by a constant condition, expression statements and assignments
+#                       whose value is never read are removed before code generation
+#
+# An if or ifelse whose condition folded to a number keeps only the branch that number selects (only 1 selects
+# the first branch, as in the generated code), and a while whose condition is 0 disappears.  An expression
+# statement computes a value nobody reads, so only the readLine() calls in it are kept, left to right.
+#
+# Dead stores are found with liveness over a control flow graph of the statements: an assignment is dead when
+# no path from it reads the variable before the next assignment or the end of the program.  The analysis is
+# strong liveness - an assignment only makes the variables it reads live when its own variable is live - so a
+# chain of assignments that only feed each other and never reach a print goes away in one pass.  Like an
+# expression statement, a dead assignment keeps its readLine() calls.  A for loop assigns its variable on entry
+# and after every iteration.
+#
+# Variables that are no longer mentioned anywhere lose their .data word, since .data is emitted from the
+# variables the tree references (ASTNODE.variables).
+
+from ASTNODE import ASTNODE
+
+
+class FlowNode:
+    __slots__ = ("uses", "defs", "successors", "assign", "live_in", "live_out")
+
+    def __init__(self) -> None:
+        self.uses = set()
+        self.defs = set()
+        self.successors = []
+        # the assign node this is the flow node of, if any
+        self.assign = None
+        self.live_in = set()
+        self.live_out = set()
+
+
+class DeadCodeEliminator:
+
+    blocks = ("program", "statement_list", "statement_block", "print_list")
+
+    # remove the dead code of the whole program in place and return it
+    @staticmethod
+    def eliminate(program) -> ASTNODE:
+        DeadCodeEliminator.prune(program)
+        nodes = DeadCodeEliminator.flow_graph(program)
+        DeadCodeEliminator.liveness(nodes)
+        for node in nodes:
+            if node.assign is not None and node.assign.data["var_name"] not in node.live_out:
+                DeadCodeEliminator.discard(node.assign)
+        return program
+
+    # remove the branches constant conditions never take and the expression statements below _node, which works
+    # on one statement at a time and so also while streaming
+    @staticmethod
+    def prune(_node) -> None:
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name in ("if", "ifelse", "while") and DeadCodeEliminator.is_constant(node.children[0]):
+                value = node.children[0].value
+                if node.name == "while":
+                    # a constant non-zero condition loops forever, which is left as it is
+                    if value == 0:
+                        DeadCodeEliminator.replace(node, [])
+                        continue
+                elif value == 1:
+                    DeadCodeEliminator.replace(node, [node.children[1]])
+                    work.append(node.children[1])
+                    continue
+                else:
+                    kept = [node.children[2]] if node.name == "ifelse" else []
+                    DeadCodeEliminator.replace(node, kept)
+                    work.extend(kept)
+                    continue
+            if node.name == "statement" and len(node.children) == 1 and node.children[0].name != "assign":
+                DeadCodeEliminator.discard(node.children[0])
+                continue
+            work.extend(node.children)
+
+    @staticmethod
+    def is_constant(_node) -> bool:
+        return _node.name == "number" and isinstance(_node.value, int)
+
+    # put the statements of replacement where _node is in the tree
+    @staticmethod
+    def replace(_node, replacement: list) -> None:
+        parent = _node.parent
+        statements = ASTNODE("statement_list")
+        parent.children = [statements if child is _node else child for child in parent.children]
+        statements.children = replacement
+
+    # remove the assignment or expression statement of _node, keeping its readLine() calls in order
+    @staticmethod
+    def discard(_node) -> None:
+        if _node.parent is not None and _node.parent.name == "statement" and len(_node.parent.children) == 1:
+            _node = _node.parent
+        inputs = []
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name == "input":
+                inputs.append(ASTNODE("statement", children=[ASTNODE("input", data=ASTNODE.int_data)]))
+            work.extend(reversed(node.children))
+        DeadCodeEliminator.replace(_node, inputs)
+
+    # the variables the expression _node reads
+    @staticmethod
+    def reads(_node) -> set:
+        names = set()
+        work = [_node]
+        while work:
+            node = work.pop()
+            if node.name == "name":
+                names.add(node.data["var_name"])
+            work.extend(node.children)
+        return names
+
+    # the flow nodes of the statements of program, entry first.  Every statement gets its entry node before it
+    # is taken apart, so the graph is built with a work stack of (statement, entry, successor) instead of
+    # recursion
+    @staticmethod
+    def flow_graph(program) -> list:
+        nodes = [FlowNode(), FlowNode()]
+        entry, exit_node = nodes
+        work = [(program, entry, exit_node)]
+        while work:
+            statement, node, following = work.pop()
+            name = statement.name
+            if name in DeadCodeEliminator.blocks or (name == "statement" and statement.children and
+                                                     statement.children[0].name == "assign"):
+                entries = [FlowNode() for _ in statement.children]
+                nodes += entries
+                node.successors = [entries[0] if entries else following]
+                for index, child in enumerate(statement.children):
+                    work.append((child, entries[index], entries[index + 1] if index + 1 < len(entries)
+                                 else following))
+            elif name == "assign":
+                node.assign = statement
+                node.defs = {statement.data["var_name"]}
+                node.uses = DeadCodeEliminator.reads(statement.children[0])
+                node.successors = [following]
+            elif name in ("if", "ifelse"):
+                node.uses = DeadCodeEliminator.reads(statement.children[0])
+                branches = [FlowNode() for _ in statement.children[1:]]
+                nodes += branches
+                node.successors = branches if name == "ifelse" else branches + [following]
+                for branch, child in zip(branches, statement.children[1:]):
+                    work.append((child, branch, following))
+            elif name == "while":
+                node.uses = DeadCodeEliminator.reads(statement.children[0])
+                body = FlowNode()
+                nodes.append(body)
+                node.successors = [body, following]
+                work.append((statement.children[1], body, node))
+            elif name == "for":
+                # entry stores the first value of the counter, step the next one after every iteration
+                var_name = statement.data["var_name"]
+                node.uses = DeadCodeEliminator.reads(statement.children[0])
+                node.defs = {var_name}
+                body = FlowNode()
+                step = FlowNode()
+                nodes += [body, step]
+                step.defs = {var_name}
+                step.successors = [body, following]
+                node.successors = [body]
+                work.append((statement.children[1], body, step))
+            else:
+                # print, an expression statement, or a node that generates nothing
+                node.uses = DeadCodeEliminator.reads(statement)
+                node.successors = [following]
+        return nodes
+
+    # strong liveness: live_out is what any successor needs, live_in what this node reads (an assignment only
+    # when its variable is live afterwards) plus what passes through it
+    @staticmethod
+    def liveness(nodes: list) -> None:
+        predecessors = {id(node): [] for node in nodes}
+        for node in nodes:
+            for successor in node.successors:
+                predecessors[id(successor)].append(node)
+        work = list(nodes)
+        pending = {id(node) for node in nodes}
+        while work:
+            node = work.pop()
+            pending.discard(id(node))
+            live_out = set()
+            for successor in node.successors:
+                live_out |= successor.live_in
+            live_in = live_out - node.defs
+            if node.assign is None or node.defs & live_out:
+                live_in |= node.uses
+            node.live_out = live_out
+            if live_in != node.live_in:
+                node.live_in = live_in
+                for predecessor in predecessors[id(node)]:
+                    if id(predecessor) not in pending:
+                        pending.add(id(predecessor))
+                        work.append(predecessor)
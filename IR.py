@@ -0,0 +1,395 @@
+# Purpose:  Three-address intermediate representation between the AST and MIPS emission
+# History:
+#           2026-10-18, IRBuilder walks the tree with an explicit work stack instead of recursing, so deep nesting and
+#                       long expressions no longer hit Python's recursion limit
+#           2026-10-18, a for loop whose body does not assign its variable reads it from the counter and stores it
+#                       once, after the loop
+#           2026-10-18, a comparison that decides an if, ifelse or while becomes one conditional branch
+#           2026-10-18, build(strength_reduce=True) turns * / % by a constant into StrengthReduction plans; mulhi
+#           2026-10-18, and, sll, srl and sra with an immediate shift or mask; ** uses square-and-multiply
+#           2026-10-18, created; IRBuilder lowers an ASTNODE tree to a flat list of IRInstruction objects that
+#                       optimization passes can rewrite before MIPSLowering turns them into assembly
+#
+# Every instruction is an opcode, an optional destination and a tuple of operands.  Operands are virtual
+# registers (strings "v1", "v2", ...), integer immediates, or - for load/store/label/jump - a variable or label
+# name.  Virtual registers are unlimited; MIPSLowering maps them onto physical registers.
+#
+#   li     v1, 5              v1 = 5
+#   load   v1, x_2            v1 = x_2
+#   store  x_2, v1            x_2 = v1
+#   input  v1                 v1 = readLine()
+#   print  v1                 print(v1)
+#   add    v3, v1, v2         also sub, mul, div, rem and the comparisons seq, sne, slt, sle, sgt, sge
+#   sll    v2, v1, 3          also srl, sra and and; the second operand is always an immediate
+#   mulhi  v2, v1, 5          high word of the 64-bit product
+#   neg    v2, v1             also abs and move
+#   label  loop_3
+#   j      loop_3
+#   beq    v1, 0, continue_3  also bne, blt, ble, bgt, bge
+
+from ASTNODE import ASTNODE
+from StrengthReduction import StrengthReduction
+
+
+class IRInstruction:
+    __slots__ = ("op", "dest", "args")
+
+    def __init__(self, op: str, dest=None, args=()) -> None:
+        self.op = op
+        self.dest = dest
+        self.args = tuple(args)
+
+    # virtual registers read by this instruction
+    def uses(self) -> list:
+        if self.op in ("load", "label", "j"):
+            return []
+        if self.op in IRProgram.branches:
+            return [arg for arg in self.args[:2] if IRInstruction.is_vreg(arg)]
+        return [arg for arg in self.args if IRInstruction.is_vreg(arg)]
+
+    @staticmethod
+    def is_vreg(operand) -> bool:
+        return isinstance(operand, str) and operand.startswith("v") and operand[1:].isdigit()
+
+    def __str__(self) -> str:
+        if self.op == "label":
+            return "{}:".format(self.args[0])
+        operands = ([self.dest] if self.dest is not None else []) + list(self.args)
+        return "    {} {}".format(self.op, ", ".join(str(operand) for operand in operands)).rstrip()
+
+
+class BasicBlock:
+    __slots__ = ("label", "instructions", "successors")
+
+    def __init__(self, label=None) -> None:
+        self.label = label
+        self.instructions = []
+        self.successors = []
+
+
+class IRProgram:
+
+    binary = ("add", "sub", "mul", "div", "rem", "seq", "sne", "slt", "sle", "sgt", "sge", "and", "sll", "srl", "sra",
+              "mulhi")
+    unary = ("neg", "abs", "move")
+    branches = ("beq", "bne", "blt", "ble", "bgt", "bge")
+
+    def __init__(self) -> None:
+        self.instructions = []
+        self.vreg_count = 0
+        # build with StrengthReduction plans for multiplication, division and remainder by constants
+        self.strength_reduce = False
+        # variable name -> the counter of the enclosing for loop that holds it while IRBuilder builds the loop
+        self.induction = {}
+        # the virtual registers holding the values of the expressions IRBuilder has built and not used yet
+        self.values = []
+
+    def new_vreg(self) -> str:
+        self.vreg_count += 1
+        return "v{}".format(self.vreg_count)
+
+    def append(self, op: str, dest=None, *args) -> None:
+        self.instructions.append(IRInstruction(op, dest, args))
+
+    # variables in order of first appearance; these become the .data section
+    def variables(self) -> list:
+        seen = {}
+        for instruction in self.instructions:
+            if instruction.op == "load":
+                seen.setdefault(instruction.args[0])
+            elif instruction.op == "store":
+                seen.setdefault(instruction.dest)
+        return list(seen)
+
+    # split the instruction list into basic blocks; a block starts at a label or after a branch or jump
+    def basic_blocks(self) -> list:
+        blocks = [BasicBlock()]
+        for instruction in self.instructions:
+            if instruction.op == "label":
+                if blocks[-1].instructions or blocks[-1].label is not None:
+                    blocks.append(BasicBlock())
+                blocks[-1].label = instruction.args[0]
+            blocks[-1].instructions.append(instruction)
+            if instruction.op == "j" or instruction.op in IRProgram.branches:
+                blocks.append(BasicBlock())
+        if not blocks[-1].instructions and len(blocks) > 1:
+            blocks.pop()
+
+        by_label = {block.label: block for block in blocks if block.label is not None}
+        for index, block in enumerate(blocks):
+            last = block.instructions[-1] if block.instructions else None
+            following = blocks[index + 1] if index + 1 < len(blocks) else None
+            if last is not None and last.op == "j":
+                block.successors = [by_label[last.args[0]]]
+            elif last is not None and last.op in IRProgram.branches:
+                block.successors = [by_label[last.args[2]]] + ([following] if following is not None else [])
+            elif following is not None:
+                block.successors = [following]
+        return blocks
+
+    def __str__(self) -> str:
+        return "\n".join(str(instruction) for instruction in self.instructions)
+
+
+class IRBuilder:
+
+    arithmetic = {"+": "add", "-": "sub", "*": "mul", "/": "div", "%": "rem"}
+    comparisons = {"==": "seq", "!=": "sne", "<": "slt", "<=": "sle", ">": "sgt", ">=": "sge"}
+    branches = {"==": "beq", "!=": "bne", "<": "blt", "<=": "ble", ">": "bgt", ">=": "bge"}
+    opposites = {"==": "!=", "!=": "==", "<": ">=", "<=": ">", ">": "<=", ">=": "<"}
+
+    # lower the tree rooted at _node.  Like ASTNODE.emit_ast, the tree is walked with an explicit work stack
+    # instead of recursion, so neither deep nesting nor long expressions run into Python's recursion limit: a work
+    # item is a (function, arguments...) tuple that appends instructions when it is called and may return more
+    # items, which run first to last before the rest.  An expression leaves the virtual register holding its value
+    # on ir.values for the item that uses it
+    @staticmethod
+    def build(_node, strength_reduce: bool = False) -> IRProgram:
+        ir = IRProgram()
+        ir.strength_reduce = strength_reduce
+        work = [(IRBuilder.statement, _node, ir)]
+        while work:
+            item = work.pop()
+            items = item[0](*item[1:])
+            if items:
+                items.reverse()
+                work.extend(items)
+        return ir
+
+    # the work items of a statement
+    @staticmethod
+    def statement(_node, ir: IRProgram) -> list:
+        if _node.name in ("program", "statement_list", "statement", "statement_block", "print_list"):
+            return [(IRBuilder.statement, child, ir) for child in _node.children]
+        elif _node.name == "empty_list":
+            return []
+        elif _node.name == "assign":
+            return [(IRBuilder.expression, _node.children[0], ir), (IRBuilder.use, "store", _node.data["var_name"], ir)]
+        elif _node.name == "print":
+            return [(IRBuilder.expression, _node.children[0], ir), (IRBuilder.use, "print", None, ir)]
+        elif _node.name == "while":
+            branch_index = _node.data["branch_index"]
+            branch = IRBuilder.branch_items(_node.children[0], False, f"continue_{branch_index}", ir)
+            if branch is None:
+                branch = [(IRBuilder.expression, _node.children[0], ir),
+                          (IRBuilder.branch, "beq", 0, f"continue_{branch_index}", ir)]
+            return [(ir.append, "label", None, f"loop_{branch_index}"),
+                    *branch,
+                    (IRBuilder.statement, _node.children[1], ir),
+                    (ir.append, "j", None, f"loop_{branch_index}"),
+                    (ir.append, "label", None, f"continue_{branch_index}")]
+        elif _node.name == "for":
+            start, end = _node.children[0].children
+            return [(IRBuilder.expression, start, ir), (IRBuilder.expression, end, ir), (IRBuilder.loop, _node, ir)]
+        elif _node.name == "if":
+            branch_index = _node.data["branch_index"]
+            branch = IRBuilder.branch_items(_node.children[0], False, f"continue_{branch_index}", ir)
+            if branch is None:
+                # like ASTNODE.emit_ast, only a condition equal to 1 selects the first branch
+                branch = [(IRBuilder.expression, _node.children[0], ir),
+                          (IRBuilder.branch, "bne", 1, f"continue_{branch_index}", ir)]
+            return [*branch,
+                    (IRBuilder.statement, _node.children[1], ir),
+                    (ir.append, "label", None, f"continue_{branch_index}")]
+        elif _node.name == "ifelse":
+            branch_index = _node.data["branch_index"]
+            branch = IRBuilder.branch_items(_node.children[0], False, f"false_{branch_index}", ir)
+            if branch is None:
+                branch = [(IRBuilder.expression, _node.children[0], ir),
+                          (IRBuilder.branch, "bne", 1, f"false_{branch_index}", ir)]
+            return [*branch,
+                    (IRBuilder.statement, _node.children[1], ir),
+                    (ir.append, "j", None, f"continue_{branch_index}"),
+                    (ir.append, "label", None, f"false_{branch_index}"),
+                    (IRBuilder.statement, _node.children[2], ir),
+                    (ir.append, "label", None, f"continue_{branch_index}")]
+        # an expression used as a statement is evaluated for its side effects only
+        return [(IRBuilder.expression, _node, ir), (IRBuilder.discard, ir)]
+
+    # work item after the start and end of the for loop _node: the loop itself
+    @staticmethod
+    def loop(_node, ir: IRProgram) -> list:
+        # same shape as ASTNODE.emit_ast: the body runs once before the bound is tested
+        branch_index = _node.data["branch_index"]
+        var_name = _node.data["var_name"]
+        bound = ir.values.pop()
+        counter = ir.values.pop()
+        if ASTNODE.assigns(_node.children[1], var_name):
+            return [(ir.append, "store", var_name, counter),
+                    (ir.append, "label", None, f"loop_{branch_index}"),
+                    (IRBuilder.statement, _node.children[1], ir),
+                    (ir.append, "add", counter, counter, 1),
+                    (ir.append, "store", var_name, counter),
+                    (ir.append, "bge", None, bound, counter, f"loop_{branch_index}")]
+        # the body reads the variable from the counter, and memory is written once the loop is done
+        return [(IRBuilder.induction, var_name, counter, ir),
+                (ir.append, "label", None, f"loop_{branch_index}"),
+                (IRBuilder.statement, _node.children[1], ir),
+                (ir.append, "add", counter, counter, 1),
+                (ir.append, "bge", None, bound, counter, f"loop_{branch_index}"),
+                (IRBuilder.induction, var_name, None, ir),
+                (ir.append, "store", var_name, counter)]
+
+    # work item: reads of var_name come from counter from here on, or from memory again when counter is None
+    @staticmethod
+    def induction(var_name: str, counter, ir: IRProgram) -> None:
+        if counter is None:
+            del ir.induction[var_name]
+        else:
+            ir.induction[var_name] = counter
+
+    # work item: drop the value of the expression before it
+    @staticmethod
+    def discard(ir: IRProgram) -> None:
+        ir.values.pop()
+
+    # work item: the instruction op with destination dest whose operand is the value of the expression before it
+    @staticmethod
+    def use(op: str, dest, ir: IRProgram) -> None:
+        ir.append(op, dest, ir.values.pop())
+
+    # when condition is a comparison, the work items that branch to label when it is (when=True) or is not true,
+    # comparing its operands directly; otherwise None
+    @staticmethod
+    def branch_items(condition, when: bool, label: str, ir: IRProgram):
+        if condition.name != "comparison":
+            return None
+        operator = condition.value if when else IRBuilder.opposites[condition.value]
+        left, right = condition.children
+        if right.name == "number" and isinstance(right.value, int):
+            return [(IRBuilder.expression, left, ir), (IRBuilder.branch, IRBuilder.branches[operator], right.value,
+                                                      label, ir)]
+        return [(IRBuilder.expression, left, ir), (IRBuilder.expression, right, ir),
+                (IRBuilder.branch, IRBuilder.branches[operator], None, label, ir)]
+
+    # work item: the branch op to label comparing the value of the expression before it with right, an immediate;
+    # when right is None, the two values of the expressions before it are compared
+    @staticmethod
+    def branch(op: str, right, label: str, ir: IRProgram) -> None:
+        if right is None:
+            right = ir.values.pop()
+        ir.append(op, None, ir.values.pop(), right, label)
+
+    # work item after the operand of a StrengthReduction plan: the plan, with a virtual register for each symbolic
+    # operand
+    @staticmethod
+    def reduced(plan: list, ir: IRProgram) -> None:
+        vregs = {"x": ir.values.pop()}
+        for name in StrengthReduction.temporaries(plan) + ["r"]:
+            vregs[name] = ir.new_vreg()
+        for operation in plan:
+            args = [vregs[arg] if isinstance(arg, str) else arg for arg in operation[2:]]
+            ir.append(operation[0], vregs[operation[1]], *args)
+        ir.values.append(vregs["r"])
+
+    # the work items of the expression _node; the instructions of a leaf are appended at once
+    @staticmethod
+    def expression(_node, ir: IRProgram) -> list:
+        if _node.name == "number":
+            dest = ir.new_vreg()
+            ir.append("li", dest, _node.value)
+        elif _node.name == "name":
+            dest = ir.new_vreg()
+            if _node.data["var_name"] in ir.induction:
+                ir.append("move", dest, ir.induction[_node.data["var_name"]])
+            else:
+                ir.append("load", dest, _node.data["var_name"])
+        elif _node.name == "input":
+            dest = ir.new_vreg()
+            ir.append("input", dest)
+        elif _node.name in ("uminus", "abs"):
+            return [(IRBuilder.expression, _node.children[0], ir),
+                    (IRBuilder.operation, "neg" if _node.name == "uminus" else "abs", 1, ir)]
+        elif _node.name in ("binop", "comparison"):
+            reduction = StrengthReduction.reduce(_node) if ir.strength_reduce else None
+            if reduction is not None:
+                return [(IRBuilder.expression, reduction[0], ir), (IRBuilder.reduced, reduction[1], ir)]
+            if _node.name == "binop":
+                op = IRBuilder.arithmetic[_node.value]
+            else:
+                op = IRBuilder.comparisons[_node.value]
+            return [(IRBuilder.expression, _node.children[0], ir), (IRBuilder.expression, _node.children[1], ir),
+                    (IRBuilder.operation, op, 2, ir)]
+        elif _node.name in ("min", "max"):
+            return [(IRBuilder.expression, _node.children[0], ir), (IRBuilder.expression, _node.children[1], ir),
+                    (IRBuilder.extreme, _node, ir)]
+        elif _node.name == "exponent":
+            # the result's register is numbered after the base's registers and before the exponent's
+            items = [(IRBuilder.expression, _node.children[0], ir), (IRBuilder.reserve, ir)]
+            if not IRBuilder.constant_exponent(_node):
+                items.append((IRBuilder.expression, _node.children[1], ir))
+            return items + [(IRBuilder.power, _node, ir)]
+        else:
+            raise Exception("Cannot translate node '{}' to IR.".format(_node.name))
+        ir.values.append(dest)
+        return []
+
+    # work item: op applied to the values of the count expressions before it, into a new virtual register
+    @staticmethod
+    def operation(op: str, count: int, ir: IRProgram) -> None:
+        args = ir.values[-count:]
+        del ir.values[-count:]
+        dest = ir.new_vreg()
+        ir.append(op, dest, *args)
+        ir.values.append(dest)
+
+    # work item after the two operands of the min or max _node
+    @staticmethod
+    def extreme(_node, ir: IRProgram) -> None:
+        branch_index = _node.data["branch_index"]
+        right = ir.values.pop()
+        left = ir.values.pop()
+        dest = ir.new_vreg()
+        ir.append("move", dest, left)
+        ir.append("ble" if _node.name == "min" else "bge", None, dest, right, f"continue_{branch_index}")
+        ir.append("move", dest, right)
+        ir.append("label", None, f"continue_{branch_index}")
+        ir.values.append(dest)
+
+    # work item: a new virtual register for a value that is still to be computed
+    @staticmethod
+    def reserve(ir: IRProgram) -> None:
+        ir.values.append(ir.new_vreg())
+
+    @staticmethod
+    def constant_exponent(_node) -> bool:
+        exponent = _node.children[1]
+        return exponent.name == "number" and isinstance(exponent.value, int)
+
+    # work item after the base, the result's register and (unless it is constant) the exponent of the exponent
+    # _node: the power
+    @staticmethod
+    def power(_node, ir: IRProgram) -> None:
+        # same code as ASTNODE.emit_ast: a squaring chain for a constant exponent, square-and-multiply otherwise
+        branch_index = _node.data["branch_index"]
+        if IRBuilder.constant_exponent(_node):
+            dest = ir.values.pop()
+            base = ir.values.pop()
+            ir.values.append(dest)
+            constant = _node.children[1].value
+            if constant <= 0:
+                ir.append("li", dest, 1)
+                return
+            ir.append("move", dest, base)
+            for bit in bin(constant)[3:]:
+                ir.append("mul", dest, dest, dest)
+                if bit == "1":
+                    ir.append("mul", dest, dest, base)
+            return
+        exponent = ir.values.pop()
+        dest = ir.values.pop()
+        base = ir.values.pop()
+        ir.values.append(dest)
+        bit = ir.new_vreg()
+        ir.append("li", dest, 1)
+        ir.append("ble", None, exponent, 0, f"continue_{branch_index}")
+        ir.append("label", None, f"loop_{branch_index}")
+        ir.append("and", bit, exponent, 1)
+        ir.append("beq", None, bit, 0, f"square_{branch_index}")
+        ir.append("mul", dest, dest, base)
+        ir.append("label", None, f"square_{branch_index}")
+        ir.append("srl", exponent, exponent, 1)
+        ir.append("beq", None, exponent, 0, f"continue_{branch_index}")
+        ir.append("mul", base, base, base)
+        ir.append("j", None, f"loop_{branch_index}")
+        ir.append("label", None, f"continue_{branch_index}")
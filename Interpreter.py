@@ -0,0 +1,211 @@
+# Purpose:  Execute an ASTNODE tree directly, without generating MIPS
+# History:
+#           2026-10-18, the simple binary operators are closures picked from a table instead of source text built and
+#                       eval()'d per operand shape; a constant right operand still costs no call
+#           2026-10-18, x ** 0 and negative exponents give 1, as the generated code now does
+#           2026-10-18, created; the tree is compiled once into nested Python closures through a dispatch table
+#                       keyed by node kind, and variables are resolved to slots in a flat list beforehand
+#
+# Results match the generated MIPS code: values are 32-bit and wrap, division truncates toward zero, and a for
+# loop runs its body once before testing the bound, keeping its own counter in the way the $t6 register does, and a
+# negative exponent gives 1.
+
+import sys
+
+
+class Interpreter:
+
+    def __init__(self, program, stdin=None, output=None) -> None:
+        self.slots = {}
+        self.memory = []
+        if stdin is None:
+            stdin = (token for line in sys.stdin for token in line.split())
+        self.stdin = iter(stdin)
+        self.output = output if output is not None else sys.stdout
+        self.dispatch = {
+            "program": self.block, "statement_list": self.block, "statement": self.block,
+            "statement_block": self.block, "print_list": self.block, "empty_list": self.block,
+            "assign": self.assign, "print": self.print, "for": self.loop_for, "while": self.loop_while,
+            "if": self.conditional, "ifelse": self.conditional,
+            "number": self.number, "name": self.name, "input": self.input, "uminus": self.unary,
+            "abs": self.unary, "binop": self.binary, "comparison": self.binary, "min": self.binary,
+            "max": self.binary, "exponent": self.binary,
+        }
+        self.entry = self.compile(program)
+
+    def run(self) -> None:
+        self.entry()
+
+    @staticmethod
+    def wrap(value: int) -> int:
+        return ((value + 0x80000000) & 0xFFFFFFFF) - 0x80000000
+
+    def slot(self, var_name: str) -> int:
+        if var_name not in self.slots:
+            self.slots[var_name] = len(self.memory)
+            self.memory.append(0)
+        return self.slots[var_name]
+
+    def compile(self, _node):
+        if _node.name not in self.dispatch:
+            raise Exception("Cannot interpret node '{}'.".format(_node.name))
+        return self.dispatch[_node.name](_node)
+
+    # ------------------------------------------------------------------------------------------------ statements
+
+    def block(self, _node):
+        steps = tuple(self.compile(child) for child in _node.children)
+        if len(steps) == 1:
+            return steps[0]
+
+        def run():
+            for step in steps:
+                step()
+        return run
+
+    def assign(self, _node):
+        memory = self.memory
+        index = self.slot(_node.data["var_name"])
+        value = self.compile(_node.children[0])
+
+        def run():
+            memory[index] = value()
+        return run
+
+    def print(self, _node):
+        value = self.compile(_node.children[0])
+        write = self.output.write
+
+        def run():
+            write("{}\n".format(value()))
+        return run
+
+    def loop_for(self, _node):
+        memory = self.memory
+        index = self.slot(_node.data["var_name"])
+        start, end = (self.compile(child) for child in _node.children[0].children)
+        body = self.compile(_node.children[1])
+
+        def run():
+            counter = start()
+            bound = end()
+            memory[index] = counter
+            while True:
+                body()
+                counter = ((counter + 0x80000001) & 0xFFFFFFFF) - 0x80000000
+                memory[index] = counter
+                if bound < counter:
+                    break
+        return run
+
+    def loop_while(self, _node):
+        condition = self.compile(_node.children[0])
+        body = self.compile(_node.children[1])
+
+        def run():
+            while condition() != 0:
+                body()
+        return run
+
+    def conditional(self, _node):
+        # like the generated code, only a condition equal to 1 selects the first branch
+        condition = self.compile(_node.children[0])
+        then = self.compile(_node.children[1])
+        otherwise = self.compile(_node.children[2]) if _node.name == "ifelse" else None
+
+        def run():
+            if condition() == 1:
+                then()
+            elif otherwise is not None:
+                otherwise()
+        return run
+
+    # ----------------------------------------------------------------------------------------------- expressions
+
+    def number(self, _node):
+        value = _node.value
+        if not isinstance(value, int):
+            raise Exception("Cannot interpret the non-integer value '{}'.".format(value))
+        return lambda: value
+
+    def name(self, _node):
+        memory = self.memory
+        index = self.slot(_node.data["var_name"])
+        return lambda: memory[index]
+
+    def input(self, _node):
+        stdin = self.stdin
+
+        def run():
+            try:
+                return Interpreter.wrap(int(next(stdin)))
+            except StopIteration:
+                raise Exception("The program read more input than was provided.")
+        return run
+
+    def unary(self, _node):
+        operand = self.compile(_node.children[0])
+        wrap = Interpreter.wrap
+        if _node.name == "uminus":
+            return lambda: wrap(-operand())
+        return lambda: wrap(abs(operand()))
+
+    # the closure of each simple binary operator, given the closures of its two operands
+    operations = {
+        "+": lambda left, right: lambda: ((left() + right() + 0x80000000) & 0xFFFFFFFF) - 0x80000000,
+        "-": lambda left, right: lambda: ((left() - right() + 0x80000000) & 0xFFFFFFFF) - 0x80000000,
+        "*": lambda left, right: lambda: ((left() * right() + 0x80000000) & 0xFFFFFFFF) - 0x80000000,
+        "==": lambda left, right: lambda: 1 if left() == right() else 0,
+        "!=": lambda left, right: lambda: 1 if left() != right() else 0,
+        "<": lambda left, right: lambda: 1 if left() < right() else 0,
+        "<=": lambda left, right: lambda: 1 if left() <= right() else 0,
+        ">": lambda left, right: lambda: 1 if left() > right() else 0,
+        ">=": lambda left, right: lambda: 1 if left() >= right() else 0,
+        "min": lambda left, right: lambda: min(left(), right()),
+        "max": lambda left, right: lambda: max(left(), right()),
+    }
+    # the same, for a right operand that is the constant right: it costs no call
+    constant_operations = {
+        "+": lambda left, right: lambda: ((left() + right + 0x80000000) & 0xFFFFFFFF) - 0x80000000,
+        "-": lambda left, right: lambda: ((left() - right + 0x80000000) & 0xFFFFFFFF) - 0x80000000,
+        "*": lambda left, right: lambda: ((left() * right + 0x80000000) & 0xFFFFFFFF) - 0x80000000,
+        "==": lambda left, right: lambda: 1 if left() == right else 0,
+        "!=": lambda left, right: lambda: 1 if left() != right else 0,
+        "<": lambda left, right: lambda: 1 if left() < right else 0,
+        "<=": lambda left, right: lambda: 1 if left() <= right else 0,
+        ">": lambda left, right: lambda: 1 if left() > right else 0,
+        ">=": lambda left, right: lambda: 1 if left() >= right else 0,
+        "min": lambda left, right: lambda: min(left(), right),
+        "max": lambda left, right: lambda: max(left(), right),
+    }
+
+    def binary(self, _node):
+        operator = _node.name if _node.name != "binop" and _node.name != "comparison" else _node.value
+        left = self.compile(_node.children[0])
+        constant = _node.children[1]
+        if operator in Interpreter.constant_operations and constant.name == "number" and \
+                isinstance(constant.value, int):
+            return Interpreter.constant_operations[operator](left, constant.value)
+        right = self.compile(_node.children[1])
+        if operator in Interpreter.operations:
+            return Interpreter.operations[operator](left, right)
+        wrap = Interpreter.wrap
+        if operator in ("/", "%"):
+            def run():
+                dividend = left()
+                divisor = right()
+                if divisor == 0:
+                    raise Exception("Division by zero.")
+                quotient = abs(dividend) // abs(divisor)
+                if (dividend < 0) != (divisor < 0):
+                    quotient = -quotient
+                return wrap(quotient) if operator == "/" else dividend - divisor * quotient
+            return run
+        if operator == "exponent":
+            # a negative exponent gives 1, like x ** 0
+            def run():
+                base = left()
+                exponent = right()
+                return wrap(pow(base, max(exponent, 0), 2 ** 32))
+            return run
+        raise Exception("Cannot interpret operator '{}'.".format(operator))
@@ -0,0 +1,134 @@
+# Purpose:  Single-pass lexer that produces the same tokens as the PLY lexer of Compiler, faster
+# History:
+#           2026-10-18, created; one master regular expression scanned with finditer, token rules read from the
+#                       compiler so both lexers share them
+#
+# PLY skips ignored characters one at a time, matches its master expression once per token, then calls the
+# rule's function (t_NAME, t_NUMBER, ...), and for a character that starts no token calls t_error, which skips
+# it.  Here the token rules of the compiler are joined in the order PLY tries them - function rules in the order
+# they are defined, then string rules, longest first - except that the most frequent rules go first (see first).
+# Every match starts with the ignored characters before its token, and the literals and a catch-all for illegal
+# characters come last, so finditer walks the whole input in C with one match per token; only ignored
+# characters at the very end are left unmatched.  What the
+# rule functions do is done inline: NAME looks up reserved words, NUMBER converts with str_to_num, newline counts
+# lines, and an illegal character records the same error message.  A new token rule that does more than return
+# its token needs the same treatment in scan().
+#
+# Tokens are PLY LexTokens with the same type, value, lineno and lexpos.  Lexer has the input() and token() of a
+# PLY lexer and keeps lineno across input() calls, so Compiler can use either one.  verify() compares the two;
+# python Lexer.py FILE... does so for each file and measures the speed of both.
+
+import functools
+import re
+import sys
+import time
+
+from ply.lex import LexToken
+
+
+class Lexer:
+
+    # the rules tried before the others, the most frequent first.  None of them can match where a rule PLY tries
+    # earlier matches (NUMBER needs a digit after its ".", so it never takes the start of an ELLIPSIS), so the
+    # tokens do not change
+    first = ("PRINT", "NAME", "NUMBER", "newline")
+
+    def __init__(self, compiler) -> None:
+        self.compiler = compiler
+        self.lineno = 1
+        self.token = functools.partial(next, iter(()), None)
+
+        rules = type(compiler)
+        functions = sorted((getattr(rules, name) for name in dir(rules)
+                            if name.startswith("t_") and name != "t_error" and callable(getattr(rules, name))),
+                           key=lambda function: function.__code__.co_firstlineno)
+        strings = sorted(((name, value) for name, value in vars(rules).items()
+                          if name.startswith("t_") and name != "t_ignore" and isinstance(value, str)),
+                         key=lambda item: -len(item[1]))
+        patterns = [(function.__name__[2:], function.__doc__) for function in functions]
+        patterns += [(name[2:], value) for name, value in strings]
+        patterns.sort(key=lambda pattern: pattern[0] not in Lexer.first)
+        patterns.append(("literal", "[{}]".format(re.escape("".join(rules.literals)))))
+        patterns.append(("error", "[^{}]".format(re.escape(rules.t_ignore))))
+        ignore = "[{}]*".format(re.escape(rules.t_ignore))
+        self.master = re.compile(ignore + "(?:" + "|".join("(?P<{}>{})".format(*pattern) for pattern in patterns)
+                                 + ")", re.VERBOSE)
+        self.reserved = rules.reserved
+        self.str_to_num = rules.str_to_num
+
+    def input(self, data: str) -> None:
+        self.token = functools.partial(next, self.scan(data), None)
+
+    # the tokens of data, one at a time
+    def scan(self, data: str):
+        reserved = self.reserved
+        str_to_num = self.str_to_num
+        lineno = self.lineno
+        for found in self.master.finditer(data):
+            kind = found.lastgroup
+            value = found[kind]
+            if kind == "NAME":
+                kind = reserved.get(value, "NAME")
+            elif kind == "literal":
+                kind = value
+            elif kind == "NUMBER":
+                value = str_to_num(value)
+            elif kind == "newline":
+                lineno += len(value)
+                self.lineno = lineno
+                continue
+            elif kind == "error":
+                self.compiler.errors.append("Illegal character '%s' on line %d" % (value, lineno))
+                continue
+            token = LexToken()
+            token.type = kind
+            token.value = value
+            token.lineno = lineno
+            token.lexpos = found.start(found.lastindex)
+            yield token
+
+    # the first difference between the tokens and errors of the PLY lexer of compiler's class and those of Lexer
+    # on source, or None when there is none
+    @staticmethod
+    def verify(compiler, source: str):
+        reference = type(compiler)()
+        reference.build()
+        streams = []
+        for lexer in (reference.lexer, Lexer(reference)):
+            reference.errors = []
+            lexer.lineno = 1
+            lexer.input(source)
+            tokens = [(token.type, repr(token.value), token.lineno, token.lexpos) for token in iter(lexer.token, None)]
+            streams.append((tokens, reference.errors))
+        (expected, expected_errors), (tokens, errors) = streams
+        for index, (want, got) in enumerate(zip(expected, tokens)):
+            if want != got:
+                return "token {}: PLY {} != Lexer {}".format(index, want, got)
+        if len(expected) != len(tokens):
+            return "PLY has {} tokens, Lexer {}".format(len(expected), len(tokens))
+        if expected_errors != errors:
+            return "PLY errors {} != Lexer errors {}".format(expected_errors, errors)
+        return None
+
+
+if __name__ == "__main__":
+    def test():
+        # Compiler imports this module
+        from Compiler import Compiler
+        compiler = Compiler()
+        for path in sys.argv[1:]:
+            source = open(path, "r", encoding="utf8").read()
+            difference = Lexer.verify(compiler, source)
+            speeds = []
+            for fast_lexer in (False, True):
+                lexer = Compiler(fast_lexer=fast_lexer)
+                lexer.build()
+                start = time.perf_counter()
+                lexer.lexer.input(source)
+                for _ in iter(lexer.lexer.token, None):
+                    pass
+                speeds.append(len(source) / 2 ** 20 / max(time.perf_counter() - start, 1e-9))
+            print("{}: {}, PLY {:.2f} MB/s, Lexer {:.2f} MB/s".format(
+                path, difference or "same tokens", speeds[0], speeds[1]))
+
+    test()
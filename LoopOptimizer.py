@@ -0,0 +1,332 @@
+# Purpose:  Loop optimizations over the AST: unrolling short constant ranges and hoisting invariant expressions
+# History:
+#           2026-10-18, hoisting is linear in the size of a loop nest: the variables each loop assigns are collected
+#                       bottom-up in one walk, and one more walk picks the loop every invariant expression leaves;
+#                       the loops are no longer collected three times over
+#           2026-10-18, created; a for loop over a short constant range becomes straight-line copies of its body,
+#                       and expressions that cannot change inside a for or while loop are computed once before it
+#
+# Unrolling: for i in a...b with constant a and b runs its body max(b - a + 1, 1) times (the body runs once before
+# the bound is tested), so up to unroll_limit iterations whose copies stay within unroll_budget nodes are written
+# out one after another.  When the body never assigns i, every copy reads its value as a constant; otherwise each
+# copy starts with i = k.  i = a + count is assigned at the end, the value the loop leaves behind.  Every copy of
+# a label-carrying node (if, while, min, ...) gets a fresh branch_index so the copies do not share labels.
+#
+# Hoisting: an expression inside a loop - the body, and the condition of a while - that reads no variable assigned
+# anywhere in the loop, reads no input and cannot fault (a divisor or modulus that is not a non-zero constant) is
+# computed into a fresh variable before the loop and read from it inside.  Only expressions with at least one
+# binary operation are worth a variable.  An expression moves out of the outermost loop it is invariant in, so one
+# that is invariant in a whole nest moves all the way out; the hoisted variables go into the "invariants" scope of
+# the symbol table.
+#
+# Each change is described by a line in report.
+
+from types import MappingProxyType
+
+from ASTNODE import ASTNODE
+
+
+class LoopOptimizer:
+
+    unroll_limit = 8
+    # the most nodes the copies of an unrolled body may add up to
+    unroll_budget = 256
+    loops = ("for", "while")
+    operations = ("binop", "comparison", "min", "max", "exponent", "uminus", "abs")
+    binary = ("binop", "comparison", "min", "max", "exponent")
+
+    # symbol_table receives the hoisted variables; branch_index is the last label index the parser handed out
+    def __init__(self, symbol_table: dict, branch_index: int) -> None:
+        self.symbol_table = symbol_table
+        self.branch_index = branch_index
+        self.report = []
+
+    def optimize(self, program) -> ASTNODE:
+        # unroll inner loops first, so the size of an enclosing loop counts them as unrolled
+        for loop in reversed(LoopOptimizer.find_loops(program)):
+            if loop.name == "for":
+                self.replace(loop, self.unroll(loop))
+        # unrolling copies the loops inside an unrolled body, so the loops that are left are collected again, in
+        # the walk that collects the variables each of them assigns
+        loops, assigned, counters = LoopOptimizer.assignments(program)
+        chosen = LoopOptimizer.choose(program, assigned)
+        for loop in loops:
+            self.replace(loop, self.hoist(loop, chosen.get(id(loop), [])))
+        for loop in loops:
+            if loop.name == "for" and not counters[id(loop)]:
+                self.report.append("for {}: read from the loop counter, stored once after the loop".format(
+                    loop.data["var_name"]))
+        return program
+
+    # the for and while nodes below program, every loop before the loops nested in it
+    @staticmethod
+    def find_loops(program) -> list:
+        loops = []
+        work = [program]
+        while work:
+            node = work.pop()
+            if node.name in LoopOptimizer.loops and node.parent is not None:
+                loops.append(node)
+            work.extend(reversed(node.children))
+        return loops
+
+    # put replacement, a node or a list of nodes, where loop is in the tree
+    @staticmethod
+    def replace(loop, replacement) -> None:
+        if replacement is loop:
+            return
+        parent = loop.parent
+        statements = ASTNODE("statement_list")
+        parent.children = [statements if child is loop else child for child in parent.children]
+        statements.children = replacement
+
+    def next_index(self) -> int:
+        self.branch_index += 1
+        return self.branch_index
+
+    # the number of nodes in the tree at _node, counted up to no more than limit + 1
+    @staticmethod
+    def size(_node, limit: int) -> int:
+        count = 0
+        work = [_node]
+        while work and count <= limit:
+            node = work.pop()
+            count += 1
+            work.extend(node.children)
+        return count
+
+    @staticmethod
+    def is_constant(_node) -> bool:
+        return _node.name == "number" and isinstance(_node.value, int)
+
+    # --------------------------------------------------------------------------------------------------- unrolling
+
+    # the statements that replace the for node loop, or loop itself when it is not worth unrolling
+    def unroll(self, loop):
+        start, end = loop.children[0].children
+        if not LoopOptimizer.is_constant(start) or not LoopOptimizer.is_constant(end):
+            return loop
+        count = max(end.value - start.value + 1, 1)
+        body = loop.children[1]
+        # a bound of 2^31 - 1 makes the counter wrap and the loop never ends
+        if count > LoopOptimizer.unroll_limit or start.value + count >= 2 ** 31 or \
+                count * LoopOptimizer.size(body, LoopOptimizer.unroll_budget) > LoopOptimizer.unroll_budget:
+            return loop
+        var_name = loop.data["var_name"]
+        assigned = ASTNODE.assigns(body, var_name)
+        statements = []
+        for value in range(start.value, start.value + count):
+            if assigned:
+                statements.append(LoopOptimizer.assignment(loop.data, value))
+                statements.append(self.copy(body, None, None))
+            else:
+                statements.append(self.copy(body, var_name, value))
+        statements.append(LoopOptimizer.assignment(loop.data, start.value + count))
+        self.report.append("for {}: unrolled {} iteration{}".format(var_name, count, "s" if count > 1 else ""))
+        return statements
+
+    @staticmethod
+    def assignment(symbol, value: int) -> ASTNODE:
+        number = ASTNODE("number", value=value, data=ASTNODE.int_data)
+        return ASTNODE("statement", children=[ASTNODE("assign", children=[number], data=symbol)])
+
+    # a copy of the tree at _node with fresh label indices, in which reads of var_name become the number value
+    def copy(self, _node, var_name, value) -> ASTNODE:
+        copies = {}
+        order = []
+        work = [_node]
+        while work:
+            node = work.pop()
+            order.append(node)
+            work.extend(node.children)
+        for node in reversed(order):
+            if node.name == "name" and node.data["var_name"] == var_name:
+                copies[id(node)] = ASTNODE("number", value=value, data=ASTNODE.int_data)
+                continue
+            data = node.data
+            if "branch_index" in data:
+                data = dict(data)
+                data["branch_index"] = self.next_index()
+            copies[id(node)] = ASTNODE(node.name, value=node.value, line=node.line, data=data,
+                                       children=[copies[id(child)] for child in node.children])
+        return copies[id(_node)]
+
+    # ---------------------------------------------------------------------------------------------------- hoisting
+
+    # the loops below program, every loop before the loops nested in it; the variables assigned anywhere in each
+    # loop, by id of the loop; and whether the body of each for loop assigns its counter, by id of the loop.  The
+    # sets are built bottom-up in one walk, each node adding its children's sets to the largest of them
+    @staticmethod
+    def assignments(program) -> tuple:
+        loops = []
+        assigned = {}
+        counters = {}
+        # the variables assigned below each node whose parent is not finished yet, by id of the node
+        names = {}
+        work = [(program, False)]
+        while work:
+            node, finished = work.pop()
+            if not finished:
+                if node.name in LoopOptimizer.loops and node.parent is not None:
+                    loops.append(node)
+                work.append((node, True))
+                work.extend((child, False) for child in reversed(node.children))
+                continue
+            sets = [names.pop(id(child)) for child in node.children]
+            if node.name == "for":
+                counters[id(node)] = node.data["var_name"] in sets[1]
+            collected = max(sets, key=len, default=set())
+            for other in sets:
+                if other is not collected:
+                    collected |= other
+            if node.name in ("assign", "for"):
+                collected.add(node.data["var_name"])
+            if node.name in LoopOptimizer.loops:
+                assigned[id(node)] = frozenset(collected)
+            names[id(node)] = collected
+        return loops, assigned, counters
+
+    # the expressions to hoist out of each loop, by id of the loop, in the order a scan of the loop from its last
+    # node to its first meets them.  An expression goes to the outermost loop it is invariant in; the expressions
+    # inside it that are invariant in a loop further out still go there, so they are computed once for the whole
+    # nest.  A loop assigns every variable the loops inside it assign, so the loops a variable is assigned in are
+    # the outermost ones around its read
+    @staticmethod
+    def choose(program, assigned: dict) -> dict:
+        chosen = {}
+        # the loops whose body (or condition) holds the node, outermost first
+        chain = []
+        work = [(program, 0)]
+        while work:
+            node, depth = work.pop()
+            del chain[depth:]
+            if node.name in LoopOptimizer.operations:
+                if chain:
+                    LoopOptimizer.choose_in(node, chain, assigned, chosen)
+                continue
+            if node.name in LoopOptimizer.loops and node.parent is not None:
+                chain.append(node)
+                if node.name == "for":
+                    # the range is evaluated once, before the loop
+                    work.append((node.children[0], depth))
+                    work.append((node.children[1], depth + 1))
+                else:
+                    work.extend((child, depth + 1) for child in node.children)
+                continue
+            work.extend((child, depth) for child in node.children)
+        return chosen
+
+    # add the invariant expressions of the expression tree at root, inside the loops in chain, to chosen
+    @staticmethod
+    def choose_in(root, chain: list, assigned: dict, chosen: dict) -> None:
+        order = []
+        work = [root]
+        while work:
+            node = work.pop()
+            order.append(node)
+            work.extend(node.children)
+        # for every node, bottom-up: the index in chain of the outermost loop it is invariant in (len(chain) when
+        # there is none), whether it can be evaluated before a loop without reading input or faulting, and whether
+        # it does some arithmetic
+        facts = {}
+        for node in reversed(order):
+            if node.name == "name":
+                facts[id(node)] = (LoopOptimizer.assigned_in(node.data["var_name"], chain, assigned), True, False)
+            elif node.name == "number":
+                facts[id(node)] = (0, True, False)
+            elif node.name in LoopOptimizer.operations:
+                children = [facts[id(child)] for child in node.children]
+                safe = all(child[1] for child in children)
+                if node.name == "binop" and node.value in ("/", "%"):
+                    divisor = node.children[1]
+                    safe = safe and LoopOptimizer.is_constant(divisor) and divisor.value != 0
+                facts[id(node)] = (max(child[0] for child in children), safe,
+                                   node.name in LoopOptimizer.binary or any(child[2] for child in children))
+            else:
+                # input, strings
+                facts[id(node)] = (len(chain), False, False)
+
+        work = [(root, len(chain))]
+        while work:
+            node, limit = work.pop()
+            level, safe, worthwhile = facts[id(node)]
+            if node.name in LoopOptimizer.operations and safe and worthwhile and level < limit:
+                chosen.setdefault(id(chain[level]), []).append(node)
+                # what is left inside can only go further out
+                limit = level
+            work.extend((child, limit) for child in node.children)
+
+    # the number of loops in chain, outermost first, that assign var_name; they are the first ones
+    @staticmethod
+    def assigned_in(var_name: str, chain: list, assigned: dict) -> int:
+        low, high = 0, len(chain)
+        while low < high:
+            middle = (low + high) // 2
+            if var_name in assigned[id(chain[middle])]:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    # the statements that replace loop: an assignment of each of the invariant expressions chosen for it, then loop
+    def hoist(self, loop, expressions: list):
+        if not expressions:
+            return loop
+        if loop.name == "for":
+            name = "for " + loop.data["var_name"]
+        else:
+            name = "while loop_{}".format(loop.data["branch_index"])
+        statements = []
+        # the variable of every expression hoisted so far, by its text, so repeats share it
+        hoisted = {}
+        for node in expressions:
+            parent = node.parent
+            read = ASTNODE("name")
+            parent.children = [read if child is node else child for child in parent.children]
+            text = LoopOptimizer.text(node)
+            if text not in hoisted:
+                symbol = MappingProxyType({"var_name": "invariant_{}".format(self.next_index()),
+                                           "type": node.data.get("type", "int")})
+                self.symbol_table.setdefault("invariants", {})[symbol["var_name"]] = symbol
+                hoisted[text] = symbol
+                statements.append(ASTNODE("statement", children=[ASTNODE("assign", children=[node], data=symbol)]))
+                self.report.append("{}: hoisted {} into {}".format(name, LoopOptimizer.describe(node),
+                                                                   symbol["var_name"]))
+            read.data = hoisted[text]
+        return statements + [loop]
+
+    # the whole expression _node as text, equal for expressions that compute the same thing
+    @staticmethod
+    def text(_node) -> str:
+        parts = []
+        work = [_node]
+        while work:
+            node = work.pop()
+            if isinstance(node, str):
+                parts.append(node)
+                continue
+            parts.append(node.data["var_name"] if node.name == "name" else "{}:{}".format(node.name, node.value))
+            parts.append("(")
+            work.append(")")
+            work.extend(reversed(node.children))
+        return "".join(parts)
+
+    # _node as source text for the report, with deep subexpressions elided
+    @staticmethod
+    def describe(_node, depth: int = 0) -> str:
+        if _node.name == "name":
+            return _node.data["var_name"]
+        if _node.name == "number":
+            return str(_node.value)
+        if depth >= 3:
+            return "..."
+        operands = [LoopOptimizer.describe(child, depth + 1) for child in _node.children]
+        if _node.name in ("binop", "comparison"):
+            text = "{} {} {}".format(operands[0], _node.value, operands[1])
+        elif _node.name == "exponent":
+            text = "{} ** {}".format(*operands)
+        elif _node.name == "uminus":
+            text = "-" + operands[0]
+        else:
+            return "{}({})".format(_node.name, ", ".join(operands))
+        return "(" + text + ")" if depth else text
@@ -0,0 +1,189 @@
+# Purpose:  Lower the three-address IR to MIPS assembly
+# History:
+#           2026-10-18, variables promoted to $s0-$s7 are loaded and stored with move and left out of .data
+#           2026-10-18, and, sll, srl and sra lower to their immediate forms; mulhi to mult and mfhi
+#           2026-10-18, created; linear-scan allocation of virtual registers onto $t0-$t7, with $t8/$t9 kept
+#                       free as scratch registers for immediates and for virtual registers spilled to memory
+#
+# A virtual register is live from its first to its last appearance in the instruction list.  When a loop's
+# back edge jumps over a register that is live on entry to the loop, its interval is stretched to the end of
+# the loop so the register survives every iteration.  A virtual register that finds no free physical register
+# lives in a .data word for its whole lifetime.
+
+from IR import IRInstruction, IRProgram
+
+
+class MIPSLowering:
+
+    registers = ["$t0", "$t1", "$t2", "$t3", "$t4", "$t5", "$t6", "$t7"]
+    scratch = ("$t8", "$t9")
+
+    arithmetic = {"add": "add", "sub": "sub", "div": "div", "rem": "rem",
+                  "seq": "seq", "sne": "sne", "slt": "slt", "sle": "sle", "sgt": "sgt", "sge": "sge"}
+    # operations whose second operand is an immediate
+    immediates = {"and": "andi", "sll": "sll", "srl": "srl", "sra": "sra"}
+
+    # return the complete program, .data and .text, as a list of lines
+    @staticmethod
+    def lower(ir: IRProgram, promoted=None, cleared=()) -> list:
+        promoted = promoted or {}
+        assignment, spills = MIPSLowering.allocate(ir)
+        lines = [".data"]
+        for variable in ir.variables():
+            if variable not in promoted:
+                lines.append(f"{variable}: .word 0")
+        for slot in spills:
+            lines.append(f"{slot}: .word 0")
+        lines.append(".text")
+        for register in cleared:
+            lines.append(f"move {register}, $zero")
+        for instruction in ir.instructions:
+            MIPSLowering.lower_instruction(instruction, assignment, lines, promoted)
+        lines.append("li $v0, 10")
+        lines.append("syscall")
+        return lines
+
+    # live interval of every virtual register as [first index, last index]
+    @staticmethod
+    def intervals(ir: IRProgram) -> dict:
+        live = {}
+        labels = {}
+        for index, instruction in enumerate(ir.instructions):
+            if instruction.op == "label":
+                labels[instruction.args[0]] = index
+            operands = instruction.uses()
+            if IRInstruction.is_vreg(instruction.dest):
+                operands = operands + [instruction.dest]
+            for vreg in operands:
+                if vreg in live:
+                    live[vreg][1] = index
+                else:
+                    live[vreg] = [index, index]
+
+        back_edges = []
+        for index, instruction in enumerate(ir.instructions):
+            if instruction.op == "j" or instruction.op in IRProgram.branches:
+                target = labels[instruction.args[-1]]
+                if target < index:
+                    back_edges.append((target, index))
+        changed = True
+        while changed:
+            changed = False
+            for start, end in back_edges:
+                for interval in live.values():
+                    if interval[0] < start <= interval[1] < end:
+                        interval[1] = end
+                        changed = True
+        return live
+
+    # map each virtual register to a physical register or to a spill slot name
+    @staticmethod
+    def allocate(ir: IRProgram) -> tuple:
+        live = MIPSLowering.intervals(ir)
+        starts = {}
+        for vreg, (start, end) in live.items():
+            starts.setdefault(start, []).append(vreg)
+
+        assignment = {}
+        spills = []
+        free = list(reversed(MIPSLowering.registers))
+        active = []
+        for index in range(len(ir.instructions)):
+            for vreg in [vreg for vreg in active if live[vreg][1] < index]:
+                active.remove(vreg)
+                free.append(assignment[vreg])
+            for vreg in starts.get(index, []):
+                if free:
+                    assignment[vreg] = free.pop()
+                    active.append(vreg)
+                else:
+                    slot = f"spill_{len(spills) + 1}"
+                    spills.append(slot)
+                    assignment[vreg] = slot
+        return assignment, spills
+
+    @staticmethod
+    def lower_instruction(instruction: IRInstruction, assignment: dict, lines: list, promoted=None) -> None:
+        op = instruction.op
+        args = instruction.args
+
+        # bring an operand into a register, using a scratch register for immediates and spilled values
+        def read(operand, scratch: str) -> str:
+            if isinstance(operand, int):
+                lines.append(f"li {scratch}, {operand}")
+                return scratch
+            location = assignment[operand]
+            if location.startswith("$"):
+                return location
+            lines.append(f"lw {scratch}, {location} # reload spilled {operand}")
+            return scratch
+
+        def target() -> str:
+            location = assignment[instruction.dest]
+            return location if location.startswith("$") else MIPSLowering.scratch[0]
+
+        def write_back() -> None:
+            location = assignment[instruction.dest]
+            if not location.startswith("$"):
+                lines.append(f"sw {MIPSLowering.scratch[0]}, {location} # spill {instruction.dest}")
+
+        if op == "label":
+            lines.append(f"{args[0]}:")
+            return
+        if op == "j":
+            lines.append(f"j {args[0]}")
+            return
+        if op in IRProgram.branches:
+            left = read(args[0], MIPSLowering.scratch[0])
+            right = args[1] if isinstance(args[1], int) else read(args[1], MIPSLowering.scratch[1])
+            lines.append(f"{op} {left}, {right}, {args[2]}")
+            return
+        if op == "store":
+            value = read(args[0], MIPSLowering.scratch[0])
+            if promoted and instruction.dest in promoted:
+                lines.append(f"move {promoted[instruction.dest]}, {value} # store {instruction.dest}")
+            else:
+                lines.append(f"sw {value}, {instruction.dest} # store {instruction.dest}")
+            return
+        if op == "print":
+            value = read(args[0], MIPSLowering.scratch[0])
+            lines.append(f"move $a0, {value}")
+            lines.append("li $v0, 1 # load 1 into v0 for an integer print syscall")
+            lines.append("syscall")
+            lines.append("li $a0, 10")
+            lines.append("li $v0, 11 # print a newline")
+            lines.append("syscall")
+            return
+
+        dest = target()
+        if op == "li":
+            lines.append(f"li {dest}, {args[0]}")
+        elif op == "load" and promoted and args[0] in promoted:
+            lines.append(f"move {dest}, {promoted[args[0]]} # load {args[0]}")
+        elif op == "load":
+            lines.append(f"lw {dest}, {args[0]} # load {args[0]}")
+        elif op == "input":
+            lines.append("li $v0, 5 # load the integer 5 into v0 to accept a user integer input")
+            lines.append("syscall")
+            lines.append(f"move {dest}, $v0")
+        elif op == "neg":
+            lines.append(f"sub {dest}, $zero, {read(args[0], MIPSLowering.scratch[0])}")
+        elif op in ("abs", "move"):
+            lines.append(f"{op} {dest}, {read(args[0], MIPSLowering.scratch[0])}")
+        elif op in ("add", "sub") and isinstance(args[1], int):
+            immediate = args[1] if op == "add" else -args[1]
+            lines.append(f"addi {dest}, {read(args[0], MIPSLowering.scratch[0])}, {immediate}")
+        elif op in MIPSLowering.immediates:
+            lines.append(f"{MIPSLowering.immediates[op]} {dest}, {read(args[0], MIPSLowering.scratch[0])}, {args[1]}")
+        elif op in ("mul", "mulhi"):
+            left = read(args[0], MIPSLowering.scratch[0])
+            right = read(args[1], MIPSLowering.scratch[1])
+            lines.append(f"mult {left}, {right}")
+            lines.append(f"{'mflo' if op == 'mul' else 'mfhi'} {dest}")
+        elif op in MIPSLowering.arithmetic:
+            left = read(args[0], MIPSLowering.scratch[0])
+            right = read(args[1], MIPSLowering.scratch[1])
+            lines.append(f"{MIPSLowering.arithmetic[op]} {dest}, {left}, {right}")
+        else:
+            raise Exception("Cannot lower IR instruction '{}'.".format(op))
+        write_back()
@@ -0,0 +1,225 @@
+# Purpose:  Pure-Python simulator for the MIPS subset the compiler generates
+# History:
+#           2026-10-18, created; runs generated assembly with scripted input and counts executed instructions,
+#                       estimated cycles, loads, stores and branches, so codegen changes can be measured offline
+#
+# Supported: .data with .word, .text, labels, li, la, lw, sw, move, add(u), addi(u), sub(u), mult, mul, div,
+# divu, rem, mflo, mfhi, abs, neg, not, and(i), or(i), xor(i), nor, sll, srl, sra, sllv, srlv, srav, seq, sne,
+# slt(i), sle, sgt, sge, beq, bne, blt, ble, bgt, bge, beqz, bnez, bltz, blez, bgtz, bgez, j, and syscalls
+# 1 (print int), 5 (read int), 10 (exit) and 11 (print character).
+#
+# instructions counts the assembly lines executed.  cycles counts the machine instructions those lines expand
+# to (as SPIM and MARS expand pseudo-instructions), plus the extra latency of the multiply and divide unit.
+
+import sys
+
+
+class MIPSSimulator:
+
+    data_base = 0x10010000
+    stack_top = 0x7fffeffc
+
+    # machine instructions behind each pseudo-instruction; anything not listed is a single instruction
+    expansion = {"abs": 3, "mul": 2, "div3": 4, "rem": 4, "seq": 3, "sne": 3, "sle": 3, "sge": 3,
+                 "blt": 2, "ble": 2, "bgt": 2, "bge": 2, "not": 1}
+    # cycles beyond the first spent waiting on HI/LO, in the style of the R2000/R3000
+    latency = {"mult": 11, "mul": 11, "div": 34, "div3": 34, "divu": 34, "rem": 34}
+
+    branches = ("beq", "bne", "blt", "ble", "bgt", "bge", "beqz", "bnez", "bltz", "blez", "bgtz", "bgez")
+
+    def __init__(self, source, stdin=None, max_steps: int = 100000000) -> None:
+        lines = source.splitlines() if isinstance(source, str) else list(source)
+        self.stdin = list(stdin) if stdin is not None else []
+        self.max_steps = max_steps
+        self.registers = {"$zero": 0, "$sp": MIPSSimulator.stack_top, "hi": 0, "lo": 0}
+        self.memory = {}
+        self.symbols = {}
+        self.program = []
+        self.labels = {}
+        self.output = []
+        self.stats = {"instructions": 0, "cycles": 0, "loads": 0, "stores": 0, "branches": 0,
+                      "branches_taken": 0, "jumps": 0, "syscalls": 0}
+        self.assemble(lines)
+
+    @staticmethod
+    def wrap(value: int) -> int:
+        return ((value + 2 ** 31) % 2 ** 32) - 2 ** 31
+
+    def assemble(self, lines: list) -> None:
+        section = ".text"
+        data_address = MIPSSimulator.data_base
+        for number, line in enumerate(lines, start=1):
+            text = line.split("#", 1)[0].strip()
+            if text in (".data", ".text"):
+                section = text
+                continue
+            while ":" in text:
+                label, text = text.split(":", 1)
+                text = text.strip()
+                if section == ".data":
+                    self.symbols[label.strip()] = data_address
+                else:
+                    self.labels[label.strip()] = len(self.program)
+            if text == "":
+                continue
+            if section == ".data":
+                directive, _, values = text.partition(" ")
+                if directive != ".word":
+                    raise Exception("Unsupported directive '{}' on line {}.".format(directive, number))
+                for value in values.split(","):
+                    self.memory[data_address] = int(value.strip(), 0)
+                    data_address += 4
+                continue
+            op, _, operands = text.partition(" ")
+            operands = [operand.strip() for operand in operands.split(",")] if operands.strip() else []
+            self.program.append((op, operands, number))
+
+    def read(self, operand: str) -> int:
+        if operand.startswith("$"):
+            if operand not in self.registers and operand not in ("hi", "lo"):
+                self.registers[operand] = 0
+            return self.registers[operand]
+        return int(operand, 0)
+
+    def write(self, register: str, value: int) -> None:
+        if register != "$zero":
+            self.registers[register] = MIPSSimulator.wrap(value)
+
+    def address(self, operand: str) -> int:
+        if "(" in operand:
+            offset, base = operand[:-1].split("(")
+            return (int(offset, 0) if offset else 0) + self.read(base)
+        return self.symbols[operand]
+
+    def next_input(self) -> int:
+        if not self.stdin:
+            raise Exception("The program read more input than was provided.")
+        return int(self.stdin.pop(0))
+
+    # execute until the exit syscall or the end of .text and return the printed output
+    def run(self) -> str:
+        pc = self.labels.get("main", 0)
+        stats = self.stats
+        expansion = MIPSSimulator.expansion
+        latency = MIPSSimulator.latency
+        while pc < len(self.program):
+            op, operands, number = self.program[pc]
+            pc += 1
+            stats["instructions"] += 1
+            if stats["instructions"] > self.max_steps:
+                raise Exception("Stopped after {} instructions.".format(self.max_steps))
+            kind = "div3" if op == "div" and len(operands) == 3 else op
+            stats["cycles"] += expansion.get(kind, 1) + latency.get(kind, 0)
+
+            if op == "li":
+                self.write(operands[0], int(operands[1], 0))
+            elif op == "la":
+                self.write(operands[0], self.symbols[operands[1]])
+            elif op == "lw":
+                stats["loads"] += 1
+                self.write(operands[0], self.memory.get(self.address(operands[1]), 0))
+            elif op == "sw":
+                stats["stores"] += 1
+                self.memory[self.address(operands[1])] = self.read(operands[0])
+            elif op == "move":
+                self.write(operands[0], self.read(operands[1]))
+            elif op in ("add", "addu", "addi", "addiu"):
+                self.write(operands[0], self.read(operands[1]) + self.read(operands[2]))
+            elif op in ("sub", "subu"):
+                self.write(operands[0], self.read(operands[1]) - self.read(operands[2]))
+            elif op == "mult":
+                product = self.read(operands[0]) * self.read(operands[1])
+                self.registers["lo"] = MIPSSimulator.wrap(product)
+                self.registers["hi"] = MIPSSimulator.wrap(product >> 32)
+            elif op == "mul":
+                self.write(operands[0], self.read(operands[1]) * self.read(operands[2]))
+            elif op in ("div", "divu", "rem"):
+                if len(operands) == 2:
+                    dividend, divisor = self.read(operands[0]), self.read(operands[1])
+                else:
+                    dividend, divisor = self.read(operands[1]), self.read(operands[2])
+                if op == "divu":
+                    dividend, divisor = dividend % 2 ** 32, divisor % 2 ** 32
+                if divisor == 0:
+                    raise Exception("Division by zero on line {}.".format(number))
+                quotient = abs(dividend) // abs(divisor)
+                if (dividend < 0) != (divisor < 0):
+                    quotient = -quotient
+                remainder = dividend - divisor * quotient
+                if len(operands) == 2:
+                    self.registers["lo"] = MIPSSimulator.wrap(quotient)
+                    self.registers["hi"] = MIPSSimulator.wrap(remainder)
+                else:
+                    self.write(operands[0], remainder if op == "rem" else quotient)
+            elif op in ("mflo", "mfhi"):
+                self.write(operands[0], self.registers[op[2:]])
+            elif op == "abs":
+                self.write(operands[0], abs(self.read(operands[1])))
+            elif op == "neg":
+                self.write(operands[0], -self.read(operands[1]))
+            elif op == "not":
+                self.write(operands[0], ~self.read(operands[1]))
+            elif op in ("and", "andi"):
+                self.write(operands[0], self.read(operands[1]) & self.read(operands[2]))
+            elif op in ("or", "ori"):
+                self.write(operands[0], self.read(operands[1]) | self.read(operands[2]))
+            elif op in ("xor", "xori"):
+                self.write(operands[0], self.read(operands[1]) ^ self.read(operands[2]))
+            elif op == "nor":
+                self.write(operands[0], ~(self.read(operands[1]) | self.read(operands[2])))
+            elif op in ("sll", "sllv"):
+                self.write(operands[0], self.read(operands[1]) << (self.read(operands[2]) & 31))
+            elif op in ("sra", "srav"):
+                self.write(operands[0], self.read(operands[1]) >> (self.read(operands[2]) & 31))
+            elif op in ("srl", "srlv"):
+                self.write(operands[0], (self.read(operands[1]) % 2 ** 32) >> (self.read(operands[2]) & 31))
+            elif op in ("seq", "sne", "slt", "slti", "sle", "sgt", "sge"):
+                left, right = self.read(operands[1]), self.read(operands[2])
+                result = {"seq": left == right, "sne": left != right, "slt": left < right, "slti": left < right,
+                          "sle": left <= right, "sgt": left > right, "sge": left >= right}[op]
+                self.write(operands[0], int(result))
+            elif op in MIPSSimulator.branches:
+                stats["branches"] += 1
+                left = self.read(operands[0])
+                if op.endswith("z"):
+                    right, target = 0, operands[1]
+                    op = op[:-1]
+                else:
+                    right, target = self.read(operands[1]), operands[2]
+                taken = {"beq": left == right, "bne": left != right, "blt": left < right,
+                         "ble": left <= right, "bgt": left > right, "bge": left >= right}[op]
+                if taken:
+                    stats["branches_taken"] += 1
+                    pc = self.labels[target]
+            elif op == "j":
+                stats["jumps"] += 1
+                pc = self.labels[operands[0]]
+            elif op == "syscall":
+                stats["syscalls"] += 1
+                service = self.registers.get("$v0", 0)
+                if service == 1:
+                    self.output.append(str(self.registers.get("$a0", 0)))
+                elif service == 5:
+                    self.write("$v0", self.next_input())
+                elif service == 10:
+                    break
+                elif service == 11:
+                    self.output.append(chr(self.registers.get("$a0", 0) % 256))
+                else:
+                    raise Exception("Unsupported syscall {} on line {}.".format(service, number))
+            else:
+                raise Exception("Unsupported instruction '{}' on line {}.".format(op, number))
+        return "".join(self.output)
+
+    def report(self) -> str:
+        return "\n".join("{:>15}: {}".format(name, value) for name, value in self.stats.items())
+
+
+# run an assembly file: python MIPSSimulator.py output.asm [input values...]
+if __name__ == "__main__":
+    def test():
+        simulator = MIPSSimulator(open(sys.argv[1], "r", encoding="utf8").read(), sys.argv[2:])
+        sys.stdout.write(simulator.run())
+        print(simulator.report(), file=sys.stderr)
+
+    test()
@@ -0,0 +1,269 @@
+# Purpose:  Peephole optimizer over generated MIPS assembly
+# History:
+#           2026-10-18, each line is parsed once into an entry; a pass builds a new list front to back instead of
+#                       splicing matches into the old one, and only the rules that can start at a line's opcode
+#                       are tried there
+#           2026-10-18, frame_slot: the push_pop of static stack frames, where a push and a pop are a sw and a lw of
+#                       the same fixed offset from $sp; empty_frame removes a frame nothing uses any more
+#           2026-10-18, created; rule table applied with a sliding window until no rule fires, with a count of
+#                       the instructions each rule removed
+#
+# The optimizer works on the list of assembly lines that codegen produces.  Labels, directives, branches,
+# jumps and syscalls end a window, so no rule ever moves code across a point where control flow can enter or
+# leave.  Every distinct line is parsed once, into an entry (line, label, opcode, operands, registers written,
+# registers read); a rule starts at one opcode and returns the entries that replace the ones it matched.  Rules
+# are chosen by name:
+#
+#   push_pop          addi $sp,$sp,-4; sw R,4($sp) ... lw S,4($sp); addi $sp,$sp,4   ->  move S, R
+#   frame_slot        sw R,N($sp) ... lw S,N($sp), $sp unchanged in between           ->  move S, R
+#   empty_frame       addi $sp,$sp,-N ... addi $sp,$sp,N, no $sp in between          ->  (both removed)
+#   dead_reset        li R, n whose register is overwritten before it is read          ->  (removed)
+#   load_after_store  sw R, X ... lw S, X                                              ->  move S, R
+#   self_move         move R, R                                                        ->  (removed)
+#   jump_to_next      j L immediately followed by L:                                   ->  (removed)
+#
+# frame_slot and empty_frame are for the static stack frames of code generation (see ASTNODE.open_frame).
+# frame_slot drops the store as well, because code generation only ever loads a word of the stack to pop it:
+# nothing reads the word after the load.  It runs before load_after_store, which would keep the store.
+# empty_frame has no lookahead limit but stops at the first label or branch like the other rules; only a syscall,
+# which leaves $sp alone, does not end its window, so the frame of a print statement can go too.
+
+import functools
+import re
+
+
+class Peephole:
+
+    # instructions whose first operand is the register they write
+    writers = ("li", "la", "lw", "move", "add", "addi", "addu", "addiu", "sub", "subu", "mul", "mflo", "mfhi",
+               "abs", "neg", "not", "and", "andi", "or", "ori", "xor", "xori", "nor", "sll", "srl", "sra", "sllv",
+               "srlv", "srav", "seq", "sne", "slt", "slti", "sltu", "sle", "sgt", "sge", "rem", "remu", "div", "divu")
+    branches = ("beq", "bne", "blt", "ble", "bgt", "bge", "beqz", "bnez", "bltz", "blez", "bgtz", "bgez",
+                "j", "jal", "jr", "syscall")
+    # the opcodes that end a window: anything that is not a plain instruction (None), or that transfers control
+    barriers = frozenset((None,) + branches)
+
+    register_pattern = re.compile(r"\$\w+")
+
+    def __init__(self, rules=None, lookahead: int = 8) -> None:
+        # rule name -> the rule and the opcode of the line a match starts at
+        table = {
+            "push_pop": (Peephole.push_pop, "addi"),
+            "frame_slot": (Peephole.frame_slot, "sw"),
+            "empty_frame": (Peephole.empty_frame, "addi"),
+            "dead_reset": (Peephole.dead_reset, "li"),
+            "load_after_store": (Peephole.load_after_store, "sw"),
+            "self_move": (Peephole.self_move, "move"),
+            "jump_to_next": (Peephole.jump_to_next, "j"),
+        }
+        if rules is None:
+            rules = list(table)
+        for rule in rules:
+            if rule not in table:
+                raise Exception("Unknown peephole rule '{}'.".format(rule))
+        # opcode -> the chosen rules that start at it, in the order they were chosen
+        self.rules = {}
+        for rule in rules:
+            function, opcode = table[rule]
+            self.rules.setdefault(opcode, []).append((rule, function))
+        self.lookahead = lookahead
+        self.report = {rule: 0 for rule in rules}
+
+    # rewrite lines until no rule applies and return the optimized list; self.report accumulates the number of
+    # instructions each rule removed
+    def optimize(self, lines: list) -> list:
+        code = [Peephole.entry(line) for line in lines]
+        rules = self.rules
+        lookahead = self.lookahead
+        changed = True
+        while changed:
+            changed = False
+            optimized = []
+            index = 0
+            while index < len(code):
+                for rule, function in rules.get(code[index][2], ()):
+                    match = function(code, index, lookahead)
+                    if match is not None:
+                        end, replacement = match
+                        self.report[rule] += (end - index) - len(replacement)
+                        optimized += replacement
+                        index = end
+                        changed = True
+                        break
+                else:
+                    optimized.append(code[index])
+                    index += 1
+            code = optimized
+        return [entry[0] for entry in code]
+
+    # split a line into its opcode and operands, ignoring any comment; labels and directives have no opcode
+    @staticmethod
+    def parse(line: str) -> tuple:
+        text = line.split("#", 1)[0].strip()
+        if text == "" or text.endswith(":") or text.startswith(".") or ":" in text:
+            return None, []
+        parts = text.split(None, 1)
+        operands = [operand.strip() for operand in parts[1].split(",")] if len(parts) > 1 else []
+        return parts[0], operands
+
+    # the entry of a line: (line, the label it defines or None, opcode, operands, registers written, registers read).
+    # Generated code repeats the same lines over and over, so entries are cached; rules never change them
+    @staticmethod
+    @functools.lru_cache(maxsize=2 ** 16)
+    def entry(line: str) -> tuple:
+        op, operands = Peephole.parse(line)
+        text = line.split("#", 1)[0].strip()
+        label = text[:-1] if op is None and text.endswith(":") else None
+        writes, reads = Peephole.effects(op, operands) if op is not None else (set(), set())
+        return line, label, op, operands, writes, reads
+
+    # registers written and read by a parsed instruction
+    @staticmethod
+    def effects(op: str, operands: list) -> tuple:
+        if op == "syscall":
+            return {"$v0"}, {"$v0", "$a0"}
+        if op in ("mult", "div") and len(operands) == 2:
+            return {"hi", "lo"}, set(Peephole.register_pattern.findall(" ".join(operands)))
+        if op in ("mflo", "mfhi"):
+            return {operands[0]}, {op[2:]}
+        if op in Peephole.writers and operands:
+            return {operands[0]}, set(Peephole.register_pattern.findall(" ".join(operands[1:])))
+        return set(), set(Peephole.register_pattern.findall(" ".join(operands)))
+
+    # the entry of a move of source into target, or nothing when they are the same register
+    @staticmethod
+    def move(target: str, source: str) -> list:
+        return [] if target == source else [Peephole.entry(f"move {target}, {source}")]
+
+    @staticmethod
+    def push_pop(code: list, index: int, lookahead: int):
+        if index + 1 >= len(code):
+            return None
+        operands = code[index][3]
+        if operands != ["$sp", "$sp", "-4"]:
+            return None
+        _, _, op, operands, _, _ = code[index + 1]
+        if op != "sw" or len(operands) != 2 or operands[1] != "4($sp)":
+            return None
+        pushed = operands[0]
+
+        written = set()
+        read = set()
+        scan = index + 2
+        while scan + 1 < len(code) and scan - index - 2 <= lookahead:
+            _, _, op, operands, writes, reads = code[scan]
+            if op in Peephole.barriers:
+                return None
+            next_op, next_operands = code[scan + 1][2:4]
+            if op == "lw" and operands[1:] == ["4($sp)"] and next_op == "addi" and next_operands == ["$sp", "$sp", "4"]:
+                popped = operands[0]
+                between = code[index + 2:scan]
+                move = Peephole.move(popped, pushed)
+                if pushed not in written:
+                    # the pushed register still holds the value: copy it where the pop was
+                    return scan + 2, between + move
+                if popped not in written and popped not in read:
+                    # the popped register is untouched in between: copy the value into it at the push
+                    return scan + 2, move + between
+                return None
+            if "$sp" in writes or "$sp" in reads:
+                return None
+            written |= writes
+            read |= reads
+            scan += 1
+        return None
+
+    @staticmethod
+    def frame_slot(code: list, index: int, lookahead: int):
+        operands = code[index][3]
+        if len(operands) != 2 or not operands[1].endswith("($sp)"):
+            return None
+        pushed, slot = operands
+
+        written = set()
+        read = set()
+        for scan in range(index + 1, min(len(code), index + 1 + lookahead)):
+            _, _, op, operands, writes, reads = code[scan]
+            if op in Peephole.barriers:
+                return None
+            if op == "lw" and operands[1:] == [slot]:
+                popped = operands[0]
+                between = code[index + 1:scan]
+                move = Peephole.move(popped, pushed)
+                if pushed not in written:
+                    return scan + 1, between + move
+                if popped not in written and popped not in read:
+                    return scan + 1, move + between
+                return None
+            if op == "sw" and operands[1:] == [slot]:
+                return None
+            if "$sp" in writes:
+                return None
+            written |= writes
+            read |= reads
+        return None
+
+    @staticmethod
+    def empty_frame(code: list, index: int, lookahead: int):
+        operands = code[index][3]
+        if len(operands) != 3 or operands[:2] != ["$sp", "$sp"] or not operands[2].startswith("-"):
+            return None
+        release = ["$sp", "$sp", operands[2][1:]]
+        for scan in range(index + 1, len(code)):
+            _, _, op, operands, writes, reads = code[scan]
+            if op != "syscall" and op in Peephole.barriers:
+                return None
+            if "$sp" in writes or "$sp" in reads:
+                if op == "addi" and operands == release:
+                    return scan + 1, code[index + 1:scan]
+                return None
+        return None
+
+    @staticmethod
+    def dead_reset(code: list, index: int, lookahead: int):
+        operands = code[index][3]
+        if len(operands) != 2:
+            return None
+        register = operands[0]
+        for scan in range(index + 1, min(len(code), index + 1 + lookahead)):
+            _, _, op, _, writes, reads = code[scan]
+            if op in Peephole.barriers:
+                return None
+            if register in reads:
+                return None
+            if register in writes:
+                return index + 1, []
+        return None
+
+    @staticmethod
+    def load_after_store(code: list, index: int, lookahead: int):
+        operands = code[index][3]
+        if len(operands) != 2:
+            return None
+        stored, address = operands
+        on_stack = "(" in address
+        for scan in range(index + 1, min(len(code), index + 1 + lookahead)):
+            _, _, op, operands, writes, reads = code[scan]
+            if op in Peephole.barriers:
+                return None
+            if op == "lw" and operands[1:] == [address]:
+                return scan + 1, code[index:scan] + Peephole.move(operands[0], stored)
+            if op == "sw" and (operands[1] == address or (on_stack and "(" in operands[1])):
+                return None
+            if stored in writes or (on_stack and "$sp" in writes):
+                return None
+        return None
+
+    @staticmethod
+    def self_move(code: list, index: int, lookahead: int):
+        operands = code[index][3]
+        if len(operands) == 2 and operands[0] == operands[1]:
+            return index + 1, []
+        return None
+
+    @staticmethod
+    def jump_to_next(code: list, index: int, lookahead: int):
+        operands = code[index][3]
+        if index + 1 < len(code) and code[index + 1][1] == operands[0]:
+            return index + 1, []
+        return None
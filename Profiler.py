@@ -0,0 +1,163 @@
+# Purpose:  Basic-block execution counts for generated assembly, and the tool that maps them back to the source
+# History:
+#           2026-10-18, created; a counter in .data for every label of the generated code, a dump of the counters
+#                       before the exit syscall, and a report of the counts by source construct
+#
+# instrument() works on the final assembly lines of any backend.  Every label in .text (loop_N, true_N,
+# continue_N, ...) starts a basic block; right after the label the block's .data word profile.<label> is
+# incremented through $k0, a register the generated code never uses, so a label counts how often control
+# reaches it, by a branch or by falling through.  For a for loop loop_N counts iterations, for a while loop it
+# counts the tests of the condition and continue_N the exits; true_N and false_N count the two sides of an if.
+# Before the exit syscall the counters are printed, one "@<block> <count>" line each, after whatever the program
+# printed.
+#
+# The N of a label is the branch_index of the AST node whose code it belongs to, and the parser records the source
+# line of every such node, so constructs() and report() can tell which loop or condition a block belongs to.
+#
+# usage:  python Profiler.py program.txt [--registers | --ir] [--promote] [--peephole [RULES]] [--input VALUES]
+#                             [--counts FILE]
+#
+# compiles program.txt with counters, runs it in MIPSSimulator (or reads the output of a run under SPIM or MARS
+# from --counts) and lists the blocks by how often they ran, with the line of the source they come from.
+
+import argparse
+import re
+import sys
+
+
+class Profiler:
+
+    # the prefix of the .data word counting a label
+    prefix = "profile."
+    dump_pattern = re.compile(r"@(\d+) (-?\d+)")
+
+    # lines with a counter after every label in .text and a dump of the counters before the exit; returns the
+    # instrumented lines and the labels in the order of their block numbers
+    @staticmethod
+    def instrument(lines: list, comments: bool = True) -> tuple:
+        labels = []
+        body = []
+        section = None
+        for line in lines:
+            text = line.split("#", 1)[0].strip()
+            if text in (".data", ".text"):
+                section = text
+            body.append(line)
+            if section == ".text" and text.endswith(":") and " " not in text:
+                label = text[:-1]
+                labels.append(label)
+                counter = Profiler.prefix + label
+                body += [f"lw $k0, {counter}" + (" # count the block" if comments else ""),
+                         "addi $k0, $k0, 1",
+                         f"sw $k0, {counter}"]
+
+        dump = []
+        for block, label in enumerate(labels):
+            # @, the block number, a space, the count and a newline
+            dump += ["li $a0, 64" + (f" # print @{block} and the count of {label}" if comments else ""),
+                     "li $v0, 11", "syscall",
+                     f"li $a0, {block}", "li $v0, 1", "syscall",
+                     "li $a0, 32", "li $v0, 11", "syscall",
+                     f"lw $a0, {Profiler.prefix + label}", "li $v0, 1", "syscall",
+                     "li $a0, 10", "li $v0, 11", "syscall"]
+        exit_line = len(body)
+        for index in range(len(body) - 1, -1, -1):
+            if body[index].split("#", 1)[0].strip() == "li $v0, 10":
+                exit_line = index
+                break
+        body[exit_line:exit_line] = dump
+
+        counters = [f"{Profiler.prefix + label}: .word 0" for label in labels]
+        data = next((index for index, line in enumerate(body) if line.split("#", 1)[0].strip() == ".data"), None)
+        if data is None:
+            body[0:0] = [".data"] + counters
+        else:
+            body[data + 1:data + 1] = counters
+        return body, labels
+
+    # the counts of a dump in the output of an instrumented program, by block number
+    @staticmethod
+    def counts(output: str) -> dict:
+        return {int(block): int(count) for block, count in Profiler.dump_pattern.findall(output)}
+
+    # the AST nodes below program that own labels, by branch_index
+    @staticmethod
+    def constructs(program) -> dict:
+        owners = {}
+        work = [program]
+        while work:
+            node = work.pop()
+            if "branch_index" in node.data:
+                owners[node.data["branch_index"]] = node
+            work.extend(node.children)
+        return owners
+
+    # what the code at label does, in terms of the source construct it belongs to, and that construct's line
+    @staticmethod
+    def describe(label: str, owners: dict) -> tuple:
+        kind, _, index = label.rpartition("_")
+        node = owners.get(int(index)) if index.isdigit() else None
+        if node is None:
+            return label, None
+        if node.name == "for":
+            construct = "for " + node.data["var_name"].rsplit("_", 1)[0]
+        elif node.name == "comparison":
+            construct = "comparison " + node.value
+        elif node.name == "ifelse":
+            construct = "if/else"
+        else:
+            construct = node.name
+        return "{} {}".format(construct, kind), node.line
+
+    # the blocks, hottest first, with their counts, labels, constructs and source lines
+    @staticmethod
+    def report(labels: list, counts: dict, owners: dict, source_lines: list) -> str:
+        rows = []
+        for block, label in enumerate(labels):
+            construct, line = Profiler.describe(label, owners)
+            text = source_lines[line - 1].strip() if line is not None and 0 < line <= len(source_lines) else ""
+            rows.append((counts.get(block, 0), block, label, construct, line, text))
+        rows.sort(key=lambda row: (-row[0], row[1]))
+        lines = ["{:>10}  {:<14} {:<22} {:>5}  {}".format("count", "label", "construct", "line", "source")]
+        for count, block, label, construct, line, text in rows:
+            lines.append("{:>10}  {:<14} {:<22} {:>5}  {}".format(count, label, construct,
+                                                                  line if line is not None else "", text))
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    # Compiler imports this module
+    from Compiler import Compiler
+    from MIPSSimulator import MIPSSimulator
+
+    arg_parser = argparse.ArgumentParser(description="Count how often every basic block of a program runs.")
+    arg_parser.add_argument("source", help="program to profile")
+    backend = arg_parser.add_mutually_exclusive_group()
+    backend.add_argument("--registers", action="store_true", help="compile with the registers backend")
+    backend.add_argument("--ir", action="store_true", help="compile with the ir backend")
+    arg_parser.add_argument("--promote", action="store_true", help="keep the busiest variables in $s0-$s7")
+    arg_parser.add_argument("--peephole", nargs="?", const="all", metavar="RULES", help="run the peephole optimizer")
+    arg_parser.add_argument("--input", metavar="VALUES",
+                            help="comma-separated values for readLine() (default: standard input)")
+    arg_parser.add_argument("--counts", metavar="FILE",
+                            help="read the counters from the output of a run under SPIM or MARS instead of simulating")
+    args = arg_parser.parse_args()
+
+    text = open(args.source, "r", encoding="utf8").read()
+    compiler = Compiler("ir" if args.ir else "registers" if args.registers else "stack", promote=args.promote,
+                        peephole=args.peephole if args.peephole in (None, "all") else args.peephole.split(","),
+                        profile=True)
+    try:
+        program = compiler.transform(compiler.parse(text))
+        lines = compiler.optimize(compiler.generate(program))
+    except Exception as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    if args.counts:
+        with open(args.counts, "r", encoding="utf8") as counts:
+            output = counts.read()
+    else:
+        values = args.input.split(",") if args.input is not None else sys.stdin.read().split()
+        output = MIPSSimulator(lines, values).run()
+    print(Profiler.report(compiler.profile_labels, Profiler.counts(output), Profiler.constructs(program),
+                          text.splitlines()))
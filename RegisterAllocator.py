@@ -0,0 +1,288 @@
+# Purpose:  Sethi-Ullman register allocation for expression trees
+# History:
+#           2026-10-18, label() and emit() walk the tree with work lists instead of recursing, so deep expressions no
+#                       longer hit Python's recursion limit; emit() takes work items like ASTNODE.emit_ast
+#           2026-10-18, the variable of the enclosing for loop is read from its counter (Emitter.induction)
+#           2026-10-18, promoted variables are read from their $s register
+#           2026-10-18, emit_branch() compiles a comparison straight into a conditional branch
+#           2026-10-18, with Emitter.strength_reduce, * / % by a constant use StrengthReduction
+#           2026-10-18, ** uses square-and-multiply, or a straight-line chain for a constant exponent; x ** 0 = 1
+#           2026-10-18, code is emitted through Emitter instead of print()
+#           2026-10-18, created; evaluates expressions in $t registers and spills to the stack only when
+#                       the pool runs out, as an alternative to the push/pop stack machine in ASTNODE.emit_ast
+#
+# Sethi-Ullman numbering: a leaf needs one register, a unary node needs what its operand needs, and a binary
+# node needs max(left, right) when the two sides differ, or one more than that when they are equal.  The side
+# that needs more registers is evaluated first so its result only ties up one register while the other side
+# is evaluated.  When neither side fits in the registers that remain, the first result is spilled to the stack.
+
+from Emitter import Emitter
+from StrengthReduction import StrengthReduction
+
+
+class RegisterAllocator:
+
+    # $t6 and $t7 hold the counter and bound of an enclosing for loop, so they are never handed out
+    registers = ["$t0", "$t1", "$t2", "$t3", "$t4", "$t5", "$t8", "$t9"]
+
+    leaves = ("number", "name", "input", "string")
+    unary = ("uminus", "abs")
+    binary = ("binop", "comparison", "min", "max", "exponent")
+    expressions = leaves + unary + binary
+
+    arithmetic = {"+": "add", "-": "sub", "/": "div", "%": "rem"}
+    comparisons = {"==": "seq", "!=": "sne", "<": "slt", "<=": "sle", ">": "sgt", ">=": "sge"}
+    # the branch taken when a comparison holds, and the comparison that holds when it does not
+    branches = {"==": "beq", "!=": "bne", "<": "blt", "<=": "ble", ">": "bgt", ">=": "bge"}
+    opposites = {"==": "!=", "!=": "==", "<": ">=", "<=": ">", ">": "<=", ">=": "<"}
+
+    # compute the Sethi-Ullman number of every node in the tree rooted at _node; impure records the subtrees
+    # that read input, whose evaluation order must not be changed.  The nodes are listed parents first and
+    # numbered in reverse, so no node is numbered before its operands and deep expressions need no recursion
+    @staticmethod
+    def label(_node, need: dict, impure: dict) -> int:
+        order = []
+        work = [_node]
+        while work:
+            node = work.pop()
+            order.append(node)
+            if node.name == "binop" and RegisterAllocator.reduction(node) is not None:
+                work.append(RegisterAllocator.reduction(node)[0])
+            elif node.name in RegisterAllocator.unary or node.name in RegisterAllocator.binary:
+                work.extend(node.children)
+        for node in reversed(order):
+            if node.name in RegisterAllocator.leaves:
+                need[id(node)] = 1
+                impure[id(node)] = node.name == "input"
+            elif node.name in RegisterAllocator.unary:
+                need[id(node)] = need[id(node.children[0])]
+                impure[id(node)] = impure[id(node.children[0])]
+            elif node.name == "binop" and RegisterAllocator.reduction(node) is not None:
+                # the operand that is not constant, next to the scratch registers of the plan
+                operand, plan = RegisterAllocator.reduction(node)
+                need[id(node)] = max(need[id(operand)], 1 + len(StrengthReduction.temporaries(plan)))
+                impure[id(node)] = impure[id(operand)]
+            elif node.name in RegisterAllocator.binary:
+                left, right = node.children
+                left_need = need[id(left)]
+                right_need = need[id(right)]
+                if left_need == right_need:
+                    need[id(node)] = left_need + 1
+                else:
+                    need[id(node)] = max(left_need, right_need)
+                # exponentiation keeps a running product and a bit of the exponent next to its two operands; a
+                # constant exponent only needs a copy of the base
+                if node.name == "exponent":
+                    if RegisterAllocator.constant_exponent(node):
+                        need[id(node)] = max(left_need, 2)
+                    else:
+                        need[id(node)] = max(need[id(node)], 4)
+                impure[id(node)] = impure[id(left)] or impure[id(right)]
+            else:
+                raise Exception("Cannot allocate registers for node '{}'.".format(node.name))
+        return need[id(_node)]
+
+    # evaluate the expression rooted at _node and leave its value in target
+    @staticmethod
+    def emit_expression(_node, target: str) -> None:
+        need = {}
+        impure = {}
+        RegisterAllocator.label(_node, need, impure)
+        regs = [target] + [register for register in RegisterAllocator.registers if register != target]
+        RegisterAllocator.emit([(_node, regs)], need, impure)
+
+    # branch to label when the comparison _node, with operator in place of its own, holds
+    @staticmethod
+    def emit_branch(_node, operator: str, label: str) -> None:
+        need = {}
+        impure = {}
+        RegisterAllocator.label(_node, need, impure)
+        left, right = _node.children
+        if right.name == "number" and isinstance(right.value, int):
+            items = [(left, RegisterAllocator.registers)]
+            right = right.value if right.value else "$zero"
+            left = RegisterAllocator.registers[0]
+        else:
+            items, left, right = RegisterAllocator.operand_items(_node, RegisterAllocator.registers, need, impure)
+        RegisterAllocator.emit(items + [f"{RegisterAllocator.branches[operator]} {left}, {right}, {label}"], need,
+                               impure)
+
+    # emit the work items in items, first to last.  Like ASTNODE.emit_ast, the trees are walked with an explicit
+    # work stack rather than recursion: a string is a line of assembly, and a (node, regs) tuple evaluates node
+    # into regs[0], using only the registers in regs, and is expanded by expand()
+    @staticmethod
+    def emit(items: list, need: dict, impure: dict) -> None:
+        emit = Emitter.emit
+        work = list(reversed(items))
+        while work:
+            item = work.pop()
+            if item.__class__ is str:
+                emit(item)
+            else:
+                items = RegisterAllocator.expand(item[0], item[1], need, impure)
+                items.reverse()
+                work.extend(items)
+
+    # the work items that evaluate _node into regs[0] (see emit)
+    @staticmethod
+    def expand(_node, regs: list, need: dict, impure: dict) -> list:
+        result = regs[0]
+        if _node.name == "number":
+            return [f"li {result}, {_node.value} # load an integer into {result}"]
+        elif _node.name == "string":
+            return [f"li {result}, {_node.value} # store a string into {result}"]
+        elif _node.name == "name":
+            var_name = _node.data["var_name"]
+            emitter = Emitter.current()
+            if var_name in emitter.promoted:
+                register = emitter.promoted[var_name]
+                return [f"move {result}, {register} # {var_name} lives in {register}"]
+            elif var_name in emitter.induction:
+                register = emitter.induction[var_name]
+                return [f"move {result}, {register} # {var_name} is the loop counter"]
+            return [f"lw {result}, {var_name} # load the value of {var_name} into {result}"]
+        elif _node.name == "input":
+            return ["li $v0, 5 # load the integer 5 into v0 to accept a user integer input",
+                    "syscall",
+                    f"move {result}, $v0"]
+        elif _node.name == "uminus":
+            return [(_node.children[0], regs), f"sub {result}, $zero, {result}"]
+        elif _node.name == "abs":
+            return [(_node.children[0], regs), f"abs {result}, {result}"]
+        elif _node.name == "binop" and RegisterAllocator.reduction(_node) is not None:
+            operand, plan = RegisterAllocator.reduction(_node)
+            temporaries = StrengthReduction.temporaries(plan)
+            scratch, borrowed = RegisterAllocator.scratch(regs, 1 + len(temporaries))
+            registers = dict(zip(temporaries, scratch[1:]), x=result, r=result)
+            return [(operand, regs),
+                    *RegisterAllocator.save(borrowed),
+                    *StrengthReduction.lines(plan, registers),
+                    *RegisterAllocator.restore(borrowed)]
+        elif _node.name == "binop":
+            items, left, right = RegisterAllocator.operand_items(_node, regs, need, impure)
+            if _node.value == "*":
+                return items + [f"mult {left}, {right}", f"mflo {result}"]
+            return items + [f"{RegisterAllocator.arithmetic[_node.value]} {result}, {left}, {right}"]
+        elif _node.name == "comparison":
+            items, left, right = RegisterAllocator.operand_items(_node, regs, need, impure)
+            return items + [f"{RegisterAllocator.comparisons[_node.value]} {result}, {left}, {right}"]
+        elif _node.name in ("min", "max"):
+            branch_index = _node.data["branch_index"]
+            items, left, right = RegisterAllocator.operand_items(_node, regs, need, impure)
+            # the result register already holds one operand; replace it with the other one when needed
+            other = right if left == result else left
+            keep = "ble" if _node.name == "min" else "bge"
+            return items + [f"{keep} {result}, {other}, continue_{branch_index}",
+                            f"move {result}, {other}",
+                            f"continue_{branch_index}:"]
+        elif _node.name == "exponent":
+            return RegisterAllocator.exponent_items(_node, regs, need, impure)
+        raise Exception("Cannot allocate registers for node '{}'.".format(_node.name))
+
+    # the work items that evaluate both children of a binary node, and the registers that then hold the left and
+    # right values; neither is guaranteed to be regs[0], but both are within regs[:2]
+    @staticmethod
+    def operand_items(_node, regs: list, need: dict, impure: dict) -> tuple:
+        left, right = _node.children
+        left_first = need[id(right)] < len(regs)
+        right_first = need[id(left)] < len(regs) and not (impure[id(left)] and impure[id(right)])
+        if right_first and (need[id(right)] > need[id(left)] or not left_first):
+            return [(right, regs), (left, regs[1:])], regs[1], regs[0]
+        if left_first:
+            return [(left, regs), (right, regs[1:])], regs[0], regs[1]
+        # neither side fits beside the other: spill the left value while the right side is evaluated
+        return [(left, regs),
+                "addi $sp, $sp, -4",
+                f"sw {regs[0]}, 4($sp) # spill {regs[0]} to the stack",
+                (right, regs),
+                f"lw {regs[1]}, 4($sp) # reload the spilled value into {regs[1]}",
+                "addi $sp, $sp, 4"], regs[1], regs[0]
+
+    # registers beyond regs[:count] to use as scratch, borrowing registers that are not in regs when a spill has
+    # left fewer than count; returns the scratch registers and the borrowed ones, which save() and restore() keep
+    @staticmethod
+    def scratch(regs: list, count: int) -> tuple:
+        borrowed = [register for register in RegisterAllocator.registers if register not in regs]
+        borrowed = borrowed[:max(count - len(regs), 0)]
+        return (regs + borrowed)[:count], borrowed
+
+    @staticmethod
+    def save(borrowed: list) -> list:
+        lines = []
+        for register in borrowed:
+            lines.append("addi $sp, $sp, -4")
+            lines.append(f"sw {register}, 4($sp) # save {register} to use it as a scratch register")
+        return lines
+
+    @staticmethod
+    def restore(borrowed: list) -> list:
+        lines = []
+        for register in reversed(borrowed):
+            lines.append(f"lw {register}, 4($sp) # restore {register}")
+            lines.append("addi $sp, $sp, 4")
+        return lines
+
+    # the squarings and multiplies that turn result == base into base ** exponent for a constant exponent >= 1,
+    # reading the bits of the exponent from the most significant one down (also used by ASTNODE)
+    @staticmethod
+    def power_chain(exponent: int, result: str, base: str) -> list:
+        lines = []
+        for bit in bin(exponent)[3:]:
+            lines.append(f"mult {result}, {result}")
+            lines.append(f"mflo {result}")
+            if bit == "1":
+                lines.append(f"mult {result}, {base}")
+                lines.append(f"mflo {result}")
+        return lines
+
+    # the work items of base ** exponent (see expand)
+    @staticmethod
+    def exponent_items(_node, regs: list, need: dict, impure: dict) -> list:
+        branch_index = _node.data["branch_index"]
+        result = regs[0]
+        if RegisterAllocator.constant_exponent(_node):
+            exponent = _node.children[1].value
+            items = [(_node.children[0], regs)]
+            if exponent <= 0:
+                items.append(f"li {result}, 1 # x ** 0 = 1")
+            elif exponent > 1:
+                scratch, borrowed = RegisterAllocator.scratch(regs, 2)
+                items += [*RegisterAllocator.save(borrowed),
+                          f"move {scratch[1]}, {result}",
+                          *RegisterAllocator.power_chain(exponent, result, scratch[1]),
+                          *RegisterAllocator.restore(borrowed)]
+            return items
+        items, base, exponent = RegisterAllocator.operand_items(_node, regs, need, impure)
+        # square-and-multiply keeps a running product and the current bit next to its two operands; a spill can
+        # leave fewer registers here, so the missing ones are borrowed and restored afterwards
+        scratch, borrowed = RegisterAllocator.scratch(regs, 4)
+        product, bit = scratch[2], scratch[3]
+        return items + [*RegisterAllocator.save(borrowed),
+                        f"li {product}, 1 # res = 1",
+                        f"ble {exponent}, $zero, continue_{branch_index} # x ** 0 = 1",
+                        f"loop_{branch_index}:",
+                        f"andi {bit}, {exponent}, 1",
+                        f"beq {bit}, $zero, square_{branch_index} # multiply only for the exponent's 1 bits",
+                        f"mult {product}, {base} # res * base",
+                        f"mflo {product}",
+                        f"square_{branch_index}:",
+                        f"srl {exponent}, {exponent}, 1",
+                        f"beq {exponent}, $zero, continue_{branch_index}",
+                        f"mult {base}, {base} # base * base",
+                        f"mflo {base}",
+                        f"j loop_{branch_index}",
+                        f"continue_{branch_index}:",
+                        f"move {result}, {product}",
+                        *RegisterAllocator.restore(borrowed)]
+
+    # the StrengthReduction of a binop when the emitter asks for it, or None
+    @staticmethod
+    def reduction(_node):
+        if not Emitter.current().strength_reduce:
+            return None
+        return StrengthReduction.reduce(_node)
+
+    @staticmethod
+    def constant_exponent(_node) -> bool:
+        exponent = _node.children[1]
+        return exponent.name == "number" and isinstance(exponent.value, int)
@@ -0,0 +1,94 @@
+# Purpose:  Statistics of a compile: how long each phase took and how big the program was at each step
+# History:
+#           2026-10-18, created; phase times, the token count, AST nodes by kind before and after the AST passes,
+#                       the symbol table and the emitted instructions by opcode, as text or JSON (main.py --stats)
+#
+# A Compiler whose statistics attribute holds a Statistics records into it while it compiles: time() runs each
+# phase (lex, parse, fold, loops, refold, dead code, promote, codegen or ir and lowering, peephole) and adds up
+# how long it took, parse() lexes the whole source before parsing so the two are timed apart, and the counts are
+# taken as the tree and the assembly go by.  Phases that did not run are left out.
+
+import json
+import time
+
+
+class Statistics:
+
+    def __init__(self) -> None:
+        # phase name -> seconds, in the order the phases first ran
+        self.phases = {}
+        self.source_bytes = 0
+        self.tokens = 0
+        # node kind -> count, for the tree the parser built and for the tree after the AST passes
+        self.parsed_nodes = {}
+        self.nodes = {}
+        # symbol table scope -> number of symbols
+        self.symbols = {}
+        self.instructions = 0
+        # opcode -> count, most frequent first
+        self.opcodes = {}
+
+    # run function(*args) and add the time it took to phase name
+    def time(self, name: str, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+        return result
+
+    # the number of nodes of every kind in the tree at _node, by kind
+    @staticmethod
+    def count_nodes(_node) -> dict:
+        counts = {}
+        work = [_node]
+        while work:
+            node = work.pop()
+            counts[node.name] = counts.get(node.name, 0) + 1
+            work.extend(node.children)
+        return dict(sorted(counts.items()))
+
+    # the number of instructions of every opcode in lines, most frequent first; labels, directives and comments
+    # are not instructions (see Compiler.count_instructions)
+    @staticmethod
+    def count_opcodes(lines: list) -> dict:
+        counts = {}
+        for line in lines:
+            text = line.split("#", 1)[0].strip()
+            if text and not text.startswith(".") and ":" not in text:
+                opcode = text.split(None, 1)[0]
+                counts[opcode] = counts.get(opcode, 0) + 1
+        return dict(sorted(counts.items(), key=lambda item: (-item[1], item[0])))
+
+    def record_symbols(self, symbol_table: dict) -> None:
+        self.symbols = {str(scope): len(symbols) for scope, symbols in symbol_table.items()}
+
+    def record_lines(self, lines: list) -> None:
+        self.opcodes = Statistics.count_opcodes(lines)
+        self.instructions = sum(self.opcodes.values())
+
+    def as_dict(self) -> dict:
+        return {"phases_s": dict(self.phases), "total_s": sum(self.phases.values()),
+                "source_bytes": self.source_bytes, "tokens": self.tokens,
+                "nodes": {"parsed": self.parsed_nodes, "optimized": self.nodes},
+                "symbols": self.symbols, "instructions": self.instructions, "opcodes": self.opcodes}
+
+    def json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2)
+
+    def text(self) -> str:
+        lines = ["phase                  ms"]
+        for name, seconds in self.phases.items():
+            lines.append("  {:<16} {:>9.3f}".format(name, seconds * 1000))
+        lines.append("  {:<16} {:>9.3f}".format("total", sum(self.phases.values()) * 1000))
+        lines.append("source bytes       {:>7}".format(self.source_bytes))
+        lines.append("tokens             {:>7}".format(self.tokens))
+        lines.append("nodes              {:>7} {:>9}".format("parsed", "optimized"))
+        for kind in sorted(set(self.parsed_nodes) | set(self.nodes)):
+            lines.append("  {:<16} {:>7} {:>9}".format(kind, self.parsed_nodes.get(kind, 0), self.nodes.get(kind, 0)))
+        lines.append("  {:<16} {:>7} {:>9}".format("total", sum(self.parsed_nodes.values()), sum(self.nodes.values())))
+        lines.append("symbols            {:>7}".format(sum(self.symbols.values())))
+        for scope, count in self.symbols.items():
+            lines.append("  scope {:<10} {:>7}".format(scope, count))
+        lines.append("instructions       {:>7}".format(self.instructions))
+        for opcode, count in self.opcodes.items():
+            lines.append("  {:<16} {:>7}".format(opcode, count))
+        return "\n".join(lines)
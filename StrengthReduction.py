@@ -0,0 +1,192 @@
+# Purpose:  Cheaper instruction sequences for multiplication, division and remainder by a constant
+# History:
+#           2026-10-18, created; shifts and shift/add chains for multiplication, shift sequences for division by
+#                       powers of two and multiply-by-magic-number sequences for any other divisor
+#
+# A plan is a list of (operation, destination, operand, operand) tuples over symbolic registers: "x" holds the
+# value that is multiplied or divided and is never written, "r" receives the result and is only written by the
+# last operation, so the two may be the same register, and "t1" and "t2" are scratch registers.  Each backend
+# maps the symbolic registers onto its own: ASTNODE and RegisterAllocator through lines(), IRBuilder onto
+# virtual registers.
+#
+#   sll, srl, sra   r, x, k       shift by an immediate
+#   add, sub        r, x, t1
+#   neg, move       r, x
+#   li              r, value
+#   mul, mulhi      r, x, value   low or high word of x * value (r must not be x)
+#
+# Division by a constant d that is not a power of two follows Hacker's Delight (Warren, chapter 10): the high
+# word of x * M, corrected by x when M and d differ in sign, shifted right arithmetically by s, plus one when the
+# result is negative, is x / d truncated toward zero for every 32-bit x.  A remainder is x - (x / d) * d.  The
+# multiply and divide unit needs 12 and 35 cycles; a plan takes one cycle per operation, plus 12 for mulhi.
+
+class StrengthReduction:
+
+    operators = ("*", "/", "%")
+
+    # the operand that is not constant and the plan for the binop _node, or None when it has no cheaper plan
+    @staticmethod
+    def reduce(_node):
+        if _node.name != "binop" or _node.value not in StrengthReduction.operators:
+            return None
+        left, right = _node.children
+        if StrengthReduction.is_constant(right):
+            operand, constant = left, right.value
+        elif _node.value == "*" and StrengthReduction.is_constant(left):
+            operand, constant = right, left.value
+        else:
+            return None
+        plan = StrengthReduction.plan(_node.value, constant)
+        return None if plan is None else (operand, plan)
+
+    @staticmethod
+    def is_constant(_node) -> bool:
+        return _node.name == "number" and isinstance(_node.value, int) and -2 ** 31 <= _node.value < 2 ** 31
+
+    @staticmethod
+    def plan(operator: str, constant: int):
+        if operator == "*":
+            return StrengthReduction.multiply(constant, "x", "r", "t1")
+        if operator == "/":
+            return StrengthReduction.divide(constant, "x", "r", "t1", "t2")
+        if operator == "%":
+            return StrengthReduction.remainder(constant)
+        return None
+
+    # d = a * constant with shifts, adds and subtracts, using t (which may be d), or None when that takes more
+    # than a shift/add pair
+    @staticmethod
+    def multiply(constant: int, a: str, d: str, t: str):
+        if constant == 0:
+            return [("li", d, 0)]
+        if constant == 1:
+            return [("move", d, a)]
+        if constant == -1:
+            return [("neg", d, a)]
+        magnitude = abs(constant)
+        low = (magnitude & -magnitude).bit_length() - 1
+        high = magnitude.bit_length() - 1
+        if magnitude == 1 << high:
+            plan = [("sll", t, a, high)]
+        elif magnitude == (1 << high) + (1 << low):
+            # a * (2^high + 2^low) = (a * 2^(high - low) + a) * 2^low
+            plan = [("sll", t, a, high - low), ("add", t, t, a)]
+            if low:
+                plan.append(("sll", t, t, low))
+        elif magnitude == (1 << (high + 1)) - (1 << low):
+            # a run of ones: a * (2^(high + 1) - 2^low) = (a * 2^(high + 1 - low) - a) * 2^low
+            plan = [("sll", t, a, high + 1 - low), ("sub", t, t, a)]
+            if low:
+                plan.append(("sll", t, t, low))
+        else:
+            return None
+        if constant < 0:
+            plan.append(("neg", d, t))
+        else:
+            plan[-1] = (plan[-1][0], d) + plan[-1][2:]
+        return plan
+
+    # d = a / constant truncated toward zero, using t (which may be d) and t2, or None for a zero divisor
+    @staticmethod
+    def divide(constant: int, a: str, d: str, t: str, t2: str):
+        if constant == 0:
+            return None
+        if constant == 1:
+            return [("move", d, a)]
+        if constant == -1:
+            return [("neg", d, a)]
+        magnitude = abs(constant)
+        if magnitude & (magnitude - 1) == 0:
+            # add 2^k - 1 to a negative dividend so that the arithmetic shift rounds toward zero
+            shift = magnitude.bit_length() - 1
+            if shift == 1:
+                plan = [("srl", t, a, 31)]
+            else:
+                plan = [("sra", t, a, 31), ("srl", t, t, 32 - shift)]
+            plan += [("add", t, a, t), ("sra", t, t, shift)]
+            if constant < 0:
+                plan.append(("neg", d, t))
+            else:
+                plan[-1] = ("sra", d, t, shift)
+            return plan
+        magic, shift = StrengthReduction.magic(constant)
+        plan = [("mulhi", t, a, magic)]
+        if constant > 0 and magic < 0:
+            plan.append(("add", t, t, a))
+        elif constant < 0 and magic > 0:
+            plan.append(("sub", t, t, a))
+        if shift:
+            plan.append(("sra", t, t, shift))
+        plan += [("srl", t2, t, 31), ("add", d, t, t2)]
+        return plan
+
+    # r = x % constant (the sign of x), or None when there is no cheaper plan than rem
+    @staticmethod
+    def remainder(constant: int):
+        if constant == 0 or constant == -2 ** 31:
+            return None
+        if constant in (1, -1):
+            return [("li", "r", 0)]
+        magnitude = abs(constant)
+        product = StrengthReduction.multiply(magnitude, "t1", "t2", "t2") or [("mul", "t2", "t1", magnitude)]
+        return StrengthReduction.divide(magnitude, "x", "t1", "t1", "t2") + product + [("sub", "r", "x", "t2")]
+
+    # the magic multiplier and shift for signed division by d, 2 <= |d| < 2^31 (Hacker's Delight, figure 10-1)
+    @staticmethod
+    def magic(d: int) -> tuple:
+        two31 = 2 ** 31
+        ad = abs(d)
+        t = two31 + (1 if d < 0 else 0)
+        anc = t - 1 - t % ad
+        p = 31
+        q1, r1 = divmod(two31, anc)
+        q2, r2 = divmod(two31, ad)
+        while True:
+            p += 1
+            q1, r1 = 2 * q1, 2 * r1
+            if r1 >= anc:
+                q1, r1 = q1 + 1, r1 - anc
+            q2, r2 = 2 * q2, 2 * r2
+            if r2 >= ad:
+                q2, r2 = q2 + 1, r2 - ad
+            delta = ad - r2
+            if not (q1 < delta or (q1 == delta and r1 == 0)):
+                break
+        magic = (q2 + 1) % 2 ** 32
+        if d < 0:
+            magic = 2 ** 32 - magic
+        if magic >= two31:
+            magic -= 2 ** 32
+        return magic, p - 32
+
+    # symbolic scratch registers the plan uses, in order of first use
+    @staticmethod
+    def temporaries(plan: list) -> list:
+        names = []
+        for operation in plan:
+            for operand in operation[1:]:
+                if operand in ("t1", "t2") and operand not in names:
+                    names.append(operand)
+        return names
+
+    # the plan as MIPS assembly, with registers mapping the symbolic registers onto real ones
+    @staticmethod
+    def lines(plan: list, registers: dict) -> list:
+        lines = []
+        for operation in plan:
+            op, d = operation[0], registers[operation[1]]
+            if op in ("sll", "srl", "sra"):
+                lines.append(f"{op} {d}, {registers[operation[2]]}, {operation[3]}")
+            elif op in ("add", "sub"):
+                lines.append(f"{op} {d}, {registers[operation[2]]}, {registers[operation[3]]}")
+            elif op == "neg":
+                lines.append(f"sub {d}, $zero, {registers[operation[2]]}")
+            elif op == "move":
+                lines.append(f"move {d}, {registers[operation[2]]}")
+            elif op == "li":
+                lines.append(f"li {d}, {operation[2]}")
+            else:
+                lines.append(f"li {d}, {operation[3]} # {'magic number' if op == 'mulhi' else 'multiplier'}")
+                lines.append(f"mult {registers[operation[2]]}, {d}")
+                lines.append(f"{'mfhi' if op == 'mulhi' else 'mflo'} {d}")
+        return lines
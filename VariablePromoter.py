@@ -0,0 +1,114 @@
+# Purpose:  Choose the variables that live in the saved registers $s0-$s7 instead of .data words
+# History:
+#           2026-10-18, each register keeps its live ranges sorted, so a variable is placed with a binary search
+#                       instead of a comparison against every variable already in the register
+#           2026-10-18, created; variables weighted by how often they are read and written, loops counting eight
+#                       times per level, and packed into the registers by their live ranges
+#
+# The live range of a variable is the span of top-level statements from the first to the last one that mentions
+# it; a loop is a single top-level statement, so a variable used inside a loop is live for the whole loop.
+# Variables are taken by decreasing weight (loop induction variables and accumulators first) and each gets the
+# first register none of whose variables is live at the same time.  A register is cleared at the start of the
+# program unless its first variable starts by assigning it, so that variable reads 0 before it is assigned just
+# as a .data word does; a later variable only shares a register when its first statement assigns it, so it never
+# reads the value its predecessor left behind.  Variables that find no register stay in memory.
+
+import bisect
+
+
+class VariablePromoter:
+
+    registers = ["$s0", "$s1", "$s2", "$s3", "$s4", "$s5", "$s6", "$s7"]
+
+    # the weight of one read or write nested inside depth loops
+    loop_weight = 8
+
+    # map the variables of program that are kept in registers to their register
+    @staticmethod
+    def plan(program) -> dict:
+        statements = VariablePromoter.top_level(program)
+        weights = {}
+        ranges = {}
+        order = []
+        for index, statement in enumerate(statements):
+            work = [(statement, 0)]
+            while work:
+                node, depth = work.pop()
+                if node.name == "for" or node.name == "while":
+                    depth += 1
+                if node.name in ("name", "assign", "for"):
+                    var_name = node.data["var_name"]
+                    if var_name not in ranges:
+                        order.append(var_name)
+                        ranges[var_name] = [index, index]
+                    ranges[var_name][1] = index
+                    weights[var_name] = weights.get(var_name, 0) + VariablePromoter.loop_weight ** depth
+                work.extend((child, depth) for child in node.children)
+
+        # the (first, last, assigned first) of the variables already given each register, sorted by first; they
+        # never overlap and all but the first start by assigning the register, so a new variable only has to fit
+        # between its two neighbours
+        occupants = {register: [] for register in VariablePromoter.registers}
+        promoted = {}
+        for var_name in sorted(order, key=lambda name: -weights[name]):
+            first, last = ranges[var_name]
+            assigned = VariablePromoter.assigned_first(statements[first], var_name)
+            for register in VariablePromoter.registers:
+                intervals = occupants[register]
+                index = bisect.bisect_left(intervals, (first,))
+                # whichever of two variables sharing a register comes later must start by assigning it
+                if index > 0 and not (intervals[index - 1][1] < first and assigned):
+                    continue
+                if index < len(intervals) and not (last < intervals[index][0] and intervals[index][2]):
+                    continue
+                intervals.insert(index, (first, last, assigned))
+                promoted[var_name] = register
+                break
+        return promoted
+
+    # the registers of promoted that must be cleared at the start of program: those whose first variable may be
+    # read before it is assigned
+    @staticmethod
+    def cleared(program, promoted: dict) -> list:
+        statements = VariablePromoter.top_level(program)
+        first = {}
+        for index, statement in enumerate(statements):
+            work = [statement]
+            while work:
+                node = work.pop()
+                if node.name in ("name", "assign", "for") and node.data["var_name"] in promoted:
+                    first.setdefault(node.data["var_name"], index)
+                work.extend(node.children)
+        registers = {}
+        for var_name, index in sorted(first.items(), key=lambda item: item[1]):
+            registers.setdefault(promoted[var_name], (var_name, index))
+        return sorted(register for register, (var_name, index) in registers.items()
+                      if not VariablePromoter.assigned_first(statements[index], var_name))
+
+    # the top-level statements of program, in order
+    @staticmethod
+    def top_level(program) -> list:
+        statements = []
+        work = [program]
+        while work:
+            node = work.pop()
+            if node.name in ("program", "statement_list"):
+                work.extend(reversed(node.children))
+            else:
+                statements.append(node)
+        return statements
+
+    # True when statement unconditionally assigns var_name from an expression that does not read it
+    @staticmethod
+    def assigned_first(statement, var_name: str) -> bool:
+        if statement.name == "statement" and len(statement.children) == 1:
+            statement = statement.children[0]
+        if statement.name != "assign" or statement.data["var_name"] != var_name:
+            return False
+        work = [statement.children[0]]
+        while work:
+            node = work.pop()
+            if node.name == "name" and node.data["var_name"] == var_name:
+                return False
+            work.extend(node.children)
+        return True
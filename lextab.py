@@ -0,0 +1,10 @@
+# lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('ABS', 'DOUBLE_EQ', 'DQ_STRING', 'ELLIPSIS', 'ELSE', 'FOR', 'GREATER_EQ', 'IF', 'IN', 'LESS_EQ', 'LET', 'MAX', 'MIN', 'NAME', 'NOT_EQ', 'NUMBER', 'POWER', 'PRINT', 'READLINE', 'SQ_STRING', 'VAR', 'WHILE'))
+_lexreflags   = 64
+_lexliterals  = '();{}+-/%*="<>!,'
+_lexstateinfo = {'INITIAL': 'inclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_SQ_STRING>\'[^\'\\\\]*(?:\\\\.[^\'\\\\]*)*\')|(?P<t_DQ_STRING>"[^"\\\\]*(?:\\\\.[^"\\\\]*)*")|(?P<t_ELLIPSIS>\\.\\.\\.)|(?P<t_POWER>\\*\\*)|(?P<t_NUMBER>[0-9]*\\.?[0-9]+([eE][-+]?[0-9]+)?)|(?P<t_DOUBLE_EQ>==)|(?P<t_NOT_EQ>!=)|(?P<t_LESS_EQ><=)|(?P<t_GREATER_EQ>>=)|(?P<t_PRINT>print)|(?P<t_NAME>[a-zA-Z_][a-zA-Z0-9_]*)|(?P<t_newline>\\n+)', [None, ('t_SQ_STRING', 'SQ_STRING'), ('t_DQ_STRING', 'DQ_STRING'), ('t_ELLIPSIS', 'ELLIPSIS'), ('t_POWER', 'POWER'), ('t_NUMBER', 'NUMBER'), None, ('t_DOUBLE_EQ', 'DOUBLE_EQ'), ('t_NOT_EQ', 'NOT_EQ'), ('t_LESS_EQ', 'LESS_EQ'), ('t_GREATER_EQ', 'GREATER_EQ'), ('t_PRINT', 'PRINT'), ('t_NAME', 'NAME'), ('t_newline', 'newline')])]}
+_lexstateignore = {'INITIAL': ' \t\x0b\x0c'}
+_lexstateerrorf = {'INITIAL': 't_error'}
+_lexstateeoff = {}
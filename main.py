@@ -7,358 +7,185 @@ A simple demonstration of what an Abstract Syntax Tree can look like
 -----------------------------------------------------------------------------
 
 History:
+           2026-10-18, --no-static-frames moves $sp for every push and pop instead of once per statement
+           2026-10-18, --profile counts the runs of every labelled block and prints the counts at exit (Profiler.py
+                       maps them to source lines)
+           2026-10-18, --stats reports phase times, tokens, AST nodes, symbols and opcodes as text or JSON
+           2026-10-18, --fast-lexer lexes with the hand-written Lexer instead of PLY's lexer
+           2026-10-18, faster start: CompileCache, Interpreter and MIPSSimulator are only imported when used, and
+                       the parser no longer runs in debug mode with the root logger
+           2026-10-18, dead code elimination (--no-dead-code-elimination to skip it)
+           2026-10-18, loop optimizations (--no-loop-optimization to skip them, --loop-report to list them)
+           2026-10-18, --promote keeps the most used variables in $s0-$s7
+           2026-10-18, --no-strength-reduction keeps mult and div for constant operands
+           2026-10-18, --output writes the assembly to a file in one piece; --strip-comments leaves comments out
+           2026-10-18, --stream writes the code of each top-level statement as soon as it has been parsed
+           2026-10-18, --cache keeps compiled programs in a CompileCache directory
+           2026-10-18, the lexer, grammar and code generation moved into the reentrant Compiler class; this file
+                       is now only the command line
+           2026-10-18, parse() and generate() let other tools (Benchmark.py) compile several programs in one process
+           2026-10-18, --run executes the program with the Interpreter instead of compiling it
+           2026-10-18, --simulate runs the generated code in MIPSSimulator and reports its dynamic counters
+           2026-10-18, constant folding moved out of p_EXPRESSION_BINOP into the ConstantFolder pass (--no-fold
+                       to skip it); min, max, abs and comparisons are typed as int
+           2026-10-18, --peephole runs the Peephole optimizer over the generated assembly
+           2026-10-18, --ir compiles through the three-address IR and MIPSLowering instead of emit_ast
+           2026-10-18, command line options; --registers selects Sethi-Ullman register allocation for expressions
            2024-02-14, DMW, extending ast_demo.py to be a print number language compiler
            2024-02-12, DMW, created
 """
 
-import ply.lex as lex
-import ply.yacc as yacc
-from ASTNODE import ASTNODE
-import logging
+from Compiler import Compiler
+from Emitter import Emitter
+from IR import IRBuilder
+from Statistics import Statistics
+import argparse
+import sys
 
-symbol_table = {
-   0: {}
-}
-reserved = {
-    'print': 'PRINT',
-    'readLine': 'READLINE',
-    'abs': 'ABS',
-    'min': 'MIN',
-    'max': 'MAX',
-    'for': 'FOR',
-    'while': 'WHILE',
-    'let': 'LET',
-    'var': 'VAR',
-    'if': "IF",
-    'else': "ELSE",
-    'in': "IN",
-      }
-
-tokens = [
-   'NUMBER',
-   'SQ_STRING',
-   'DQ_STRING',
-   'DOUBLE_EQ',
-   'NAME',
-   'NOT_EQ',
-   'LESS_EQ',
-   'GREATER_EQ',
-   'ELLIPSIS',
-   'POWER'
-   ]
-tokens += list(reserved.values())
-
-literals = ['(', ')', ';', '{', '}', '+', '-', '/', '%', '*', "=", '"', '<', '>', '!', ',']
-
-def str_to_num(s):
-   ans = 0
-   try:
-       ans = int(s)
-   except ValueError:
-       ans = float(s)
-
-   return ans
-
-def t_SQ_STRING(t):
-    r"'[^'\\]*(?:\\.[^'\\]*)*'"
-    return t
-
-def t_DQ_STRING(t):
-    r'"[^"\\]*(?:\\.[^"\\]*)*"'
-    return t
-
-def t_ELLIPSIS(t):
-   "\.\.\."
-   return t
-
-def t_POWER(t):
-   "\*\*"
-   return t
-
-def t_NUMBER(t):
-   # https://www.regular-expressions.info/floatingpoint.html
-   r'[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?'
-   t.value = str_to_num(t.value) # int(t.value)
-   return t
-
-def t_DOUBLE_EQ(t):
-    r'=='
-    return t
-
-def t_NOT_EQ(t):
-    r'!='
-    return t
-
-def t_LESS_EQ(t):
-    r'<='
-    return t
-
-def t_GREATER_EQ(t):
-    r'>='
-    return t
-
-def t_PRINT(t):
-   'print'
-   return t
-
-def t_NAME(t):
-    r'[a-zA-Z_][a-zA-Z0-9_]*'
-    t.type = reserved.get(t.value, 'NAME')    # Check for reserved words
-    return t
-
-t_ignore = " \t\v\f"
-
-def t_newline(t):
-   r'\n+'
-   t.lexer.lineno += t.value.count("\n")
-
-def t_error(t):
-   print("Illegal character '%s'" % t.value[0])
-   t.lexer.skip(1)
-
-precedence = (
-    # ('nonassoc', '?', ':'), # 'EQUALS', 'LESSTHAN', 'GREATERTHAN', 'LTEQ', 'GTEQ',
-    ('left', '+', '-'),
-    ('left', 'ELLIPSIS'),
-    ('left', '*', '/'),  # '%', 'INTDIV'),
-    ("nonassoc", 'IF'),
-    ('right', 'UMINUS')
-)
-
-# Build the lexer
-lexer = lex.lex()
-
-# ----------------------------------------- 2024-02-14, DMW, PARSER
-
-program = None
-
-branch_index = 0
-
-def p_PROGRAM(p):
-   "program : statement_list"
-   global program
-   program = ASTNODE("program", children=[p[1]])
-
-def p_STATEMENT_LIST2(p):
-   "statement_list : statement_list statement"  # 2024-02-14, DMW, changed the print grammar to the following
-   p[0] = ASTNODE("statement_list", children=[p[1], p[2]])
-
-def p_STATEMENT_LIST(p):
-   "statement_list : statement"  # 2024-02-14, DMW, changed the print grammar to the following
-   p[0] = p[1]
-
-def p_FOR(p):
-   "for : FOR for_assign IN expression statement_block"
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("for", children=[p[4], p[5]], data={"var_name":p[2].data["var_name"], "branch_index":branch_index})
-
-def p_WHILE(p):
-   "for : WHILE expression statement_block"
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("while", children=[p[2], p[3]], data={"branch_index":branch_index})
-
-def p_STATEMENT_ASSIGN(p):
-   "statement : assign"  # 2024-02-14, DMW, changed the print grammar to the following
-   p[0] = ASTNODE("statement", children=[p[1]])
-
-def p_LET_ASSIGN(p):
-   "assign : LET NAME '=' expression"
-   global branch_index
-   branch_index+=1
-   symbol_table[0][p[2]] = {"var_name": f"{p[2]}_{branch_index}", "type":p[4].data["type"]}
-   p[0] = ASTNODE("assign", children=[p[4]], data={"var_name":f"{p[2]}_{branch_index}", "type":p[4].data["type"]})
-
-def p_VAR_ASSIGN(p):
-   "assign : VAR NAME '=' expression"
-   global branch_index
-   branch_index+=1
-   symbol_table[0][p[2]] = {"var_name": f"{p[2]}_{branch_index}", "type":p[4].data["type"]}
-   p[0] = ASTNODE("assign", children=[p[4]], data={"var_name":f"{p[2]}_{branch_index}", "type":p[4].data["type"]})
-
-def p_REASSIGN(p):
-   "assign : NAME '=' expression"
-   var_name = symbol_table[0][p[1]]["var_name"]
-   p[0] = ASTNODE("assign", children=[p[3]], data={"var_name":var_name})
-
-def p_STATEMENT_BLOCK(p):
-    "statement_block : '{' statement_list '}'"
-    p[0] = ASTNODE("statement_block", children=[p[2]])
-
-def p_FOR_ASSIGN(p):
-   "for_assign : NAME"
-   global branch_index
-   branch_index+=1
-   symbol_table[0][p[1]] = {"var_name": f"{p[1]}_{branch_index}", "type": "int"}
-   p[0] = ASTNODE("for_assign", data={"var_name":symbol_table[0][p[1]]["var_name"]})
-
-def p_STATEMENT_BLOCK2(p):
-    "statement_block : statement"
-    p[0] = p[1]
-
-def p_STATEMENT_PRINT(p):
-   "statement : print"  # 2024-02-14, DMW, changed the print grammar to the following
-   p[0] = ASTNODE("statement", children=[p[1]])
-
-def p_STATEMENT_COMPARISON(p):
-   "statement : expression"  # 2024-02-14, DMW, changed the print grammar to the following
-   p[0] = ASTNODE("statement", children=[p[1]])
-
-def p_STATEMENT_FOR(p):
-    "statement : for"
-    p[0] = p[1]
-
-def p_PRINT_STATEMENT(p):
-   """print : PRINT '(' print_expression_list ')' """
-   p[0] = ASTNODE("print_list", children=[p[3]])
-
-def p_PRINT_STATEMENT2(p):
-   """print : PRINT '(' expression ')' """
-   p[0] = ASTNODE("print", children=[p[3]])
-
-def p_EXPRESSION_INPUT(p):
-   "expression : READLINE '(' ')'"  # 2024-02-14, DMW, changed the print grammar to the following
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("input", data={"type":"int"})
-
-def p_EXPRESSION_MIN(p):
-   "expression : MIN '(' expression ',' expression ')'"  # 2024-02-14, DMW, changed the print grammar to the following
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("min", children=[p[3], p[5]], data={"branch_index": branch_index})
-
-def p_EXPRESSION_MAX(p):
-   "expression : MAX '(' expression ',' expression ')'"  # 2024-02-14, DMW, changed the print grammar to the following
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("max", children=[p[3], p[5]], data={"branch_index": branch_index})
-
-def p_EXPRESSION_ABS(p):
-   "expression : ABS '(' expression ')'"  # 2024-02-14, DMW, changed the print grammar to the following
-   p[0] = ASTNODE("abs", children=[p[3]], data={"branch_index": branch_index})
-
-def p_EXPRESSION_POWER(p):
-   "expression : expression POWER expression"
-   global branch_index
-   branch_index+=1
-   if p[1].data["type"] != "int" or p[3].data["type"] != "int":
-      raise Exception("Invalid types for binary operation.") 
-   p[0] = ASTNODE("exponent", data={"type":"int", "branch_index": branch_index}, children=[p[1], p[3]])
-
-def p_EXPRESSION_UMINUS(p):
-   """expression : '-' expression %prec UMINUS"""
-   if p[2].data["type"] != "int":
-      raise Exception("Invalid type for unary minus operation.")
-   p[0] = ASTNODE("uminus", children=[p[2]], data={"type": "int"})
-
-def p_EXPRESSION_BINOP(p):
-   '''expression : expression '+' expression
-                  | expression '-' expression
-                  | expression '*' expression
-                  | expression '/' expression
-                  | expression '%' expression'''
-   if p[1].data["type"] != "int" or p[3].data["type"] != "int":
-      raise Exception("Invalid types for binary operations.")
-   if not p[1].children and not p[3].children:
-      p[0] = ASTNODE("number", value=p[1].value + p[3].value, data={"type": "int"})
+if __name__ == "__main__":
+   arg_parser = argparse.ArgumentParser(description="Compile a program to MIPS assembly on standard output.")
+   arg_parser.add_argument("source", nargs="?", default="program.txt", help="program to compile (default: program.txt)")
+   backend = arg_parser.add_mutually_exclusive_group()
+   backend.add_argument("--registers", action="store_true",
+                        help="evaluate expressions in registers instead of pushing every value on the stack")
+   backend.add_argument("--ir", action="store_true",
+                        help="generate code through the three-address intermediate representation")
+   arg_parser.add_argument("--dump-ir", action="store_true", help="print the IR instead of assembly (implies --ir)")
+   arg_parser.add_argument("--fast-lexer", action="store_true",
+                           help="lex with the hand-written single-pass lexer instead of PLY's (same tokens, faster)")
+   arg_parser.add_argument("--no-fold", action="store_true", help="do not fold constant expressions")
+   arg_parser.add_argument("--no-strength-reduction", action="store_true",
+                           help="multiply and divide by constants with mult and div instead of shifts and magic numbers")
+   arg_parser.add_argument("--no-static-frames", action="store_true",
+                           help="move $sp for every value pushed or popped instead of reserving one stack frame per"
+                                " statement")
+   arg_parser.add_argument("--no-loop-optimization", action="store_true",
+                           help="do not unroll short constant for loops or hoist invariant expressions out of loops")
+   arg_parser.add_argument("--no-dead-code-elimination", action="store_true",
+                           help="keep constant branches, unused expression statements and assignments nothing reads")
+   arg_parser.add_argument("--loop-report", action="store_true",
+                           help="print the loops that were unrolled and the expressions hoisted to standard error")
+   arg_parser.add_argument("--promote", action="store_true",
+                           help="keep the most used variables in the saved registers $s0-$s7 instead of memory")
+   arg_parser.add_argument("--peephole", nargs="?", const="all", metavar="RULES",
+                           help="run the peephole optimizer; optionally a comma-separated list of rules")
+   arg_parser.add_argument("--peephole-report", action="store_true",
+                           help="print the instructions removed by each peephole rule to standard error")
+   arg_parser.add_argument("--simulate", action="store_true",
+                           help="run the generated code in the built-in simulator instead of printing it")
+   arg_parser.add_argument("--cache", metavar="DIR",
+                           help="reuse the output of identical earlier compiles stored in DIR")
+   arg_parser.add_argument("--cache-size", type=int, default=64, metavar="MB",
+                           help="evict the least recently used cache entries beyond this size (default 64)")
+   arg_parser.add_argument("--cache-stats", action="store_true",
+                           help="print the cache's cumulative hit and miss counts to standard error")
+   arg_parser.add_argument("--run", action="store_true", help="interpret the program directly instead of compiling it")
+   arg_parser.add_argument("--input", metavar="VALUES",
+                           help="comma-separated values for readLine() with --simulate or --run (default: standard input)")
+   arg_parser.add_argument("-o", "--output", metavar="FILE", help="write the assembly to FILE instead of standard output")
+   arg_parser.add_argument("--strip-comments", action="store_true",
+                           help="leave the explanatory comments out of the generated assembly")
+   arg_parser.add_argument("--stream", action="store_true",
+                           help="write the code of each top-level statement as soon as it is parsed, with .data at the"
+                                " end, so memory does not grow with the length of the program")
+   arg_parser.add_argument("--profile", action="store_true",
+                           help="count how often every labelled block runs and print the counts when the program"
+                                " exits, one '@<block> <count>' line each (see Profiler.py)")
+   arg_parser.add_argument("--stats", action="store_true",
+                           help="report the time of every phase, the token, node and symbol counts and the emitted"
+                                " instructions by opcode to standard error")
+   arg_parser.add_argument("--stats-json", action="store_true", help="the --stats report as JSON (implies --stats)")
+   arg_parser.add_argument("--stats-file", metavar="FILE",
+                           help="write the --stats report to FILE instead of standard error (implies --stats)")
+   args = arg_parser.parse_args()
+   if args.stream and (args.ir or args.dump_ir or args.run or args.simulate or args.cache or args.promote or
+                       args.profile):
+      arg_parser.error("--stream cannot be combined with --ir, --dump-ir, --run, --simulate, --cache, --promote or"
+                       " --profile")
+   args.stats = args.stats or args.stats_json or args.stats_file is not None
+   if args.stats and (args.stream or args.cache or args.run or args.dump_ir):
+      arg_parser.error("--stats cannot be combined with --stream, --cache, --run or --dump-ir")
+
+   peephole = args.peephole if args.peephole in (None, "all") else args.peephole.split(",")
+   compiler = Compiler("ir" if args.ir else "registers" if args.registers else "stack", fold=not args.no_fold,
+                       peephole=peephole, strip_comments=args.strip_comments,
+                       strength_reduce=not args.no_strength_reduction, promote=args.promote,
+                       optimize_loops=not args.no_loop_optimization,
+                       eliminate_dead_code=not args.no_dead_code_elimination, fast_lexer=args.fast_lexer,
+                       profile=args.profile, static_frames=not args.no_static_frames)
+   if args.stats:
+      compiler.statistics = Statistics()
+
+   source = open(args.source, 'r', encoding="utf8")
+   if args.stream:
+      try:
+         if args.output:
+            with open(args.output, "w", encoding="utf8") as output:
+               compiler.compile_stream(source, output)
+         else:
+            compiler.compile_stream(source, sys.stdout)
+      except Exception as error:
+         print(error, file=sys.stderr)
+         sys.exit(1)
+      if args.loop_report:
+         for line in compiler.loop_report:
+            print(f"# loops {line}", file=sys.stderr)
+      if args.peephole_report:
+         for rule, removed in compiler.peephole_report.items():
+            print(f"# peephole {rule}: {removed} instructions removed", file=sys.stderr)
+      sys.exit(0)
+   source = source.read()
+   if args.cache and not args.run and not args.dump_ir:
+      from CompileCache import CompileCache
+      cache = CompileCache(args.cache, args.cache_size * 2 ** 20)
+      try:
+         lines = cache.compile(compiler, source).splitlines()
+      except Exception as error:
+         print(error, file=sys.stderr)
+         sys.exit(1)
+      if args.loop_report:
+         # a cache hit skips the passes, so there is nothing to report
+         for line in compiler.loop_report:
+            print(f"# loops {line}", file=sys.stderr)
+      totals = cache.save_stats()
+      if args.cache_stats:
+         print(CompileCache.report(totals), file=sys.stderr)
    else:
-      p[0] = ASTNODE("binop", value=p[2], children=[p[1], p[3]], data={"type": "int"})
-
-def p_EXPRESSION_RANGE(p):
-   "expression : expression ELLIPSIS expression"
-   if p[1].data["type"] != "int" or p[3].data["type"] != "int":
-      raise Exception("Invalid types for range operation.")
-   p[0] = ASTNODE("range", value=p[2], children=[p[1], p[3]])
-
-def p_EXPRESSION_NUM(p):
-   "expression : NUMBER"
-   try:
-      int(p[1])
-   except Exception as e:
-      raise Exception
-      
-   p[0] = ASTNODE("number", value=p[1], data={"type": "int"})
-
-def p_EXPRESSION_NAME(p):
-   "expression : NAME"
-   p[0] = ASTNODE("name", data={"var_name":symbol_table[0][p[1]]["var_name"], "type": symbol_table[0][p[1]]["type"]})
-
-def remove_quotes(s):
-    return s[1:-1]
-
-def p_EXPRESSION_DQ_STRING(p):
-   "expression : DQ_STRING"
-   p[0] = ASTNODE("string", value=remove_quotes(p[1]), data={"type": "string"})
-
-def p_EXPRESSION_SQ_STRING(p):
-   "expression : SQ_STRING"
-   p[0] = ASTNODE("string", value=remove_quotes(p[1]), data={"type": "string"})
-
-def p_EXPRESSION_GROUP(p):
-   "expression : '(' expression ')'"
-   p[0] = p[2]
-
-def p_EXPRESSION_COMPARE(p):
-   """expression : expression DOUBLE_EQ expression 
-                 | expression NOT_EQ expression
-                 | expression '>' expression
-                 | expression '<' expression
-                 | expression LESS_EQ expression
-                 | expression GREATER_EQ expression
-                   """
-   global branch_index
-   branch_index+=1
-   if p[1].data["type"] != p[3].data["type"]:
-      raise Exception("Incompatible types for comparison operation.")
-   p[0] = ASTNODE("comparison", value=p[2], children=[p[1], p[3]], data={"branch_index": branch_index})
-
-def p_IF_CONDITIONAL(p):
-   """statement : IF  expression '{' statement_block '}'"""
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("if", children=[p[2], p[4]], data={"branch_index": branch_index})
-
-def p_IF_ELSE_CONDITIONAL(p):
-   """statement : IF expression '{' statement '}' ELSE '{' statement_block '}'"""
-   global branch_index
-   branch_index+=1
-   p[0] = ASTNODE("ifelse", children=[p[2], p[4], p[8]], data={"branch_index": branch_index})
-
-def p_EMPTY_PRINT_LIST(p):
-   """print_expression_list : """
-   p[0] = ASTNODE("empty_list")
-
-def p_PRINT_EXPRESSION_LIST(p):
-   """print_expression_list : print_expression_list print_expression"""
-   p[0] = ASTNODE("print_list", children=[p[1], p[2]])
-
-def p_PRINT_EXPRESSION_LIST2(p):
-   """print_expression_list : print_expression"""
-   p[0] = p[1]
-
-def p_PRINT_EXPRESSION(p):
-   """print_expression : expression ',' """
-   p[0] = ASTNODE("print", children=[p[1]])
-
-def p_error(p):
-   if p:
-       print("Syntax error at '%s'" % p.value)
+      try:
+         program = compiler.parse(source)
+      except Exception as error:
+         print(error, file=sys.stderr)
+         sys.exit(1)
+      program = compiler.transform(program)
+      if args.loop_report:
+         for line in compiler.loop_report:
+            print(f"# loops {line}", file=sys.stderr)
+      if args.run:
+         from Interpreter import Interpreter
+         Interpreter(program, args.input.split(",") if args.input is not None else None).run()
+         sys.exit(0)
+      if args.dump_ir:
+         print(IRBuilder.build(program, compiler.strength_reduce))
+         sys.exit(0)
+      lines = compiler.optimize(compiler.generate(program))
+
+   if args.peephole_report:
+      for rule, removed in compiler.peephole_report.items():
+         print(f"# peephole {rule}: {removed} instructions removed", file=sys.stderr)
+
+   if args.simulate:
+      values = args.input.split(",") if args.input is not None else sys.stdin.read().split()
+      from MIPSSimulator import MIPSSimulator
+      simulator = MIPSSimulator(lines, values)
+      sys.stdout.write(simulator.run())
+      print(simulator.report(), file=sys.stderr)
    else:
-       print("Syntax error at EOF")
-
-
-parser = yacc.yacc()
-log = logging.getLogger()
-
-if __name__ == "__main__":
-   program = open('program.txt', 'r', encoding="utf8")
-   program = program.read()
-   yacc.parse(program, debug=log)
-   ASTNODE.initialize_variables(symbol_table)
-   print(".text")
-   ASTNODE.emit_ast(program)
-   print("li $v0, 10")
-   print("syscall")
-
+      Emitter.write_lines(lines, args.output if args.output else sys.stdout)
+
+   if args.stats:
+      report = compiler.statistics.json() if args.stats_json else compiler.statistics.text()
+      if args.stats_file:
+         with open(args.stats_file, "w", encoding="utf8") as stats_file:
+            stats_file.write(report + "\n")
+      else:
+         print(report, file=sys.stderr)